@@ -1,4 +1,4 @@
-from fastapi import APIRouter, HTTPException, Depends
+from fastapi import APIRouter, HTTPException, Depends, Query
 from sqlalchemy.exc import SQLAlchemyError
 from typing import List, Optional
 
@@ -42,18 +42,24 @@ async def list_medicines(
 # 🔎 Search Medicines
 @router.get("/search", response_model=List[MedicineDataReadModel])
 async def search_medicines(
+    q: Optional[str] = Query(None, description="Search words, prefix-matched and ranked (e.g. 'para 500')"),
     name: Optional[str] = None,
     generic_name: Optional[str] = None,
     category: Optional[str] = None,
     manufacturer: Optional[str] = None,
+    skip: int = 0,
+    limit: int = Query(20, le=100),
     manager: MedicineManager = Depends(get_medicine_manager),
 ):
     try:
         results = await manager.search_medicines(
+            q=q,
             name=name,
             generic_name=generic_name,
             category=category,
             manufacturer=manufacturer,
+            skip=skip,
+            limit=limit,
         )
         if not results:
             raise HTTPException(status_code=404, detail="No medicines found.")
@@ -62,6 +68,12 @@ async def search_medicines(
         raise HTTPException(status_code=500, detail="Database error")
 
 
+# 📊 Catalog cache metrics
+@router.get("/cache/stats")
+async def medicine_cache_stats(manager: MedicineManager = Depends(get_medicine_manager)):
+    return manager.cache_stats()
+
+
 # 🔍 Get Medicine by ID
 @router.get("/{medicine_id}", response_model=MedicineDataReadModel)
 async def get_medicine(
@@ -1,13 +1,13 @@
-from fastapi import APIRouter, HTTPException, Depends
+from fastapi import APIRouter, HTTPException, Depends, Query, Response
 from sqlalchemy.exc import SQLAlchemyError
-from typing import List
+from typing import List, Optional
 from fastapi.responses import FileResponse
 import os
 
 from ...schemas.customer.order_schema import OrderDataCreateModel, OrderDataReadModel, OrderDataUpdateModel
 from ...crud.customer.order_manager import OrderManager
 from ...utils.get_db_manager import get_order_manager
-from ...exceptions.custom_exceptions import NotFoundException
+from ...exceptions.custom_exceptions import NotFoundException, InvalidCursorException
 
 router = APIRouter(prefix="/orders", tags=["Orders"])
 
@@ -21,9 +21,20 @@ async def create_order(order: OrderDataCreateModel, manager: OrderManager = Depe
 
 
 @router.get("/")
-async def list_orders(skip: int = 0, limit: int = 10, manager: OrderManager = Depends(get_order_manager)):
+async def list_orders(
+    response: Response,
+    skip: int = 0,
+    limit: int = Query(10, ge=1),
+    cursor: Optional[str] = Query(None, description="X-Next-Cursor value from the previous page"),
+    manager: OrderManager = Depends(get_order_manager),
+):
     try:
-        return await manager.get_all_orders(skip, limit)
+        page = await manager.get_all_orders(skip, limit, cursor)
+        if page.next_cursor:
+            response.headers["X-Next-Cursor"] = page.next_cursor
+        return page.items
+    except InvalidCursorException as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except SQLAlchemyError:
         raise HTTPException(status_code=500, detail="Database error")
 
@@ -1,9 +1,12 @@
-from fastapi import APIRouter, HTTPException, Depends, Query
+from fastapi import APIRouter, HTTPException, Depends, Query, Request
 from sqlalchemy.exc import SQLAlchemyError
 from typing import List
 from ...crud.distributor.distributor_report_manager import DistributorReportManager
 from ...utils.get_db_manager import get_distributor_report_manager
 from ...exceptions.custom_exceptions import NotFoundException
+from ...utils.report_export import streaming_response
+from ...utils.response_cache import dashboard_cache
+from ...models.report.daily_sales_rollup_model import DISTRIBUTOR_SALES
 
 router = APIRouter(prefix="/distributor-dashboard", tags=["Distributor Dashboard & Reports"])
 
@@ -11,11 +14,14 @@ router = APIRouter(prefix="/distributor-dashboard", tags=["Distributor Dashboard
 # 🏠 Dashboard Summary
 @router.get("/summary")
 async def get_dashboard_summary(
+    request: Request,
     distributor_id: int = Query(..., description="Distributor ID to fetch dashboard summary for"),
     manager: DistributorReportManager = Depends(get_distributor_report_manager),
 ):
     try:
-        return await manager.get_dashboard_summary(distributor_id)
+        return await dashboard_cache.respond(
+            request, (DISTRIBUTOR_SALES, distributor_id), lambda: manager.get_dashboard_summary(distributor_id)
+        )
     except SQLAlchemyError:
         raise HTTPException(status_code=500, detail="Database error")
 
@@ -23,12 +29,15 @@ async def get_dashboard_summary(
 # 💰 Sales Analytics (daily/monthly)
 @router.get("/reports/sales")
 async def get_sales_report(
+    request: Request,
     distributor_id: int = Query(..., description="Distributor ID"),
     period: str = Query("daily", description="Report period: 'daily' or 'monthly'"),
     manager: DistributorReportManager = Depends(get_distributor_report_manager),
 ):
     try:
-        return await manager.get_sales_report(distributor_id, period)
+        return await dashboard_cache.respond(
+            request, (DISTRIBUTOR_SALES, distributor_id), lambda: manager.get_sales_report(distributor_id, period)
+        )
     except SQLAlchemyError:
         raise HTTPException(status_code=500, detail="Database error")
 
@@ -36,11 +45,14 @@ async def get_sales_report(
 # 📦 Orders Analytics
 @router.get("/reports/orders")
 async def get_orders_report(
+    request: Request,
     distributor_id: int = Query(..., description="Distributor ID"),
     manager: DistributorReportManager = Depends(get_distributor_report_manager),
 ):
     try:
-        return await manager.get_orders_report(distributor_id)
+        return await dashboard_cache.respond(
+            request, (DISTRIBUTOR_SALES, distributor_id), lambda: manager.get_orders_report(distributor_id)
+        )
     except SQLAlchemyError:
         raise HTTPException(status_code=500, detail="Database error")
 
@@ -48,11 +60,14 @@ async def get_orders_report(
 # 💊 Product Performance
 @router.get("/reports/products")
 async def get_product_report(
+    request: Request,
     distributor_id: int = Query(..., description="Distributor ID"),
     manager: DistributorReportManager = Depends(get_distributor_report_manager),
 ):
     try:
-        return await manager.get_product_report(distributor_id)
+        return await dashboard_cache.respond(
+            request, (DISTRIBUTOR_SALES, distributor_id), lambda: manager.get_product_report(distributor_id)
+        )
     except SQLAlchemyError:
         raise HTTPException(status_code=500, detail="Database error")
 
@@ -63,11 +78,12 @@ async def export_report(
     distributor_id: int = Query(..., description="Distributor ID"),
     report_type: str = Query("sales", description="Type of report: sales, orders, or products"),
     format: str = Query("csv", description="Export format: csv or pdf"),
+    gzip: bool = Query(False, description="Gzip-compress the download"),
     manager: DistributorReportManager = Depends(get_distributor_report_manager),
 ):
     try:
-        result = await manager.export_report(distributor_id, report_type, format)
-        return result
+        export = await manager.export_report(distributor_id, report_type, format)
+        return streaming_response(export, gzip)
     except NotFoundException as e:
         raise HTTPException(status_code=404, detail=str(e))
     except SQLAlchemyError:
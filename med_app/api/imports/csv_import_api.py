@@ -0,0 +1,25 @@
+import io
+
+from fastapi import APIRouter, Depends, File, HTTPException, Query, UploadFile
+
+from ...crud.imports.csv_import_manager import CsvImportManager, IMPORT_TARGETS, DEFAULT_CHUNK_SIZE
+from ...utils.get_db_manager import get_csv_import_manager
+
+router = APIRouter(prefix="/imports", tags=["Bulk Import"])
+
+
+# 📥 Stream a CSV into retailers / medicines / distributor_stock / retailer_medicines
+@router.post("/{kind}")
+async def import_csv(
+    kind: str,
+    file: UploadFile = File(...),
+    chunk_size: int = Query(DEFAULT_CHUNK_SIZE, ge=1, le=10000),
+    skip_rows: int = Query(0, ge=0, description="Resume after this data row (the last_row of a previous run)"),
+    manager: CsvImportManager = Depends(get_csv_import_manager),
+):
+    if kind not in IMPORT_TARGETS:
+        raise HTTPException(status_code=404, detail=f"Unknown import '{kind}'. Use one of: {', '.join(IMPORT_TARGETS)}")
+
+    # The upload is already spooled to disk; decode it lazily, line by line
+    lines = io.TextIOWrapper(file.file, encoding="utf-8-sig", newline="")
+    return await manager.import_csv(kind, lines, chunk_size=chunk_size, skip_rows=skip_rows)
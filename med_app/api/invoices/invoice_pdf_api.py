@@ -0,0 +1,73 @@
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.responses import FileResponse, JSONResponse, StreamingResponse
+from sqlalchemy.exc import SQLAlchemyError
+
+from ...crud.invoices.invoice_pdf_manager import InvoicePdfManager
+from ...utils.get_db_manager import get_invoice_pdf_manager
+from ...utils.invoice_jobs import READY, FAILED
+from ...utils.invoice_storage import InvoiceStorage
+from ...utils.response_cache import etag_matches
+from ...exceptions.custom_exceptions import NotFoundException
+
+router = APIRouter(prefix="/invoices", tags=["Invoice PDFs"])
+
+READ_CHUNK = 64 * 1024
+
+
+def _pdf_response(request: Request, storage: InvoiceStorage, key: str, order_id: int) -> Response:
+    # The key is a hash of the invoice content, so it is a strong validator.
+    headers = {"etag": f'"{key}"', "cache-control": "private, no-cache"}
+    if etag_matches(request, headers["etag"]):
+        return Response(status_code=304, headers=headers)
+    filename = f"invoice_{order_id}.pdf"
+    path = storage.local_path(key)
+    if path is not None:
+        # FileResponse handles Range / If-Range and uses pathsend (sendfile) when the server offers it.
+        return FileResponse(path=path, filename=filename, media_type="application/pdf", headers=headers)
+
+    def chunks():
+        with storage.open(key) as f:
+            while chunk := f.read(READ_CHUNK):
+                yield chunk
+    headers["content-disposition"] = f'attachment; filename="{filename}"'
+    return StreamingResponse(chunks(), media_type="application/pdf", headers=headers)
+
+
+# 📄 Download an order invoice (202 + status while it renders)
+@router.get("/{order_id}/pdf")
+async def get_invoice_pdf(
+    order_id: int,
+    request: Request,
+    manager: InvoicePdfManager = Depends(get_invoice_pdf_manager),
+):
+    try:
+        job = await manager.get_invoice_pdf(order_id)
+    except NotFoundException as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except SQLAlchemyError:
+        raise HTTPException(status_code=500, detail="Database error")
+
+    if job.status == READY:
+        return _pdf_response(request, manager.storage, job.key, order_id)
+    if job.status == FAILED:
+        manager.pop_failed(job.key)
+        raise HTTPException(status_code=500, detail=f"Invoice rendering failed: {job.error}")
+    return JSONResponse(
+        status_code=202,
+        content={"order_id": order_id, "status": job.status, "submitted_at": job.submitted_at.isoformat()},
+        headers={"Location": f"/invoices/{order_id}/pdf", "Retry-After": "1"},
+    )
+
+
+# 🗓️ Month-end batch: render every invoice of a retailer's month in the background
+@router.post("/batch", status_code=202)
+async def render_month(
+    retailer_id: int = Query(...),
+    month: str = Query(..., pattern=r"^\d{4}-(0[1-9]|1[0-2])$", description="YYYY-MM"),
+    regenerate: bool = Query(False, description="Re-render invoices that already have a PDF"),
+    manager: InvoicePdfManager = Depends(get_invoice_pdf_manager),
+):
+    try:
+        return await manager.render_month(retailer_id, month, regenerate)
+    except SQLAlchemyError:
+        raise HTTPException(status_code=500, detail="Database error")
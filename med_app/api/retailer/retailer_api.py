@@ -1,10 +1,11 @@
-from fastapi import APIRouter, HTTPException, Depends
+from fastapi import APIRouter, HTTPException, Depends, Query
 from sqlalchemy.exc import SQLAlchemyError
 from typing import List
 
 from ...schemas.retailer.retailer_schema import (
     RetailerDataCreateModel, RetailerDataReadModel,
-    RetailerDataUpdateModel, RetailerLoginRequest, RetailerLoginResponse
+    RetailerDataUpdateModel, RetailerLoginRequest, RetailerLoginResponse,
+    RetailerNearbyReadModel, NearbyBasketRequest, RetailerBasketMatchModel,
 )
 from ...crud.retailer.retailer_manager import RetailerManager
 from ...utils.get_db_manager import get_retailer_manager
@@ -35,6 +36,36 @@ async def login_retailer(credentials: RetailerLoginRequest, manager: RetailerMan
 async def list_retailers(skip: int = 0, limit: int = 10, manager: RetailerManager = Depends(get_retailer_manager)):
     return await manager.get_all_retailers(skip, limit)
 
+# Declared before /{retailer_id} so "nearby" is not parsed as an ID
+@router.get("/nearby", response_model=List[RetailerNearbyReadModel])
+async def get_nearby_retailers(
+    lat: float = Query(..., ge=-90, le=90),
+    lon: float = Query(..., ge=-180, le=180),
+    radius_km: float = Query(5.0, gt=0, le=100),
+    limit: int = Query(20, ge=1, le=100),
+    manager: RetailerManager = Depends(get_retailer_manager),
+):
+    results = await manager.get_nearby_retailers(lat, lon, radius_km, limit)
+    return [
+        {**RetailerDataReadModel.model_validate(retailer, from_attributes=True).model_dump(), "distance_km": round(distance, 3)}
+        for retailer, distance in results
+    ]
+
+@router.post("/nearby/availability", response_model=List[RetailerBasketMatchModel])
+async def find_basket_suppliers(request: NearbyBasketRequest, manager: RetailerManager = Depends(get_retailer_manager)):
+    matches = await manager.find_basket_suppliers(
+        request.lat, request.lon, request.items, request.radius_km, request.limit
+    )
+    return [
+        {
+            **RetailerDataReadModel.model_validate(m["retailer"], from_attributes=True).model_dump(),
+            "distance_km": m["distance_km"],
+            "items": m["items"],
+            "basket_total": m["basket_total"],
+        }
+        for m in matches
+    ]
+
 @router.get("/{retailer_id}", response_model=RetailerDataReadModel)
 async def get_retailer(retailer_id: int, manager: RetailerManager = Depends(get_retailer_manager)):
     try:
@@ -1,4 +1,4 @@
-from fastapi import APIRouter, HTTPException, Depends, Query
+from fastapi import APIRouter, HTTPException, Depends, Query, Response
 from sqlalchemy.exc import SQLAlchemyError
 from typing import List, Optional
 from ...schemas.retailer.retailer_medicine_schema import (
@@ -8,23 +8,30 @@ from ...schemas.retailer.retailer_medicine_schema import (
 )
 from ...crud.retailer.retailer_medicine_manager import RetailerMedicineManager
 from ...utils.get_db_manager import get_retailer_medicine_manager
-from ...exceptions.custom_exceptions import NotFoundException
+from ...exceptions.custom_exceptions import NotFoundException, InvalidCursorException
 
 router = APIRouter(prefix="/products", tags=["Retailer Products"])
 
 # 📋 List products
 @router.get("/", response_model=List[RetailerMedicineReadModel])
 async def list_products(
+    response: Response,
     retailer_id: int = Query(..., description="Filter products by retailer ID"),
     search: Optional[str] = Query(None),
     category: Optional[str] = Query(None),
     sort_by: Optional[str] = Query(None),
     skip: int = 0,
-    limit: int = 10,
+    limit: int = Query(10, ge=1),
+    cursor: Optional[str] = Query(None, description="X-Next-Cursor value from the previous page"),
     manager: RetailerMedicineManager = Depends(get_retailer_medicine_manager),
 ):
     try:
-        return await manager.list_products(retailer_id, search, category, sort_by, skip, limit)
+        page = await manager.list_products(retailer_id, search, category, sort_by, skip, limit, cursor)
+        if page.next_cursor:
+            response.headers["X-Next-Cursor"] = page.next_cursor
+        return page.items
+    except InvalidCursorException as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except SQLAlchemyError:
         raise HTTPException(status_code=500, detail="Database error")
 
@@ -66,6 +73,20 @@ async def get_no_stock(
         raise HTTPException(status_code=500, detail="Database error")
 
 
+# 🔤 Autocomplete product names (typo tolerant)
+@router.get("/autocomplete")
+async def autocomplete_products(
+    retailer_id: int = Query(..., description="Retailer whose products to suggest"),
+    q: str = Query(..., min_length=1, description="What the user has typed so far"),
+    limit: int = Query(10, ge=1, le=50),
+    manager: RetailerMedicineManager = Depends(get_retailer_medicine_manager),
+):
+    try:
+        return await manager.autocomplete(retailer_id, q, limit)
+    except SQLAlchemyError:
+        raise HTTPException(status_code=500, detail="Database error")
+
+
 # 🔍 Get one product
 @router.get("/{product_id}", response_model=RetailerMedicineReadModel)
 async def get_product(
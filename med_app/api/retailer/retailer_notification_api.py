@@ -1,4 +1,4 @@
-from fastapi import APIRouter, HTTPException, Depends, Query
+from fastapi import APIRouter, HTTPException, Depends, Query, Response
 from sqlalchemy.exc import SQLAlchemyError
 from typing import List, Optional
 from ...schemas.retailer.retailer_notification_schema import (
@@ -7,7 +7,7 @@ from ...schemas.retailer.retailer_notification_schema import (
 )
 from ...crud.retailer.retailer_notification_manager import RetailerNotificationManager
 from ...utils.get_db_manager import get_retailer_notification_manager
-from ...exceptions.custom_exceptions import NotFoundException
+from ...exceptions.custom_exceptions import NotFoundException, InvalidCursorException
 
 router = APIRouter(prefix="/retailer-notifications", tags=["Retailer Notifications"])
 
@@ -26,11 +26,19 @@ async def create_notification(
 # 📋 List all notifications
 @router.get("", response_model=List[RetailerNotificationReadModel])
 async def list_notifications(
+    response: Response,
     retailer_id: Optional[int] = Query(None),
+    limit: Optional[int] = Query(None, ge=1),
+    cursor: Optional[str] = Query(None, description="X-Next-Cursor value from the previous page"),
     manager: RetailerNotificationManager = Depends(get_retailer_notification_manager),
 ):
     try:
-        return await manager.list_notifications(retailer_id)
+        page = await manager.list_notifications(retailer_id, limit, cursor)
+        if page.next_cursor:
+            response.headers["X-Next-Cursor"] = page.next_cursor
+        return page.items
+    except InvalidCursorException as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except SQLAlchemyError:
         raise HTTPException(status_code=500, detail="Database error")
 
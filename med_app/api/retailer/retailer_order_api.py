@@ -1,4 +1,4 @@
-from fastapi import APIRouter, HTTPException, Depends, Query
+from fastapi import APIRouter, HTTPException, Depends, Query, Response
 from sqlalchemy.exc import SQLAlchemyError
 from typing import List, Optional
 from datetime import datetime
@@ -9,7 +9,7 @@ from ...schemas.retailer.retailer_order_schema import (
 )
 from ...crud.retailer.retailer_order_manager import RetailerOrderManager
 from ...utils.get_db_manager import get_retailer_order_manager
-from ...exceptions.custom_exceptions import NotFoundException
+from ...exceptions.custom_exceptions import NotFoundException, InvalidCursorException
 
 router = APIRouter(prefix="/retailer-orders", tags=["Retailer Orders"])
 
@@ -29,41 +29,71 @@ async def get_order(order_id: int, manager: RetailerOrderManager = Depends(get_r
 
 @router.get("/", response_model=List[RetailerOrderReadModel])
 async def list_orders(
+    response: Response,
     retailer_id: Optional[int] = Query(None),
     distributor_id: Optional[int] = Query(None),
     status: Optional[str] = Query(None),
     start_date: Optional[datetime] = Query(None),
     end_date: Optional[datetime] = Query(None),
+    limit: Optional[int] = Query(None, ge=1),
+    cursor: Optional[str] = Query(None, description="X-Next-Cursor value from the previous page"),
     manager: RetailerOrderManager = Depends(get_retailer_order_manager),
 ):
     try:
-        return await manager.list_orders(retailer_id, distributor_id, status, start_date, end_date)
+        page = await manager.list_orders(retailer_id, distributor_id, status, start_date, end_date, limit, cursor)
+        if page.next_cursor:
+            response.headers["X-Next-Cursor"] = page.next_cursor
+        return page.items
+    except InvalidCursorException as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except SQLAlchemyError:
         raise HTTPException(status_code=500, detail="Database error")
 
 @router.get("/retailer/{retailer_id}", response_model=List[RetailerOrderReadModel])
 async def list_orders_by_retailer(
     retailer_id: int,
+    response: Response,
     status: Optional[str] = Query(None),
     start_date: Optional[datetime] = Query(None),
     end_date: Optional[datetime] = Query(None),
+    limit: Optional[int] = Query(None, ge=1),
+    cursor: Optional[str] = Query(None, description="X-Next-Cursor value from the previous page"),
     manager: RetailerOrderManager = Depends(get_retailer_order_manager),
 ):
     try:
-        return await manager.list_orders(retailer_id=retailer_id, status=status, start_date=start_date, end_date=end_date)
+        page = await manager.list_orders(
+            retailer_id=retailer_id, status=status, start_date=start_date, end_date=end_date,
+            limit=limit, cursor=cursor,
+        )
+        if page.next_cursor:
+            response.headers["X-Next-Cursor"] = page.next_cursor
+        return page.items
+    except InvalidCursorException as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except SQLAlchemyError:
         raise HTTPException(status_code=500, detail="Database error")
 
 @router.get("/distributor/{distributor_id}", response_model=List[RetailerOrderReadModel])
 async def list_orders_by_distributor(
     distributor_id: int,
+    response: Response,
     status: Optional[str] = Query(None),
     start_date: Optional[datetime] = Query(None),
     end_date: Optional[datetime] = Query(None),
+    limit: Optional[int] = Query(None, ge=1),
+    cursor: Optional[str] = Query(None, description="X-Next-Cursor value from the previous page"),
     manager: RetailerOrderManager = Depends(get_retailer_order_manager),
 ):
     try:
-        return await manager.list_orders(distributor_id=distributor_id, status=status, start_date=start_date, end_date=end_date)
+        page = await manager.list_orders(
+            distributor_id=distributor_id, status=status, start_date=start_date, end_date=end_date,
+            limit=limit, cursor=cursor,
+        )
+        if page.next_cursor:
+            response.headers["X-Next-Cursor"] = page.next_cursor
+        return page.items
+    except InvalidCursorException as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except SQLAlchemyError:
         raise HTTPException(status_code=500, detail="Database error")
 
@@ -1,9 +1,12 @@
-from fastapi import APIRouter, HTTPException, Depends, Query
+from fastapi import APIRouter, HTTPException, Depends, Query, Request
 from sqlalchemy.exc import SQLAlchemyError
 from typing import List, Optional, Dict
 from ...crud.retailer.retailer_report_manager import RetailerReportManager
 from ...utils.get_db_manager import get_retailer_report_manager
 from ...exceptions.custom_exceptions import NotFoundException
+from ...utils.report_export import streaming_response
+from ...utils.response_cache import dashboard_cache
+from ...models.report.daily_sales_rollup_model import RETAILER_SALES
 
 router = APIRouter(prefix="/dashboard", tags=["Retailer Dashboard & Reports"])
 
@@ -11,6 +14,7 @@ router = APIRouter(prefix="/dashboard", tags=["Retailer Dashboard & Reports"])
 # 🏠 Dashboard Summary
 @router.get("/summary")
 async def get_dashboard_summary(
+    request: Request,
     retailer_id: int = Query(..., description="Retailer ID to fetch dashboard summary for"),
     manager: RetailerReportManager = Depends(get_retailer_report_manager),
 ):
@@ -21,7 +25,9 @@ async def get_dashboard_summary(
     - Sales Change %
     """
     try:
-        return await manager.get_dashboard_summary(retailer_id)
+        return await dashboard_cache.respond(
+            request, (RETAILER_SALES, retailer_id), lambda: manager.get_dashboard_summary(retailer_id)
+        )
     except SQLAlchemyError:
         raise HTTPException(status_code=500, detail="Database error")
 
@@ -29,6 +35,7 @@ async def get_dashboard_summary(
 # 💰 Sales Analytics (daily/monthly)
 @router.get("/reports/sales")
 async def get_sales_report(
+    request: Request,
     retailer_id: int = Query(..., description="Retailer ID"),
     period: str = Query("daily", description="Report period: 'daily' or 'monthly'"),
     manager: RetailerReportManager = Depends(get_retailer_report_manager),
@@ -38,7 +45,9 @@ async def get_sales_report(
     Example: /reports/sales?retailer_id=1&period=monthly
     """
     try:
-        return await manager.get_sales_report(retailer_id, period)
+        return await dashboard_cache.respond(
+            request, (RETAILER_SALES, retailer_id), lambda: manager.get_sales_report(retailer_id, period)
+        )
     except SQLAlchemyError:
         raise HTTPException(status_code=500, detail="Database error")
 
@@ -46,6 +55,7 @@ async def get_sales_report(
 # 📦 Orders Analytics
 @router.get("/reports/orders")
 async def get_orders_report(
+    request: Request,
     retailer_id: int = Query(..., description="Retailer ID"),
     manager: RetailerReportManager = Depends(get_retailer_report_manager),
 ):
@@ -54,7 +64,9 @@ async def get_orders_report(
     Includes completion rate, cancellation rate, and status breakdown.
     """
     try:
-        return await manager.get_orders_report(retailer_id)
+        return await dashboard_cache.respond(
+            request, (RETAILER_SALES, retailer_id), lambda: manager.get_orders_report(retailer_id)
+        )
     except SQLAlchemyError:
         raise HTTPException(status_code=500, detail="Database error")
 
@@ -62,6 +74,7 @@ async def get_orders_report(
 # 💊 Product Performance Trends
 @router.get("/reports/products")
 async def get_product_report(
+    request: Request,
     retailer_id: int = Query(..., description="Retailer ID"),
     manager: RetailerReportManager = Depends(get_retailer_report_manager),
 ):
@@ -69,7 +82,9 @@ async def get_product_report(
     Get top-performing products for a retailer based on sales and quantity.
     """
     try:
-        return await manager.get_product_report(retailer_id)
+        return await dashboard_cache.respond(
+            request, (RETAILER_SALES, retailer_id), lambda: manager.get_product_report(retailer_id)
+        )
     except SQLAlchemyError:
         raise HTTPException(status_code=500, detail="Database error")
 
@@ -80,6 +95,7 @@ async def export_report(
     retailer_id: int = Query(..., description="Retailer ID"),
     report_type: str = Query("sales", description="Type of report: sales, orders, or products"),
     format: str = Query("csv", description="Export format: csv or pdf"),
+    gzip: bool = Query(False, description="Gzip-compress the download"),
     manager: RetailerReportManager = Depends(get_retailer_report_manager),
 ):
     """
@@ -88,8 +104,8 @@ async def export_report(
     /reports/export?retailer_id=1&report_type=sales&format=csv
     """
     try:
-        result = await manager.export_report(retailer_id, report_type, format)
-        return result
+        export = await manager.export_report(retailer_id, report_type, format)
+        return streaming_response(export, gzip)
     except NotFoundException as e:
         raise HTTPException(status_code=404, detail=str(e))
     except SQLAlchemyError:
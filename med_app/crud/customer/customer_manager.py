@@ -26,8 +26,9 @@ class CustomerManager:
 
     async def get_all_customers(self, skip: int = 0, limit: int = 10) -> List[CustomerDbModel]:
         try:
-            customers = await self.database_manager.read(CustomerDbModel)
-            return customers[skip : skip + limit]
+            return await self.database_manager.read(
+                CustomerDbModel, order_by="customer_id", offset=skip, limit=limit
+            )
         except Exception:
             logger.exception("Error fetching customers.")
             raise
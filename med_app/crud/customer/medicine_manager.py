@@ -1,14 +1,19 @@
-from typing import List
+from typing import Dict, Iterable, List, Optional
 
 from sqlalchemy import or_, select
 from ...models.customer.medicine_model import MedicineDbModel
 from ...schemas.customer.medicine_schema import MedicineDataCreateModel, MedicineDataUpdateModel
 from ...db.base.database_manager import DatabaseManager
+from ...db.base.pagination import row_value
+from ...db.sql.query_builder import filter_conditions
 from ...exceptions.custom_exceptions import NotFoundException
 from ...utils.logger import get_logger
+from ...utils.medicine_cache import medicine_cache
 
 logger = get_logger(__name__)
 
+MEDICINE_FIELDS = tuple(column.name for column in MedicineDbModel.__table__.columns)
+
 
 class MedicineManager:
     def __init__(self, database_manager: DatabaseManager):
@@ -19,6 +24,7 @@ class MedicineManager:
         logger.info(f"Creating medicine: {medicine.name}")
         try:
             created = await self.database_manager.create(MedicineDbModel, medicine.dict())
+            self._invalidate_after_commit(row_value(created, "medicine_id"))
             logger.info(f"Medicine created successfully: {created.medicine_id}")
             return created
         except Exception:
@@ -29,32 +35,57 @@ class MedicineManager:
     async def get_all_medicines(self, skip: int = 0, limit: int = 10) -> List[MedicineDbModel]:
         logger.info("Fetching all medicines.")
         try:
-            medicines = await self.database_manager.read(MedicineDbModel)
-            return medicines[skip : skip + limit]
+            return await self.database_manager.read(
+                MedicineDbModel, order_by="medicine_id", offset=skip, limit=limit
+            )
         except Exception:
             logger.exception("Error fetching medicines.")
             raise
 
-    # 🔍 Get Medicine by ID
+    # 🔍 Get Medicine by ID (cached)
     async def get_medicine_by_id(self, medicine_id: int) -> MedicineDbModel:
         logger.info(f"Fetching medicine with ID: {medicine_id}")
         try:
-            result = await self.database_manager.read(MedicineDbModel, filters={"medicine_id": medicine_id})
-            if not result:
+            found = await self.get_many([medicine_id])
+            if medicine_id not in found:
                 raise NotFoundException(f"Medicine ID {medicine_id} not found.")
-            return result[0]
+            return found[medicine_id]
         except Exception:
             logger.exception("Error fetching medicine by ID.")
             raise
 
+    # 📦 Get Medicines by IDs (cached, one IN (...) read for the misses)
+    async def get_many(self, medicine_ids: Iterable[int]) -> Dict[int, MedicineDbModel]:
+        """
+        ``{medicine_id: medicine}`` for the ids that exist. Each result is a
+        new detached instance built from the cached columns.
+        """
+        ids = list(dict.fromkeys(medicine_ids))
+        generation = medicine_cache.generation
+        found, missing = medicine_cache.lookup(ids)
+        if missing:
+            rows = await self.database_manager.read(MedicineDbModel, filters={"medicine_id__in": missing})
+            loaded = {row_value(row, "medicine_id"): {f: row_value(row, f) for f in MEDICINE_FIELDS} for row in rows}
+            medicine_cache.fill(loaded, generation)
+            found.update(loaded)
+        return {medicine_id: MedicineDbModel(**found[medicine_id]) for medicine_id in ids if medicine_id in found}
+
+    async def _read_medicine(self, medicine_id: int) -> MedicineDbModel:
+        # Uncached: write paths must see the request's own pending changes.
+        result = await self.database_manager.read(MedicineDbModel, filters={"medicine_id": medicine_id})
+        if not result:
+            raise NotFoundException(f"Medicine ID {medicine_id} not found.")
+        return result[0]
+
     # ✏️ Update Medicine
     async def update_medicine(self, medicine_id: int, update_data: MedicineDataUpdateModel) -> MedicineDbModel:
         logger.info(f"Updating medicine ID: {medicine_id}")
         try:
             updates = update_data.dict(exclude_unset=True)
-            await self.get_medicine_by_id(medicine_id)
+            await self._read_medicine(medicine_id)
             await self.database_manager.update(MedicineDbModel, filters={"medicine_id": medicine_id}, updates=updates)
-            updated = await self.get_medicine_by_id(medicine_id)
+            updated = await self._read_medicine(medicine_id)
+            self._invalidate_after_commit(medicine_id)
             logger.info(f"Medicine ID {medicine_id} updated successfully.")
             return updated
         except NotFoundException:
@@ -67,8 +98,9 @@ class MedicineManager:
     async def delete_medicine(self, medicine_id: int) -> bool:
         logger.info(f"Deleting medicine ID: {medicine_id}")
         try:
-            await self.get_medicine_by_id(medicine_id)
+            await self._read_medicine(medicine_id)
             await self.database_manager.delete(MedicineDbModel, filters={"medicine_id": medicine_id})
+            self._invalidate_after_commit(medicine_id)
             logger.info(f"Medicine ID {medicine_id} deleted successfully.")
             return True
         except NotFoundException:
@@ -77,38 +109,56 @@ class MedicineManager:
             logger.exception("Error deleting medicine.")
             raise
 
-    # 🔎 Search Medicines (SQLAlchemy version)
+    # 🔎 Search Medicines (ranked full-text search)
     async def search_medicines(
         self,
+        q: Optional[str] = None,
         name: str = None,
         generic_name: str = None,
         category: str = None,
         manufacturer: str = None,
-    ):
-        logger.info("Searching medicines with SQLAlchemy filters.")
+        skip: int = 0,
+        limit: int = 20,
+    ) -> List[MedicineDbModel]:
+        """
+        ``q`` words must all match (as prefixes) somewhere in name, generic
+        name, category or manufacturer, ranked best first. The older
+        per-field params are substring matches on their own column: on
+        their own they match when any of them does (as before), alongside
+        ``q`` they all narrow its results.
+        """
+        logger.info(f"Searching medicines for q={q!r}.")
         try:
-            async with self.database_manager.get_session() as session:  # type: ignore # type: AsyncSession
-                query = select(MedicineDbModel)
-
-                conditions = []
-                if name:
-                    conditions.append(MedicineDbModel.name.ilike(f"%{name}%"))
-                if generic_name:
-                    conditions.append(MedicineDbModel.generic_name.ilike(f"%{generic_name}%"))
-                if category:
-                    conditions.append(MedicineDbModel.category.ilike(f"%{category}%"))
-                if manufacturer:
-                    conditions.append(MedicineDbModel.manufacturer.ilike(f"%{manufacturer}%"))
-
-                # If there are filters, combine them with OR logic
-                if conditions:
-                    query = query.where(or_(*conditions))
-
-                result = await session.execute(query)
-                medicines = result.scalars().all()
-
-                return medicines
-
+            legacy = {
+                f"{field}__icontains": value
+                for field, value in (
+                    ("name", name), ("generic_name", generic_name),
+                    ("category", category), ("manufacturer", manufacturer),
+                )
+                if value
+            }
+            if q:
+                return await self.database_manager.search(
+                    MedicineDbModel, q, match_all=True, offset=skip, limit=limit, filters=legacy,
+                )
+            if legacy:
+                session = self.database_manager.get_session()
+                stmt = (
+                    select(MedicineDbModel)
+                    .where(or_(*filter_conditions(MedicineDbModel, legacy)))
+                    .order_by(MedicineDbModel.medicine_id)
+                    .offset(skip)
+                    .limit(limit)
+                )
+                return (await session.execute(stmt)).scalars().all()
+            return await self.get_all_medicines(skip, limit)
         except Exception:
             logger.exception("Error searching medicines.")
-            raise
\ No newline at end of file
+            raise
+
+    # 📊 Catalog cache hit/miss counters
+    def cache_stats(self) -> Dict:
+        return medicine_cache.snapshot()
+
+    def _invalidate_after_commit(self, medicine_id: int) -> None:
+        self.database_manager.after_commit(lambda: medicine_cache.invalidate([medicine_id]))
@@ -1,4 +1,4 @@
-from typing import List
+from typing import List, Optional
 from decimal import Decimal
 from fastapi import HTTPException
 from sqlalchemy.future import select
@@ -6,13 +6,17 @@ from sqlalchemy.exc import SQLAlchemyError
 from ...models.customer.order_model import OrderDbModel, OrderItemDbModel
 from ...schemas.customer.order_schema import OrderDataCreateModel, OrderDataUpdateModel
 from ...db.base.database_manager import DatabaseManager
+from ...db.base.pagination import Page
 from ...exceptions.custom_exceptions import NotFoundException
 from ...utils.logger import get_logger
 from ...utils.invoice_generator import generate_invoice_pdf
 from ...models.retailer.retailer_model import RetailerDbModel
 from ...models.customer.customer_model import CustomerDbModel
-from ...models.customer.medicine_model import MedicineDbModel
 from ...models.retailer.retailer_medicine_model import RetailerMedicineDbModel
+from ...models.report.daily_sales_rollup_model import RETAILER_SALES
+from ..report.sales_rollup_manager import SalesRollupManager
+from ..inventory.stock_reservation_manager import StockReservationManager, requested_quantities
+from .medicine_manager import MedicineManager
 
 logger = get_logger(__name__)
 
@@ -20,85 +24,56 @@ logger = get_logger(__name__)
 class OrderManager:
     def __init__(self, database_manager: DatabaseManager):
         self.database_manager = database_manager
+        self.sales_rollup = SalesRollupManager(database_manager)
+        self.stock = StockReservationManager(database_manager)
+        self.medicines = MedicineManager(database_manager)
 
     async def create_order(self, order: OrderDataCreateModel) -> OrderDbModel:
         logger.info("Creating new order with real-time stock validation")
 
-        session = self.database_manager.get_session()
-        async with session.begin():  # Start a transaction block
+        async with self.database_manager.transaction() as session:  # Start a transaction block
             try:
                 retailer_id = order.retailer_id
                 if not retailer_id:
                     raise HTTPException(status_code=400, detail="Retailer ID is required to place order")
 
-                total_amount = Decimal(0)
-                order_items_data = []
+                # ✅ Step 1: Validate the whole basket with one IN (...) query
+                requested = requested_quantities(order.items)
+                await self.stock.load_retailer_stock(retailer_id, requested)
 
-                # ✅ Step 1: Validate stock and calculate total
-                for item in order.items:
-                    stmt = select(RetailerMedicineDbModel).where(
-                        RetailerMedicineDbModel.retailer_id == retailer_id,
-                        RetailerMedicineDbModel.retailer_medicine_id == item.medicine_id
-                    )
-                    result = await session.execute(stmt)
-                    stock_item = result.scalar_one_or_none()
-
-                    if not stock_item:
-                        raise HTTPException(
-                            status_code=404,
-                            detail=f"Medicine ID {item.medicine_id} not found in retailer inventory"
-                        )
-
-                    if stock_item.quantity < item.quantity:
-                        raise HTTPException(
-                            status_code=400,
-                            detail=f"Insufficient stock for {stock_item.name}. "
-                                   f"Available: {stock_item.quantity}, Requested: {item.quantity}"
-                        )
-
-                    item_total = Decimal(item.price) * item.quantity
-                    total_amount += item_total
-
-                    order_items_data.append({
-                        "medicine_id": item.medicine_id,
-                        "quantity": item.quantity,
-                        "price": item.price,
-                        "name": stock_item.name,
-                        "new_stock": stock_item.quantity - item.quantity
-                    })
+                total_amount = sum((Decimal(item.price) * item.quantity for item in order.items), Decimal(0))
 
                 # ✅ Step 2: Create order
                 order_data = order.dict(exclude={"items"})
                 order_data["total_amount"] = total_amount
                 created_order = await self.database_manager.create(OrderDbModel, order_data)
 
-                # ✅ Step 3: Add items & update stock
-                for item_data in order_items_data:
-                    await self.database_manager.create(
-                        OrderItemDbModel,
+                # ✅ Step 3: Add items in one batch & reserve stock in one guarded statement
+                created_items = await self.database_manager.create_many(
+                    OrderItemDbModel,
+                    [
                         {
                             "order_id": created_order.order_id,
-                            "medicine_id": item_data["medicine_id"],
-                            "quantity": item_data["quantity"],
-                            "price": item_data["price"],
+                            "medicine_id": item.medicine_id,
+                            "quantity": item.quantity,
+                            "price": item.price,
                         }
-                    )
+                        for item in order.items
+                    ],
+                )
+
+                await self.stock.reserve(
+                    RetailerMedicineDbModel, "retailer_medicine_id", requested, filters={"retailer_id": retailer_id}
+                )
 
-                    # Update stock in retailer inventory
-                    await self.database_manager.update(
-                        RetailerMedicineDbModel,
-                        filters={
-                            "retailer_medicine_id": item_data["medicine_id"],
-                            "retailer_id": retailer_id,
-                        },
-                        updates={"quantity": item_data["new_stock"]},
-                    )
+                # ✅ Step 4: Keep the dashboard rollup in the same transaction
+                await self.sales_rollup.record(RETAILER_SALES, created_order, created_items)
 
                 logger.info(f"✅ Order {created_order.order_id} created successfully and stock updated.")
                 return created_order
 
             except HTTPException:
-                # Rollback handled automatically by session.begin()
+                # Rollback handled automatically by database_manager.transaction()
                 raise
             except SQLAlchemyError as e:
                 logger.exception("Database error while creating order.")
@@ -107,14 +82,12 @@ class OrderManager:
                 logger.exception("Unexpected error during order creation.")
                 raise HTTPException(status_code=500, detail=str(e))
 
-    async def get_all_orders(self, skip: int = 0, limit: int = 10) -> List[OrderDbModel]:
+    async def get_all_orders(self, skip: int = 0, limit: int = 10, cursor: Optional[str] = None) -> Page:
         logger.info("Fetching all orders.")
         try:
-            session = self.database_manager.get_session()
-            async with session:
-                stmt = select(OrderDbModel).offset(skip).limit(limit)
-                result = await session.execute(stmt)
-                return result.scalars().all()
+            return await self.database_manager.read_page(
+                OrderDbModel, order_by="order_id", limit=limit, cursor=cursor, offset=skip
+            )
         except Exception:
             logger.exception("Error fetching orders.")
             raise
@@ -123,10 +96,9 @@ class OrderManager:
         logger.info(f"Fetching order with ID: {order_id}")
         try:
             session = self.database_manager.get_session()
-            async with session:
-                stmt = select(OrderDbModel).where(OrderDbModel.order_id == order_id)
-                result = await session.execute(stmt)
-                order = result.scalar_one_or_none()
+            stmt = select(OrderDbModel).where(OrderDbModel.order_id == order_id)
+            result = await session.execute(stmt)
+            order = result.scalar_one_or_none()
             if not order:
                 raise NotFoundException(f"Order ID {order_id} not found.")
             return order
@@ -138,9 +110,12 @@ class OrderManager:
         logger.info(f"Updating order ID: {order_id}")
         try:
             updates = update_data.dict(exclude_unset=True)
-            await self.get_order_by_id(order_id)
+            order = await self.get_order_by_id(order_id)
+            before = await self.sales_rollup.contributions(RETAILER_SALES, order)
             await self.database_manager.update(OrderDbModel, filters={"order_id": order_id}, updates=updates)
             updated_order = await self.get_order_by_id(order_id)
+            after = await self.sales_rollup.contributions(RETAILER_SALES, updated_order)
+            await self.sales_rollup.apply_change(before, after)
             return updated_order
         except NotFoundException:
             raise
@@ -151,7 +126,8 @@ class OrderManager:
     async def delete_order(self, order_id: int) -> bool:
         logger.info(f"Deleting order ID: {order_id}")
         try:
-            await self.get_order_by_id(order_id)
+            order = await self.get_order_by_id(order_id)
+            await self.sales_rollup.remove(RETAILER_SALES, order)
             await self.database_manager.delete(OrderDbModel, filters={"order_id": order_id})
             return True
         except NotFoundException:
@@ -164,15 +140,14 @@ class OrderManager:
         logger.info(f"Fetching orders for user ID: {user_id}")
         try:
             session = self.database_manager.get_session()
-            async with session:
-                stmt = (
-                    select(OrderDbModel)
-                    .where(OrderDbModel.customer_id == user_id)
-                    .offset(skip)
-                    .limit(limit)
-                )
-                result = await session.execute(stmt)
-                return result.scalars().all()
+            stmt = (
+                select(OrderDbModel)
+                .where(OrderDbModel.customer_id == user_id)
+                .offset(skip)
+                .limit(limit)
+            )
+            result = await session.execute(stmt)
+            return result.scalars().all()
         except Exception:
             logger.exception("Error fetching orders by user ID.")
             raise
@@ -188,75 +163,73 @@ class OrderManager:
 
         try:
             session = self.database_manager.get_session()
-            async with session:
-                stmt = (
-                    select(OrderDbModel)
-                    .where(OrderDbModel.retailer_id == retailer_id)
-                    .offset(skip)
-                    .limit(limit)
-                )
-                result = await session.execute(stmt)
-                orders = result.scalars().all()
-
-                final_output = []
-
-                for order in orders:
-                    # Get customer info
-                    customer = await self.database_manager.read(
-                        CustomerDbModel, filters={"customer_id": order.customer_id}
-                    )
-
-                    customer_data = {}
-                    if customer:
-                        c = customer[0]
-                        # Combine address fields safely
-                        address_parts = [
-                            c.address_line1,
-                            c.address_line2,
-                            c.city,
-                            c.state,
-                            c.zip_code,                            
-                        ]
-                        full_address = ", ".join([part for part in address_parts if part])
-                        customer_data = {
-                            "name": c.full_name or "Unknown Customer",
-                            "address": full_address or "N/A",
-                            "mobile": c.phone_number
-                        }
-
-                    # Get items for this order
-                    items = await self.database_manager.read(
-                        OrderItemDbModel, filters={"order_id": order.order_id}
-                    )
-
-                    formatted_items = []
-                    for item in items:
-                        medicine = await self.database_manager.read(
-                            MedicineDbModel, filters={"medicine_id": item.medicine_id}
-                        )
-                        med_name = medicine[0].name if medicine else "Unknown Medicine"
-                        unit_price = Decimal(item.price)
-                        total_price = unit_price * Decimal(item.quantity)
-
-                        formatted_items.append({
-                            "name": med_name,
-                            "quantity": item.quantity,
-                            "unitprice": float(unit_price),
-                            "totalprice": float(total_price)
-                        })
-
-                    final_output.append({
-                        "orderid": order.order_id,
-                        "customername": customer_data["name"],
-                        "address": customer_data["address"],
-                        "mobile": customer_data["mobile"],
-                        "orderdate": order.order_date,
-                        "status": order.status.value if hasattr(order.status, "value") else order.status,
-                        "totalamount": float(order.total_amount),
-                        "items": formatted_items
-                    })
 
-                return final_output
+            # ✅ Orders ⋈ customers in one round trip
+            stmt = (
+                select(OrderDbModel, CustomerDbModel)
+                .outerjoin(CustomerDbModel, CustomerDbModel.customer_id == OrderDbModel.customer_id)
+                .where(OrderDbModel.retailer_id == retailer_id)
+                .order_by(OrderDbModel.order_id)
+                .offset(skip)
+                .limit(limit)
+            )
+            rows = (await session.execute(stmt)).all()
+            if not rows:
+                return []
+
+            # ✅ Items for the whole page with a single IN (...); names from the medicine cache
+            order_ids = [order.order_id for order, _ in rows]
+            item_stmt = (
+                select(OrderItemDbModel)
+                .where(OrderItemDbModel.order_id.in_(order_ids))
+                .order_by(OrderItemDbModel.order_id, OrderItemDbModel.order_item_id)
+            )
+            items = (await session.execute(item_stmt)).scalars().all()
+            medicines = await self.medicines.get_many(item.medicine_id for item in items if item.medicine_id is not None)
+            items_by_order = {order_id: [] for order_id in order_ids}
+            for item in items:
+                medicine = medicines.get(item.medicine_id)
+                unit_price = Decimal(item.price)
+                total_price = unit_price * Decimal(item.quantity)
+                items_by_order[item.order_id].append({
+                    "name": medicine.name if medicine else "Unknown Medicine",
+                    "quantity": item.quantity,
+                    "unitprice": float(unit_price),
+                    "totalprice": float(total_price)
+                })
+
+            final_output = []
+
+            for order, c in rows:
+                customer_data = {"name": "Unknown Customer", "address": "N/A", "mobile": None}
+                if c:
+                    # Combine address fields safely
+                    address_parts = [
+                        c.address_line1,
+                        c.address_line2,
+                        c.city,
+                        c.state,
+                        c.zip_code,
+                    ]
+                    full_address = ", ".join([part for part in address_parts if part])
+                    customer_data = {
+                        "name": c.full_name or "Unknown Customer",
+                        "address": full_address or "N/A",
+                        "mobile": c.phone_number
+                    }
+
+                final_output.append({
+                    "orderid": order.order_id,
+                    "customername": customer_data["name"],
+                    "address": customer_data["address"],
+                    "mobile": customer_data["mobile"],
+                    "orderdate": order.order_date,
+                    "status": order.status.value if hasattr(order.status, "value") else order.status,
+                    "totalamount": float(order.total_amount),
+                    "items": items_by_order[order.order_id]
+                })
+
+            return final_output
 
         except Exception:
             logger.exception("Error fetching orders by retailer ID.")
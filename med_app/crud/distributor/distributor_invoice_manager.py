@@ -27,11 +27,12 @@ class DistributorInvoiceManager:
 
         invoice = await self.database_manager.create(DistributorInvoiceDbModel, invoice_dict)
 
-        # Create invoice items
-        for item in data.items:
-            item_dict = item.dict()
-            item_dict["invoice_id"] = invoice.invoice_id
-            await self.database_manager.create(DistributorInvoiceItemDbModel, item_dict)
+        # Create invoice items in one batch
+        await self.database_manager.create_many(
+            DistributorInvoiceItemDbModel,
+            [{**item.dict(), "invoice_id": invoice.invoice_id} for item in data.items],
+            returning=False,
+        )
 
         return await self.get_invoice_by_id(invoice.invoice_id)
 
@@ -33,8 +33,9 @@ class DistributorManager:
 
     async def get_all_distributors(self, skip: int = 0, limit: int = 10) -> List[DistributorDbModel]:
         try:
-            dists = await self.database_manager.read(DistributorDbModel)
-            return dists[skip : skip + limit]
+            return await self.database_manager.read(
+                DistributorDbModel, order_by="distributor_id", offset=skip, limit=limit
+            )
         except Exception:
             logger.exception("Error fetching distributors.")
             raise
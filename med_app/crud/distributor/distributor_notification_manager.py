@@ -1,8 +1,9 @@
 from datetime import datetime
-from typing import List, Optional
+from typing import Optional
 from ...models.distributor.distributor_notification_model import DistributorNotificationDbModel
 from ...schemas.distributor.distributor_notification_schema import DistributorNotificationCreateModel
 from ...db.base.database_manager import DatabaseManager
+from ...db.base.pagination import Page
 from ...exceptions.custom_exceptions import NotFoundException
 from ...utils.logger import get_logger
 
@@ -20,11 +21,16 @@ class DistributorNotificationManager:
         return await self.database_manager.create(DistributorNotificationDbModel, notif_dict)
 
     # 📋 List notifications (optionally filtered by distributor)
-    async def list_notifications(self, distributor_id: Optional[int] = None) -> List[DistributorNotificationDbModel]:
+    async def list_notifications(
+        self, distributor_id: Optional[int] = None, limit: Optional[int] = None, cursor: Optional[str] = None
+    ) -> Page:
         filters = {}
         if distributor_id:
             filters["distributor_id"] = distributor_id
-        return await self.database_manager.read(DistributorNotificationDbModel, filters=filters)
+        # Newest first; id breaks ties so the cursor position is unique
+        return await self.database_manager.read_page(
+            DistributorNotificationDbModel, filters=filters, order_by=["-created_at", "-id"], limit=limit, cursor=cursor
+        )
 
     # ✅ Mark notification as read
     async def mark_as_read(self, notification_id: int):
@@ -15,11 +15,11 @@ class DistributorOrderManager:
     async def create_order(self, order: DistributorOrderCreate) -> DistributorOrderDbModel:
         total_amount = order.total_amount
         created_order = await self.db.create(DistributorOrderDbModel, order.dict(exclude={"items"}))
-        for item in order.items:
-            await self.db.create(
-                DistributorOrderItemDbModel,
-                {"order_id": created_order.order_id, **item.dict()}
-            )
+        await self.db.create_many(
+            DistributorOrderItemDbModel,
+            [{"order_id": created_order.order_id, **item.dict()} for item in order.items],
+            returning=False,
+        )
         return await self.get_order_by_id(created_order.order_id)
     
 
@@ -30,8 +30,9 @@ class DistributorStockManager:
     async def get_all_stock(self, skip: int = 0, limit: int = 10) -> List[DistributorStockDbModel]:
         logger.info("Fetching all distributor stock entries.")
         try:
-            stocks = await self.database_manager.read(DistributorStockDbModel)
-            return stocks[skip : skip + limit]
+            return await self.database_manager.read(
+                DistributorStockDbModel, order_by="stock_id", offset=skip, limit=limit
+            )
         except Exception:
             logger.exception("Error fetching stock list.")
             raise
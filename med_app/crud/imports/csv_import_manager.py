@@ -0,0 +1,189 @@
+import csv
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Type
+
+from pydantic import BaseModel, ValidationError
+
+from ...models.retailer.retailer_model import RetailerDbModel
+from ...models.customer.medicine_model import MedicineDbModel
+from ...models.distributor.distributor_stock_model import DistributorStockDbModel
+from ...models.retailer.retailer_medicine_model import RetailerMedicineDbModel
+from ...schemas.retailer.retailer_schema import RetailerImportModel
+from ...schemas.customer.medicine_schema import MedicineDataCreateModel
+from ...schemas.distributor.distributor_stock_schema import DistributorStockCreateModel
+from ...schemas.retailer.retailer_medicine_schema import RetailerMedicineCreateModel
+from ...db.base.database_manager import DatabaseManager
+from ...utils.logger import get_logger
+from ...utils.geo_index import retailer_locations
+from ...utils.autocomplete_index import product_autocomplete
+from ...utils.stock_availability import stock_availability
+from ...utils.medicine_cache import medicine_cache
+
+logger = get_logger(__name__)
+
+DEFAULT_CHUNK_SIZE = 1000
+MAX_REPORTED_ERRORS = 100
+
+
+@dataclass(frozen=True)
+class ImportTarget:
+    model: Any
+    schema: Type[BaseModel]
+    # Natural keys used to upsert, in order of preference. A row is matched on
+    # each key it has every column of until one finds an existing row; rows
+    # with no complete key are rejected rather than inserted again on every run.
+    keys: Tuple[Tuple[str, ...], ...]
+    pk: str
+    exclude: frozenset = frozenset()
+
+    def row_keys(self, row: Dict) -> List[Tuple[int, Tuple]]:
+        """``(key index, values)`` for every key the row has in full."""
+        return [
+            (i, tuple(row[k] for k in key))
+            for i, key in enumerate(self.keys)
+            if all(row.get(k) is not None for k in key)
+        ]
+
+    def describe_keys(self) -> str:
+        return " or ".join("+".join(key) for key in self.keys)
+
+
+IMPORT_TARGETS: Dict[str, ImportTarget] = {
+    # Most existing retailers have no GST number; shop name + street address
+    # is unique across the onboarded pharmacies.
+    "retailers": ImportTarget(
+        RetailerDbModel, RetailerImportModel, (("gst_number",), ("shop_name", "address_line1")),
+        "retailer_id", exclude=frozenset({"password_hash"}),
+    ),
+    "medicines": ImportTarget(
+        MedicineDbModel, MedicineDataCreateModel, (("name", "strength", "dosage_form"),), "medicine_id"
+    ),
+    "distributor_stock": ImportTarget(
+        DistributorStockDbModel, DistributorStockCreateModel,
+        (("distributor_id", "medicine_id", "batch_number"),), "stock_id",
+    ),
+    "retailer_medicines": ImportTarget(
+        RetailerMedicineDbModel, RetailerMedicineCreateModel,
+        (("retailer_id", "name", "batch_number"),), "retailer_medicine_id",
+    ),
+}
+
+
+# In-process indexes to rebuild once an import of that kind commits
+_INDEX_RESETS: Dict[str, Tuple[Callable[[], None], ...]] = {
+    "retailers": (retailer_locations.clear,),
+    "medicines": (medicine_cache.clear,),
+    "retailer_medicines": (product_autocomplete.clear, stock_availability.clear),
+}
+
+
+@dataclass
+class ImportReport:
+    kind: str
+    processed: int = 0
+    inserted: int = 0
+    updated: int = 0
+    failed: int = 0
+    last_row: int = 0  # last CSV data row committed; pass as skip_rows to resume
+    errors: List[Dict[str, Any]] = field(default_factory=list)
+
+    def add_error(self, row: int, messages: List[str]) -> None:
+        self.failed += 1
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append({"row": row, "errors": messages})
+
+
+def read_csv_chunks(
+    lines: Iterable[str], chunk_size: int = DEFAULT_CHUNK_SIZE, skip_rows: int = 0
+) -> Iterator[List[Tuple[int, Dict[str, Optional[str]]]]]:
+    """Yield ``(row_number, row)`` chunks; row numbers count data rows from 1."""
+    chunk = []
+    for number, row in enumerate(csv.DictReader(lines), start=1):
+        if number <= skip_rows:
+            continue
+        chunk.append((number, {k.strip(): (v.strip() or None) if v is not None else None
+                               for k, v in row.items() if k}))
+        if len(chunk) >= chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def _messages(error: ValidationError) -> List[str]:
+    return [f"{'.'.join(str(p) for p in e['loc'])}: {e['msg']}" for e in error.errors()]
+
+
+class CsvImportManager:
+    """
+    Streams CSV rows into a table chunk by chunk: validate with the API
+    schema, upsert on the target's natural key (one lookup, one batched
+    insert and one batched update per chunk) and commit, so memory stays
+    flat and an interrupted import can resume from ``last_row``.
+    """
+
+    def __init__(self, database_manager: DatabaseManager):
+        self.database_manager = database_manager
+
+    async def import_csv(
+        self, kind: str, lines: Iterable[str],
+        chunk_size: int = DEFAULT_CHUNK_SIZE, skip_rows: int = 0,
+        on_chunk: Optional[Callable[[ImportReport], None]] = None,
+    ) -> ImportReport:
+        target = IMPORT_TARGETS[kind]
+        report = ImportReport(kind=kind, last_row=skip_rows)
+
+        for chunk in read_csv_chunks(lines, chunk_size, skip_rows):
+            valid: Dict[Any, Dict] = {}
+            for number, raw in chunk:
+                try:
+                    # Blank cells are omitted so schema defaults apply
+                    fields = {k: v for k, v in raw.items() if v is not None}
+                    row = target.schema(**fields).dict(exclude=set(target.exclude), exclude_none=True)
+                except ValidationError as e:
+                    report.add_error(number, _messages(e))
+                    continue
+                row_keys = target.row_keys(row)
+                if not row_keys:
+                    report.add_error(number, [f"missing natural key: {target.describe_keys()}"])
+                    continue
+                # A key seen twice in one chunk: the later row wins
+                valid[row_keys[0]] = row
+
+            inserted, updated = await self._upsert(target, list(valid.values()))
+            await self.database_manager.commit()
+
+            report.processed += len(chunk)
+            report.inserted += inserted
+            report.updated += updated
+            report.last_row = chunk[-1][0]
+            logger.info(f"Import {kind}: {report.last_row} rows read, {report.failed} rejected")
+            if on_chunk:
+                on_chunk(report)
+
+        for reset in _INDEX_RESETS.get(kind, ()):
+            self.database_manager.after_commit(reset)
+        return report
+
+    # 🔁 Insert new rows, update rows whose natural key already exists
+    async def _upsert(self, target: ImportTarget, rows: List[Dict]) -> Tuple[int, int]:
+        existing: Dict[Tuple[int, Tuple], Any] = {}
+        for i, key in enumerate(target.keys):
+            values = [dict(zip(key, v)) for row in rows for j, v in target.row_keys(row) if j == i]
+            if not values:
+                continue
+            filters = {f"{k}__in": list({v[k] for v in values}) for k in key}
+            for obj in await self.database_manager.read(target.model, filters=filters):
+                existing[(i, tuple(getattr(obj, k) for k in key))] = getattr(obj, target.pk)
+
+        inserts, updates = [], []
+        for row in rows:
+            pk = next((existing[k] for k in target.row_keys(row) if k in existing), None)
+            if pk is None:
+                inserts.append(row)
+            else:
+                updates.append({target.pk: pk, **row})
+
+        await self.database_manager.create_many(target.model, inserts, returning=False)
+        await self.database_manager.update_many(target.model, target.pk, updates)
+        return len(inserts), len(updates)
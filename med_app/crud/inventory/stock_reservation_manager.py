@@ -0,0 +1,132 @@
+from typing import Any, Dict, List, Optional, Tuple
+
+from fastapi import HTTPException
+
+from ...models.retailer.retailer_medicine_model import RetailerMedicineDbModel
+from ...models.distributor.distributor_stock_model import DistributorStockDbModel
+from ...db.base.database_manager import DatabaseManager
+from ...utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+def requested_quantities(items: List[Any]) -> Dict[int, int]:
+    """Sum basket lines per medicine_id (a basket may repeat a medicine)."""
+    requested: Dict[int, int] = {}
+    for item in items:
+        requested[item.medicine_id] = requested.get(item.medicine_id, 0) + item.quantity
+    return requested
+
+
+def raise_for_shortages(
+    requested: Dict[int, int], available: Dict[int, int], names: Optional[Dict[int, str]] = None
+) -> None:
+    """Reject the basket with every short line listed, not just the first."""
+    shortages = []
+    for medicine_id, quantity in requested.items():
+        on_hand = available.get(medicine_id, 0)
+        if on_hand < quantity:
+            shortages.append({
+                "medicine_id": medicine_id,
+                "name": (names or {}).get(medicine_id),
+                "requested": quantity,
+                "available": on_hand,
+                "reason": "insufficient" if medicine_id in available else "not_found",
+            })
+    if shortages:
+        raise HTTPException(
+            status_code=400,
+            detail={"message": f"{len(shortages)} item(s) cannot be fulfilled", "shortages": shortages},
+        )
+
+
+def allocate_fifo(items: List[Any], lots: List[Any]) -> List[List[Tuple[Any, int]]]:
+    """
+    Spread each basket line over its medicine's lots in the order given
+    (earliest expiry first), in one pass. Returns ``[(lot, quantity), ...]``
+    per line. Callers check the basket fits first; lines the lots still
+    cannot cover are rejected the same way as ``raise_for_shortages``.
+    """
+    queues: Dict[int, List[Any]] = {}
+    available: Dict[int, int] = {}
+    for lot in lots:
+        queues.setdefault(lot.medicine_id, []).append(lot)
+        available[lot.medicine_id] = available.get(lot.medicine_id, 0) + lot.quantity
+    remaining = {lot.stock_id: lot.quantity for lot in lots}
+
+    allocations, short = [], set()
+    for item in items:
+        needed, picked = item.quantity, []
+        queue = queues.get(item.medicine_id, [])
+        while needed > 0:
+            if not queue:
+                short.add(item.medicine_id)
+                break
+            lot = queue[0]
+            take = min(needed, remaining[lot.stock_id])
+            picked.append((lot, take))
+            needed -= take
+            remaining[lot.stock_id] -= take
+            if not remaining[lot.stock_id]:
+                queue.pop(0)
+        allocations.append(picked)
+
+    if short:
+        requested = requested_quantities(items)
+        raise_for_shortages({m: requested[m] for m in short}, available)
+    return allocations
+
+
+class StockReservationManager:
+    """
+    Validates and reserves stock for a whole basket: one IN (...) read and
+    one guarded bulk decrement, however many lines the order has.
+    """
+
+    def __init__(self, database_manager: DatabaseManager):
+        self.database_manager = database_manager
+
+    # 🔍 Retailer inventory rows for a customer basket (keyed by retailer_medicine_id)
+    async def load_retailer_stock(self, retailer_id: int, requested: Dict[int, int]) -> Dict[int, RetailerMedicineDbModel]:
+        rows = await self.database_manager.read(
+            RetailerMedicineDbModel,
+            filters={"retailer_id": retailer_id, "retailer_medicine_id__in": list(requested)},
+        )
+        stock = {row.retailer_medicine_id: row for row in rows}
+        raise_for_shortages(
+            requested,
+            {pid: row.quantity for pid, row in stock.items()},
+            {pid: row.name for pid, row in stock.items()},
+        )
+        return stock
+
+    # 📦 Allocate a retailer basket across distributor lots, earliest expiry first
+    async def allocate_distributor_stock(
+        self, distributor_id: int, items: List[Any]
+    ) -> List[List[Tuple[DistributorStockDbModel, int]]]:
+        requested = requested_quantities(items)
+        # One range scan over (distributor_id, medicine_id, expiry_date) for every medicine
+        lots = await self.database_manager.read(
+            DistributorStockDbModel,
+            filters={"distributor_id": distributor_id, "medicine_id__in": list(requested), "quantity__gt": 0},
+            order_by=["medicine_id", "expiry_date", "stock_id"],
+        )
+        available: Dict[int, int] = {}
+        for lot in lots:
+            available[lot.medicine_id] = available.get(lot.medicine_id, 0) + lot.quantity
+        raise_for_shortages(requested, available)
+        return allocate_fifo(items, lots)
+
+    # 🔒 quantity = quantity - CASE key ... END for every line, only where it stays >= 0
+    async def reserve(
+        self, model: Any, key: str, quantities: Dict[int, int], filters: Optional[Dict] = None
+    ) -> None:
+        reserved = await self.database_manager.increment_many(
+            model, key, "quantity", {k: -q for k, q in quantities.items()}, filters=filters, floor=0,
+        )
+        if reserved != len(quantities):
+            logger.warning(f"Stock reservation on {model.__name__}: {reserved}/{len(quantities)} rows reserved")
+            raise HTTPException(
+                status_code=409,
+                detail="Stock was taken by a concurrent order. Please review the basket and retry.",
+            )
@@ -0,0 +1,97 @@
+from datetime import datetime
+from types import SimpleNamespace
+from typing import Dict, List, Optional
+
+from ...models.customer.order_model import OrderDbModel, OrderItemDbModel
+from ...models.retailer.retailer_model import RetailerDbModel
+from ...db.base.database_manager import DatabaseManager
+from ...exceptions.custom_exceptions import NotFoundException
+from ...config import settings
+from ...utils.invoice_generator import invoice_content_key, INVOICE_RETAILER_FIELDS
+from ...utils.invoice_jobs import InvoiceJob, InvoicePayload, invoice_render_queue, READY
+from ...utils.invoice_storage import get_invoice_storage
+from ...utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+def _month_bounds(month: str):
+    start = datetime.strptime(month, "%Y-%m")
+    end = start.replace(year=start.year + 1, month=1) if start.month == 12 else start.replace(month=start.month + 1)
+    return start, end
+
+
+class InvoicePdfManager:
+    """
+    Customer-order invoice PDFs. Rendering happens on ``invoice_render_queue``;
+    this manager only loads the invoice data (as plain, picklable snapshots),
+    derives its content key and reports job state. An invoice is rendered
+    again only when its key changes, i.e. when the data on it does.
+    """
+
+    def __init__(self, database_manager: DatabaseManager):
+        self.database_manager = database_manager
+        self.queue = invoice_render_queue
+        self.storage = get_invoice_storage()
+
+    # 📄 Ready PDF, or the render job producing it
+    async def get_invoice_pdf(self, order_id: int) -> InvoiceJob:
+        payloads = await self._payloads({"order_id": order_id})
+        if not payloads:
+            raise NotFoundException(f"Order ID {order_id} not found")
+        key = payloads[0][3]
+        job = self.queue.get(key)
+        if job is not None:
+            return job
+        if self.storage.exists(key):
+            return InvoiceJob(order_id, key, status=READY)
+        return self.queue.submit(payloads)[0]
+
+    def pop_failed(self, key: str) -> Optional[InvoiceJob]:
+        return self.queue.pop_failed(key)
+
+    # 🗓️ Month-end run: queue every invoice of a retailer's month in batches
+    async def render_month(self, retailer_id: int, month: str, regenerate: bool = False) -> Dict:
+        start, end = _month_bounds(month)
+        logger.info(f"Queueing invoice PDFs for retailer {retailer_id}, {month}")
+        payloads = await self._payloads({
+            "retailer_id": retailer_id, "order_date__gte": start, "order_date__lt": end,
+        })
+        if not regenerate:
+            payloads = [p for p in payloads if not self.storage.exists(p[3])]
+        jobs = self.queue.submit(payloads, batch_size=settings.invoice_batch_size)
+        return {
+            "retailer_id": retailer_id,
+            "month": month,
+            "queued": len(jobs),
+            "order_ids": [job.order_id for job in jobs],
+        }
+
+    async def _payloads(self, order_filters: Dict) -> List[InvoicePayload]:
+        """Orders, their items and retailers in three reads, detached from the session."""
+        orders = await self.database_manager.read(OrderDbModel, filters=order_filters, order_by="order_id")
+        if not orders:
+            return []
+        order_ids = [o.order_id for o in orders]
+        items = await self.database_manager.read(
+            OrderItemDbModel, filters={"order_id__in": order_ids}, order_by="order_item_id"
+        )
+        retailer_ids = {o.retailer_id for o in orders if o.retailer_id is not None}
+        retailers = await self.database_manager.read(
+            RetailerDbModel, filters={"retailer_id__in": list(retailer_ids)}
+        ) if retailer_ids else []
+
+        items_by_order: Dict[int, List[SimpleNamespace]] = {}
+        for item in items:
+            items_by_order.setdefault(item.order_id, []).append(
+                SimpleNamespace(medicine_id=item.medicine_id, quantity=item.quantity, price=item.price)
+            )
+        retailer_by_id = {
+            r.retailer_id: SimpleNamespace(**{f: getattr(r, f) for f in INVOICE_RETAILER_FIELDS}) for r in retailers
+        }
+        missing = SimpleNamespace(**{f: None for f in INVOICE_RETAILER_FIELDS})
+        payloads = []
+        for o in orders:
+            order_data = SimpleNamespace(order_date=o.order_date, items=items_by_order.get(o.order_id, []))
+            retailer_data = retailer_by_id.get(o.retailer_id, missing)
+            payloads.append((order_data, retailer_data, o.order_id, invoice_content_key(order_data, retailer_data, o.order_id)))
+        return payloads
@@ -0,0 +1,152 @@
+from collections import defaultdict
+from datetime import date
+from decimal import Decimal
+from typing import Any, Dict, List, Optional, Tuple
+
+from ...models.customer.order_model import OrderDbModel, OrderItemDbModel
+from ...models.retailer.retailer_order_model import RetailerOrderDbModel, RetailerOrderItemDbModel
+from ...models.report.daily_sales_rollup_model import (
+    DailySalesRollupDbModel, RETAILER_SALES, DISTRIBUTOR_SALES, ORDER_TOTALS,
+)
+from ...db.base.database_manager import DatabaseManager
+from ...utils.logger import get_logger
+from ...utils.response_cache import data_versions
+
+logger = get_logger(__name__)
+
+# scope -> (order model, item model, owner column)
+ROLLUP_SOURCES = {
+    RETAILER_SALES: (OrderDbModel, OrderItemDbModel, "retailer_id"),
+    DISTRIBUTOR_SALES: (RetailerOrderDbModel, RetailerOrderItemDbModel, "distributor_id"),
+}
+
+RollupKey = Tuple[str, int, date, str, int]  # scope, owner_id, day, status, medicine_id
+Contributions = Dict[RollupKey, Dict[str, Any]]
+
+_ORDER_METRICS = ("order_count", "sales_amount")
+_ITEM_METRICS = ("quantity", "revenue")
+
+
+def _status(value: Any) -> str:
+    return value.value if hasattr(value, "value") else str(value)
+
+
+def _money(value: Any) -> Decimal:
+    return Decimal(str(value or 0))
+
+
+class SalesRollupManager:
+    """
+    Maintains ``daily_sales_rollup`` alongside the orders it summarises.
+
+    Order managers call ``record`` / ``apply_change`` / ``remove`` with the
+    same DatabaseManager, so rollup deltas commit in the order's transaction.
+    Once that commits, the owners' dashboard data versions are bumped.
+    """
+
+    def __init__(self, database_manager: DatabaseManager):
+        self.database_manager = database_manager
+
+    # 🧮 What one order adds to the rollup
+    async def contributions(self, scope: str, order: Any, items: Optional[List[Any]] = None) -> Contributions:
+        _, item_model, owner_field = ROLLUP_SOURCES[scope]
+        owner_id = getattr(order, owner_field)
+        if owner_id is None or order.order_date is None:
+            return {}
+        if items is None:
+            items = await self.database_manager.read(item_model, filters={"order_id": order.order_id})
+
+        day, status = order.order_date.date(), _status(order.status)
+        result: Contributions = {
+            (scope, owner_id, day, status, ORDER_TOTALS): {
+                "order_count": 1,
+                "sales_amount": _money(order.total_amount),
+            }
+        }
+        for item in items:
+            row = result.setdefault(
+                (scope, owner_id, day, status, item.medicine_id), {"quantity": 0, "revenue": Decimal(0)}
+            )
+            row["quantity"] += item.quantity
+            row["revenue"] += _money(item.price) * item.quantity
+        return result
+
+    # ➕ Apply the difference between two snapshots of an order
+    async def apply_change(self, before: Contributions, after: Contributions) -> None:
+        for owner in {key[:2] for key in set(before) | set(after)}:
+            self.database_manager.after_commit(lambda owner=owner: data_versions.bump(owner))
+        for key in set(before) | set(after):
+            old, new = before.get(key, {}), after.get(key, {})
+            metrics = _ORDER_METRICS if key[4] == ORDER_TOTALS else _ITEM_METRICS
+            deltas = {m: new.get(m, 0) - old.get(m, 0) for m in metrics}
+            deltas = {m: d for m, d in deltas.items() if d}
+            if deltas:
+                await self._bump(key, deltas)
+
+    async def record(self, scope: str, order: Any, items: Optional[List[Any]] = None) -> None:
+        await self.apply_change({}, await self.contributions(scope, order, items))
+
+    async def remove(self, scope: str, order: Any) -> None:
+        await self.apply_change(await self.contributions(scope, order), {})
+
+    async def _bump(self, key: RollupKey, deltas: Dict[str, Any]) -> None:
+        scope, owner_id, day, status, medicine_id = key
+        await self.database_manager.upsert_increment(DailySalesRollupDbModel, {
+            "scope": scope, "owner_id": owner_id, "day": day,
+            "status": status, "medicine_id": medicine_id,
+        }, deltas)
+
+    # 🔁 Backfill / rebuild from the order tables
+    async def rebuild(self, scope: Optional[str] = None) -> int:
+        scopes = [scope] if scope else list(ROLLUP_SOURCES)
+        created = 0
+        for name in scopes:
+            logger.info(f"Rebuilding {name} sales rollup...")
+            await self.database_manager.delete(DailySalesRollupDbModel, filters={"scope": name})
+            rows = await self._aggregate_source(name)
+            await self.database_manager.create_many(DailySalesRollupDbModel, [
+                {
+                    "scope": name, "owner_id": owner_id, "day": day,
+                    "status": status, "medicine_id": medicine_id, **metrics,
+                }
+                for (owner_id, day, status, medicine_id), metrics in rows.items()
+            ], returning=False)
+            created += len(rows)
+        logger.info(f"✅ Sales rollup rebuilt ({created} rows).")
+        return created
+
+    async def _aggregate_source(self, scope: str) -> Dict[Tuple, Dict[str, Any]]:
+        order_model, item_model, owner_field = ROLLUP_SOURCES[scope]
+        table = order_model.__tablename__
+        rows: Dict[Tuple, Dict[str, Any]] = defaultdict(dict)
+
+        orders = await self.database_manager.aggregate(
+            order_model,
+            metrics={"order_count": ("count", None), "sales_amount": ("sum", "total_amount")},
+            filters={f"{owner_field}__ne": None},
+            group_by=[owner_field, "order_date__day", "status"],
+        )
+        for row in orders:
+            if row["order_date__day"] is None:
+                continue
+            key = (row[owner_field], date.fromisoformat(row["order_date__day"]), _status(row["status"]), ORDER_TOTALS)
+            rows[key].update(order_count=row["order_count"], sales_amount=_money(row["sales_amount"]))
+
+        items = await self.database_manager.aggregate(
+            item_model,
+            metrics={"quantity": ("sum", "quantity"), "revenue": ("sum", ("price", "quantity"))},
+            filters={f"{table}.{owner_field}__ne": None},
+            group_by=[f"{table}.{owner_field}", f"{table}.order_date__day", f"{table}.status", "medicine_id"],
+            join=(order_model, "order_id"),
+        )
+        for row in items:
+            if row[f"{table}.order_date__day"] is None:
+                continue
+            key = (
+                row[f"{table}.{owner_field}"],
+                date.fromisoformat(row[f"{table}.order_date__day"]),
+                _status(row[f"{table}.status"]),
+                row["medicine_id"],
+            )
+            rows[key].update(quantity=int(row["quantity"] or 0), revenue=_money(row["revenue"]).quantize(Decimal("0.01")))
+        return rows
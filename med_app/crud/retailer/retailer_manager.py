@@ -1,12 +1,18 @@
 import bcrypt
-from typing import List
+from datetime import date
+from typing import Any, Dict, List, Tuple
 from ...models.retailer.retailer_model import RetailerDbModel
+from ...models.retailer.retailer_medicine_model import RetailerMedicineDbModel
 from ...schemas.retailer.retailer_schema import (
-    RetailerDataCreateModel, RetailerDataUpdateModel, RetailerLoginRequest
+    RetailerDataCreateModel, RetailerDataUpdateModel, RetailerLoginRequest,
+    BasketLineRequest,
 )
 from ...db.base.database_manager import DatabaseManager
 from ...exceptions.custom_exceptions import NotFoundException
 from ...utils.logger import get_logger
+from ...utils.geo_index import GeoIndex, retailer_locations
+from ...utils.autocomplete_index import normalize
+from ...utils.stock_availability import AvailabilityIndex, Lot, stock_availability
 
 logger = get_logger(__name__)
 
@@ -20,13 +26,17 @@ class RetailerManager:
             hashed_password = bcrypt.hashpw(retailer.password_hash.encode('utf-8'), bcrypt.gensalt())
             retailer_dict = retailer.dict()
             retailer_dict["password_hash"] = hashed_password.decode("utf-8")
-            return await self.database_manager.create(RetailerDbModel, retailer_dict)
+            created = await self.database_manager.create(RetailerDbModel, retailer_dict)
+            self._locate_after_commit(created)
+            return created
         except Exception:
             logger.exception("Error creating retailer.")
             raise
 
     async def get_all_retailers(self, skip: int = 0, limit: int = 10) -> List[RetailerDbModel]:
-        return (await self.database_manager.read(RetailerDbModel))[skip:skip + limit]
+        return await self.database_manager.read(
+            RetailerDbModel, order_by="retailer_id", offset=skip, limit=limit
+        )
 
     async def get_retailer_by_id(self, retailer_id: int) -> RetailerDbModel:
         result = await self.database_manager.read(RetailerDbModel, filters={"retailer_id": retailer_id})
@@ -40,11 +50,15 @@ class RetailerManager:
             updates["password_hash"] = bcrypt.hashpw(updates["password_hash"].encode("utf-8"), bcrypt.gensalt()).decode("utf-8")
         await self.get_retailer_by_id(retailer_id)
         await self.database_manager.update(RetailerDbModel, filters={"retailer_id": retailer_id}, updates=updates)
-        return await self.get_retailer_by_id(retailer_id)
+        updated = await self.get_retailer_by_id(retailer_id)
+        if "gps_latitude" in updates or "gps_longitude" in updates:
+            self._locate_after_commit(updated)
+        return updated
 
     async def delete_retailer(self, retailer_id: int) -> bool:
         await self.get_retailer_by_id(retailer_id)
         await self.database_manager.delete(RetailerDbModel, filters={"retailer_id": retailer_id})
+        self.database_manager.after_commit(lambda: retailer_locations.remove(retailer_id))
         return True
 
     async def login(self, credentials: RetailerLoginRequest) -> RetailerDbModel:
@@ -62,3 +76,115 @@ class RetailerManager:
         if not result:
             raise NotFoundException(f"No retailers found in ZIP code {zip_code}.")
         return result
+
+    # 📍 Retailers within radius_km of a point, nearest first
+    async def get_nearby_retailers(
+        self, lat: float, lon: float, radius_km: float = 5.0, limit: int = 20
+    ) -> List[Tuple[RetailerDbModel, float]]:
+        index = await self._location_index()
+        hits = index.nearby(lat, lon, radius_km, limit)
+        if not hits:
+            return []
+        retailers = await self.database_manager.read(
+            RetailerDbModel, filters={"retailer_id__in": [retailer_id for retailer_id, _ in hits]}
+        )
+        by_id: Dict[int, RetailerDbModel] = {r.retailer_id: r for r in retailers}
+        return [(by_id[retailer_id], distance) for retailer_id, distance in hits if retailer_id in by_id]
+
+    # 🧺 Nearest retailers able to supply a whole basket
+    async def find_basket_suppliers(
+        self, lat: float, lon: float, items: List[BasketLineRequest],
+        radius_km: float = 5.0, limit: int = 10,
+    ) -> List[Dict[str, Any]]:
+        # Merge repeated names so one lot is never counted twice
+        basket: Dict[str, Dict[str, Any]] = {}
+        for line in items:
+            entry = basket.setdefault(normalize(line.name), {"name": line.name, "quantity": 0})
+            entry["quantity"] += line.quantity
+
+        locations = await self._location_index()
+        stock = await self._stock_index()
+        today = date.today()
+
+        # Intersect the per-medicine availability sets, smallest first
+        suppliers = {key: stock.suppliers(key, entry["quantity"], today) for key, entry in basket.items()}
+        candidates = None
+        for key in sorted(suppliers, key=lambda k: len(suppliers[k])):
+            candidates = set(suppliers[key]) if candidates is None else candidates & suppliers[key].keys()
+            if not candidates:
+                return []
+        ranked = locations.nearby(lat, lon, radius_km, among=candidates)
+
+        # The index can lag behind orders: confirm lots in the DB, a page at a time
+        matches = []
+        for start in range(0, len(ranked), limit):
+            chunk = ranked[start:start + limit]
+            lot_ids = [suppliers[key][retailer_id].retailer_medicine_id for retailer_id, _ in chunk for key in basket]
+            fresh = {
+                p.retailer_medicine_id: p
+                for p in await self.database_manager.read(
+                    RetailerMedicineDbModel, filters={"retailer_medicine_id__in": lot_ids}
+                )
+            }
+            for lot_id in lot_ids:
+                if lot_id in fresh:
+                    stock_availability.upsert(Lot.of(fresh[lot_id]))
+                else:
+                    stock_availability.remove(lot_id)
+
+            for retailer_id, distance in chunk:
+                lines = []
+                for key, entry in basket.items():
+                    product = fresh.get(suppliers[key][retailer_id].retailer_medicine_id)
+                    if product is None or not Lot.of(product).can_supply(entry["quantity"], today):
+                        break
+                    lines.append({
+                        "name": product.name,
+                        "retailer_medicine_id": product.retailer_medicine_id,
+                        "requested_quantity": entry["quantity"],
+                        "available_quantity": product.quantity,
+                        "price": product.price,
+                        "expiry_date": product.expiry_date,
+                    })
+                else:
+                    matches.append({
+                        "retailer_id": retailer_id,
+                        "distance_km": round(distance, 3),
+                        "items": lines,
+                        "basket_total": sum(line["price"] * line["requested_quantity"] for line in lines),
+                    })
+            if len(matches) >= limit:
+                break
+        matches = matches[:limit]
+        if not matches:
+            return []
+
+        retailers = await self.database_manager.read(
+            RetailerDbModel, filters={"retailer_id__in": [m["retailer_id"] for m in matches]}
+        )
+        by_id = {r.retailer_id: r for r in retailers}
+        return [{**m, "retailer": by_id[m["retailer_id"]]} for m in matches if m["retailer_id"] in by_id]
+
+    async def _stock_index(self) -> AvailabilityIndex:
+        index = stock_availability.get()
+        if index is None:
+            logger.info("Building retailer stock availability index")
+            products = await self.database_manager.read(
+                RetailerMedicineDbModel, filters={"quantity__gt": 0, "expiry_date__gte": date.today()}
+            )
+            index = stock_availability.load(products)
+        return index
+
+    async def _location_index(self) -> GeoIndex:
+        index = retailer_locations.get()
+        if index is None:
+            logger.info("Building retailer location index")
+            retailers = await self.database_manager.read(
+                RetailerDbModel, filters={"gps_latitude__ne": None, "gps_longitude__ne": None}
+            )
+            index = retailer_locations.load(retailers)
+        return index
+
+    def _locate_after_commit(self, retailer: RetailerDbModel) -> None:
+        args = (retailer.retailer_id, retailer.gps_latitude, retailer.gps_longitude)
+        self.database_manager.after_commit(lambda: retailer_locations.upsert(*args))
@@ -1,4 +1,4 @@
-from typing import List, Optional
+from typing import Dict, List, Optional
 from sqlalchemy import select
 from ...models.retailer.retailer_medicine_model import RetailerMedicineDbModel
 from ...schemas.retailer.retailer_medicine_schema import (
@@ -6,8 +6,11 @@ from ...schemas.retailer.retailer_medicine_schema import (
     RetailerMedicineUpdateModel,
 )
 from ...db.base.database_manager import DatabaseManager
+from ...db.base.pagination import Page
 from ...exceptions.custom_exceptions import NotFoundException
 from ...utils.logger import get_logger
+from ...utils.autocomplete_index import product_autocomplete
+from ...utils.stock_availability import Lot, stock_availability
 
 logger = get_logger(__name__)
 
@@ -21,6 +24,7 @@ class RetailerMedicineManager:
         logger.info(f"Creating new retailer medicine for retailer {data.retailer_id}")
         try:
             created = await self.database_manager.create(RetailerMedicineDbModel, data.dict())
+            self._index_after_commit(created)
             logger.info(f"Product created successfully (ID: {created.retailer_medicine_id})")
             return created
         except Exception:
@@ -36,26 +40,29 @@ class RetailerMedicineManager:
         sort_by: Optional[str] = None,
         skip: int = 0,
         limit: int = 10,
-    ) -> List[RetailerMedicineDbModel]:
+        cursor: Optional[str] = None,
+    ) -> Page:
         logger.info(f"Fetching products for retailer {retailer_id}")
         try:
             filters = {"retailer_id": retailer_id}
             if category:
                 filters["category"] = category
 
-            products = await self.database_manager.read(RetailerMedicineDbModel, filters=filters)
-
             # Apply search filter
             if search:
-                products = [p for p in products if search.lower() in p.name.lower()]
+                filters["name__icontains"] = search
 
-            # Apply sorting
+            # Apply sorting (primary key keeps pages stable between ties)
+            order_by = ["retailer_medicine_id"]
             if sort_by == "price":
-                products.sort(key=lambda x: x.price)
+                order_by.insert(0, "price")
             elif sort_by == "expiry":
-                products.sort(key=lambda x: x.expiry_date)
+                order_by.insert(0, "expiry_date")
 
-            return products[skip: skip + limit]
+            return await self.database_manager.read_page(
+                RetailerMedicineDbModel, filters=filters, order_by=order_by,
+                limit=limit, cursor=cursor, offset=skip,
+            )
         except Exception:
             logger.exception("Error fetching products list.")
             raise
@@ -83,7 +90,12 @@ class RetailerMedicineManager:
             filters={"retailer_medicine_id": product_id, "retailer_id": retailer_id},
             updates=updates,
         )
-        return await self.get_product_by_id(retailer_id, product_id)
+        updated = await self.get_product_by_id(retailer_id, product_id)
+        if "name" in updates or "generic_name" in updates:
+            self._index_after_commit(updated)
+        else:
+            self._stock_after_commit(updated)
+        return updated
 
     # 🗑️ Delete product
     async def delete_product(self, retailer_id: int, product_id: int) -> bool:
@@ -92,6 +104,8 @@ class RetailerMedicineManager:
         await self.database_manager.delete(
             RetailerMedicineDbModel, filters={"retailer_medicine_id": product_id, "retailer_id": retailer_id}
         )
+        self.database_manager.after_commit(lambda: product_autocomplete.remove(retailer_id, product_id))
+        self.database_manager.after_commit(lambda: stock_availability.remove(product_id))
         return True
 
     # 📦 Update stock quantity
@@ -103,18 +117,37 @@ class RetailerMedicineManager:
             filters={"retailer_medicine_id": product_id, "retailer_id": retailer_id},
             updates={"quantity": quantity},
         )
-        return await self.get_product_by_id(retailer_id, product_id)
+        updated = await self.get_product_by_id(retailer_id, product_id)
+        self._stock_after_commit(updated)
+        return updated
 
     # ⚠️ Low stock products
     async def get_low_stock_products(self, retailer_id: int, threshold: int = 10):
-        products = await self.database_manager.read(
-            RetailerMedicineDbModel, filters={"retailer_id": retailer_id}
+        return await self.database_manager.read(
+            RetailerMedicineDbModel,
+            filters={"retailer_id": retailer_id, "quantity__gt": 0, "quantity__lt": threshold},
         )
-        return [p for p in products if hasattr(p, "quantity") and 0 < p.quantity < threshold]
 
     # ❌ No stock products
     async def get_no_stock_products(self, retailer_id: int):
-        products = await self.database_manager.read(
-            RetailerMedicineDbModel, filters={"retailer_id": retailer_id}
+        return await self.database_manager.read(
+            RetailerMedicineDbModel, filters={"retailer_id": retailer_id, "quantity": 0}
         )
-        return [p for p in products if hasattr(p, "quantity") and p.quantity == 0]
+
+    # 🔤 Typo-tolerant name suggestions (in-memory trigram index)
+    async def autocomplete(self, retailer_id: int, q: str, limit: int = 10) -> List[Dict]:
+        index = product_autocomplete.get(retailer_id)
+        if index is None:
+            logger.info(f"Building autocomplete index for retailer {retailer_id}")
+            products = await self.database_manager.read(RetailerMedicineDbModel, filters={"retailer_id": retailer_id})
+            index = product_autocomplete.load(retailer_id, products)
+        return index.suggest(q, limit)
+
+    def _index_after_commit(self, product: RetailerMedicineDbModel) -> None:
+        args = (product.retailer_id, product.retailer_medicine_id, product.name, product.generic_name)
+        self.database_manager.after_commit(lambda: product_autocomplete.upsert(*args))
+        self._stock_after_commit(product)
+
+    def _stock_after_commit(self, product: RetailerMedicineDbModel) -> None:
+        lot = Lot.of(product)
+        self.database_manager.after_commit(lambda: stock_availability.upsert(lot))
@@ -1,8 +1,9 @@
 from datetime import datetime
-from typing import List, Optional
+from typing import Optional
 from ...models.retailer.retailer_notification_model import RetailerNotificationDbModel
 from ...schemas.retailer.retailer_notification_schema import RetailerNotificationCreateModel
 from ...db.base.database_manager import DatabaseManager
+from ...db.base.pagination import Page
 from ...exceptions.custom_exceptions import NotFoundException
 from ...utils.logger import get_logger
 
@@ -21,11 +22,16 @@ class RetailerNotificationManager:
         return await self.database_manager.create(RetailerNotificationDbModel, notif_dict)
 
     # 📋 List notifications (optionally filtered by retailer)
-    async def list_notifications(self, retailer_id: Optional[int] = None) -> List[RetailerNotificationDbModel]:
+    async def list_notifications(
+        self, retailer_id: Optional[int] = None, limit: Optional[int] = None, cursor: Optional[str] = None
+    ) -> Page:
         filters = {}
         if retailer_id:
             filters["retailer_id"] = retailer_id
-        return await self.database_manager.read(RetailerNotificationDbModel, filters=filters)
+        # Newest first; id breaks ties so the cursor position is unique
+        return await self.database_manager.read_page(
+            RetailerNotificationDbModel, filters=filters, order_by=["-created_at", "-id"], limit=limit, cursor=cursor
+        )
 
     # ✅ Mark notification as read
     async def mark_as_read(self, notification_id: int):
@@ -1,67 +1,40 @@
 from decimal import Decimal
-from typing import List, Optional
+from typing import Dict, List, Optional
 from datetime import datetime
 
 from fastapi import HTTPException
-from sqlalchemy import select
-from ...models.retailer.retailer_order_model import RetailerOrderDbModel, RetailerOrderItemDbModel
+from ...models.retailer.retailer_order_model import (
+    RetailerOrderDbModel, RetailerOrderItemDbModel, RetailerOrderAllocationDbModel,
+)
 from ...schemas.retailer.retailer_order_schema import RetailerOrderCreateModel
 from ...db.base.database_manager import DatabaseManager
+from ...db.base.pagination import Page
 from ...exceptions.custom_exceptions import NotFoundException
 from ...utils.logger import get_logger
 from sqlalchemy.exc import SQLAlchemyError
 from ...models.distributor.distributor_stock_model import DistributorStockDbModel
+from ...models.report.daily_sales_rollup_model import DISTRIBUTOR_SALES
+from ..report.sales_rollup_manager import SalesRollupManager
+from ..inventory.stock_reservation_manager import StockReservationManager
 
 logger = get_logger(__name__)
 
 class RetailerOrderManager:
     def __init__(self, database_manager: DatabaseManager):
         self.database_manager = database_manager
+        self.sales_rollup = SalesRollupManager(database_manager)
+        self.stock = StockReservationManager(database_manager)
 
     # 🧾 Create new order
     async def create_order(self, data: RetailerOrderCreateModel) -> RetailerOrderDbModel:
         logger.info(f"Creating new order for retailer {data.retailer_id} to distributor {data.distributor_id}")
 
-        session = self.database_manager.get_session()
-        async with session.begin():
+        async with self.database_manager.transaction() as session:
             try:
-                total_amount = Decimal(0)
-                order_items_data = []
-
-                # 🔍 Step 1: Validate distributor stock (use FIFO: earliest expiry first)
-                for item in data.items:
-                    stmt = select(DistributorStockDbModel).where(
-                        DistributorStockDbModel.distributor_id == data.distributor_id,
-                        DistributorStockDbModel.medicine_id == item.medicine_id,
-                        DistributorStockDbModel.quantity > 0
-                    ).order_by(DistributorStockDbModel.expiry_date)  # FIFO
-
-                    result = await session.execute(stmt)
-                    stock_item = result.scalars().first()
-
-                    if not stock_item:
-                        raise HTTPException(
-                            status_code=404,
-                            detail=f"Medicine ID {item.medicine_id} not found or out of stock in distributor inventory"
-                        )
-
-                    if stock_item.quantity < item.quantity:
-                        raise HTTPException(
-                            status_code=400,
-                            detail=f"Insufficient stock for medicine {item.medicine_id}. "
-                                   f"Available: {stock_item.quantity}, Requested: {item.quantity}"
-                        )
-
-                    item_total = Decimal(item.price) * item.quantity
-                    total_amount += item_total
-
-                    order_items_data.append({
-                        "medicine_id": item.medicine_id,
-                        "quantity": item.quantity,
-                        "price": item.price,
-                        "stock_id": stock_item.stock_id,
-                        "new_stock": stock_item.quantity - item.quantity
-                    })
+                # 🔍 Step 1: Allocate every line across distributor lots (FIFO: earliest expiry first)
+                allocations = await self.stock.allocate_distributor_stock(data.distributor_id, data.items)
+
+                total_amount = sum((Decimal(item.price) * item.quantity for item in data.items), Decimal(0))
 
                 # ✅ Step 2: Create order
                 order_data = {
@@ -71,23 +44,39 @@ class RetailerOrderManager:
                 }
                 order = await self.database_manager.create(RetailerOrderDbModel, order_data)
 
-                # ✅ Step 3: Create order items & update distributor stock
-                for item_data in order_items_data:
-                    await self.database_manager.create(
-                        RetailerOrderItemDbModel,
+                # ✅ Step 3: Create order items and their lot allocations in two batches
+                created_items = await self.database_manager.create_many(
+                    RetailerOrderItemDbModel,
+                    [
                         {
                             "order_id": order.order_id,
-                            "medicine_id": item_data["medicine_id"],
-                            "quantity": item_data["quantity"],
-                            "price": item_data["price"]
+                            "medicine_id": item.medicine_id,
+                            "quantity": item.quantity,
+                            "price": item.price
                         }
-                    )
-
-                    await self.database_manager.update(
-                        DistributorStockDbModel,
-                        filters={"stock_id": item_data["stock_id"]},
-                        updates={"quantity": item_data["new_stock"]}
-                    )
+                        for item in data.items
+                    ],
+                )
+                allocation_rows = []
+                reserved: Dict[int, int] = {}
+                for created_item, lots in zip(created_items, allocations):
+                    for lot, quantity in lots:
+                        allocation_rows.append({
+                            "order_item_id": created_item.order_item_id,
+                            "stock_id": lot.stock_id,
+                            "batch_number": lot.batch_number,
+                            "expiry_date": lot.expiry_date,
+                            "quantity": quantity,
+                        })
+                        reserved[lot.stock_id] = reserved.get(lot.stock_id, 0) + quantity
+                await self.database_manager.create_many(RetailerOrderAllocationDbModel, allocation_rows, returning=False)
+
+                # ✅ Reserve every touched lot in one guarded statement
+
+                await self.stock.reserve(DistributorStockDbModel, "stock_id", reserved)
+
+                # ✅ Step 4: Keep the dashboard rollup in the same transaction
+                await self.sales_rollup.record(DISTRIBUTOR_SALES, order, created_items)
 
                 logger.info(f"✅ Retailer order {order.order_id} created and stock updated.")
                 return await self.get_order_by_id(order.order_id)
@@ -107,8 +96,7 @@ class RetailerOrderManager:
         if not order:
             raise NotFoundException(f"Order ID {order_id} not found.")
         order_obj = order[0]
-        items = await self.database_manager.read(RetailerOrderItemDbModel, filters={"order_id": order_id})
-        order_obj.items = items
+        await self._attach_items([order_obj])
         return order_obj
 
     # 📋 List orders
@@ -118,8 +106,10 @@ class RetailerOrderManager:
         distributor_id: Optional[int] = None,
         status: Optional[str] = None,
         start_date: Optional[datetime] = None,
-        end_date: Optional[datetime] = None
-    ) -> List[RetailerOrderDbModel]:
+        end_date: Optional[datetime] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+    ) -> Page:
         filters = {}
         if retailer_id is not None:
             filters["retailer_id"] = retailer_id
@@ -128,29 +118,66 @@ class RetailerOrderManager:
         if status:
             filters["status"] = status
 
-        orders = await self.database_manager.read(RetailerOrderDbModel, filters=filters)
-
-        # Date range filter
+        # Date range filter (applied in the query so pages stay full)
         if start_date:
-            orders = [o for o in orders if o.order_date >= start_date]
+            filters["order_date__gte"] = start_date
         if end_date:
-            orders = [o for o in orders if o.order_date <= end_date]
-
-        # Add items to each order
+            filters["order_date__lte"] = end_date
+
+        page = await self.database_manager.read_page(
+            RetailerOrderDbModel, filters=filters,
+            order_by=["order_date", "order_id"], limit=limit, cursor=cursor,
+        )
+
+        await self._attach_items(page.items)
+        return page
+
+    # 📦 Load items (and their lot allocations) for a batch of orders with one IN (...) query each
+    async def _attach_items(self, orders: List[RetailerOrderDbModel]) -> None:
+        if not orders:
+            return
+        items = await self.database_manager.read(
+            RetailerOrderItemDbModel,
+            filters={"order_id__in": [order.order_id for order in orders]},
+            order_by=["order_id", "order_item_id"],
+        )
+        allocations = await self.database_manager.read(
+            RetailerOrderAllocationDbModel,
+            filters={"order_item_id__in": [item.order_item_id for item in items]},
+            order_by=["order_item_id", "allocation_id"],
+        ) if items else []
+        allocations_by_item = {item.order_item_id: [] for item in items}
+        for allocation in allocations:
+            allocations_by_item[allocation.order_item_id].append(allocation)
+
+        items_by_order = {order.order_id: [] for order in orders}
+        for item in items:
+            item.allocations = allocations_by_item[item.order_item_id]
+            items_by_order[item.order_id].append(item)
         for order in orders:
-            order.items = await self.database_manager.read(RetailerOrderItemDbModel, filters={"order_id": order.order_id})
-
-        return orders
+            order.items = items_by_order[order.order_id]
 
     # ✏️ Update order status
     async def update_order_status(self, order_id: int, status: str) -> RetailerOrderDbModel:
-        await self.get_order_by_id(order_id)
+        order = await self.get_order_by_id(order_id)
+        before = await self.sales_rollup.contributions(DISTRIBUTOR_SALES, order, order.items)
         await self.database_manager.update(RetailerOrderDbModel, filters={"order_id": order_id}, updates={"status": status})
-        return await self.get_order_by_id(order_id)
+        updated_order = await self.get_order_by_id(order_id)
+        after = await self.sales_rollup.contributions(DISTRIBUTOR_SALES, updated_order, updated_order.items)
+        await self.sales_rollup.apply_change(before, after)
+        return updated_order
 
     # 🗑️ Delete order
     async def delete_order(self, order_id: int) -> bool:
-        await self.get_order_by_id(order_id)
+        order = await self.get_order_by_id(order_id)
+        await self.sales_rollup.apply_change(
+            await self.sales_rollup.contributions(DISTRIBUTOR_SALES, order, order.items), {}
+        )
+        if order.items:
+            await self.database_manager.delete(
+                RetailerOrderAllocationDbModel,
+                filters={"order_item_id__in": [item.order_item_id for item in order.items]},
+            )
         await self.database_manager.delete(RetailerOrderItemDbModel, filters={"order_id": order_id})
         await self.database_manager.delete(RetailerOrderDbModel, filters={"order_id": order_id})
         return True
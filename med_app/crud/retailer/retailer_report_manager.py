@@ -1,34 +1,49 @@
 from datetime import datetime, timedelta
 from typing import Dict, List
-import csv
-import io
-from ...models.customer.order_model import OrderDbModel, OrderItemDbModel
+from ...models.report.daily_sales_rollup_model import DailySalesRollupDbModel, RETAILER_SALES, ORDER_TOTALS
+from ...models.customer.order_model import OrderDbModel
 from ...db.base.database_manager import DatabaseManager
 from ...exceptions.custom_exceptions import NotFoundException
 from ...utils.logger import get_logger
+from ...utils.report_export import ReportExport, csv_chunks, iterate
+from ...utils.report_pdf import report_document, report_pdf_cache
 
 logger = get_logger(__name__)
 
+ORDER_EXPORT_FIELDS = ["order_id", "order_date", "customer_id", "status", "total_amount"]
+
 
 class RetailerReportManager:
     def __init__(self, database_manager: DatabaseManager):
         self.database_manager = database_manager
 
+    def _rollup_filters(self, retailer_id: int, **extra) -> Dict:
+        return {"scope": RETAILER_SALES, "owner_id": retailer_id, **extra}
+
     # 🏠 Dashboard Summary (Retailer-based)
     async def get_dashboard_summary(self, retailer_id: int) -> Dict:
         logger.info(f"Generating dashboard summary for retailer {retailer_id}...")
-        orders = await self.database_manager.read(OrderDbModel, filters={"retailer_id": retailer_id})
-
-        total_orders = len(orders)
-        total_sales = sum(float(o.total_amount or 0) for o in orders)
+        totals = await self.database_manager.aggregate(
+            DailySalesRollupDbModel,
+            metrics={"total_sales": ("sum", "sales_amount"), "total_orders": ("sum", "order_count")},
+            filters=self._rollup_filters(retailer_id, medicine_id=ORDER_TOTALS),
+        )
+        total_sales = float(totals[0]["total_sales"] or 0) if totals else 0.0
+        total_orders = int(totals[0]["total_orders"] or 0) if totals else 0
 
         # Sales comparison (today vs yesterday)
         today = datetime.utcnow().date()
         yesterday = today - timedelta(days=1)
 
-        today_sales = sum(float(o.total_amount or 0) for o in orders if o.order_date.date() == today)
-        yesterday_sales = sum(float(o.total_amount or 0) for o in orders if o.order_date.date() == yesterday)
-
+        daily = await self.database_manager.aggregate(
+            DailySalesRollupDbModel,
+            metrics={"sales": ("sum", "sales_amount")},
+            filters=self._rollup_filters(retailer_id, medicine_id=ORDER_TOTALS, day__gte=yesterday),
+            group_by=["day__day"],
+        )
+        sales_by_day = {row["day__day"]: float(row["sales"] or 0) for row in daily}
+        today_sales = sales_by_day.get(today.isoformat(), 0)
+        yesterday_sales = sales_by_day.get(yesterday.isoformat(), 0)
         sales_change = ((today_sales - yesterday_sales) / yesterday_sales * 100) if yesterday_sales > 0 else 0
 
         return {
@@ -41,26 +56,33 @@ class RetailerReportManager:
     # 💰 Sales Analytics (Retailer-based)
     async def get_sales_report(self, retailer_id: int, period: str = "daily") -> List[Dict]:
         logger.info(f"Generating {period} sales report for retailer {retailer_id}...")
-        orders = await self.database_manager.read(OrderDbModel, filters={"retailer_id": retailer_id})
-        report = {}
-
-        for o in orders:
-            key = o.order_date.strftime("%Y-%m-%d") if period == "daily" else o.order_date.strftime("%Y-%m")
-            report.setdefault(key, 0)
-            report[key] += float(o.total_amount or 0)
-
-        return [{"period": k, "sales": round(v, 2)} for k, v in sorted(report.items())]
+        bucket = "day__day" if period == "daily" else "day__month"
+        rows = await self.database_manager.aggregate(
+            DailySalesRollupDbModel,
+            metrics={"sales": ("sum", "sales_amount"), "orders": ("sum", "order_count")},
+            filters=self._rollup_filters(retailer_id, medicine_id=ORDER_TOTALS),
+            group_by=[bucket],
+            order_by=bucket,
+        )
+        # Periods whose orders were all deleted keep zeroed rollup rows
+        return [
+            {"period": row[bucket], "sales": round(float(row["sales"] or 0), 2)}
+            for row in rows if row["orders"]
+        ]
 
     # 📦 Orders Analytics (Retailer-based)
     async def get_orders_report(self, retailer_id: int) -> Dict:
         logger.info(f"Generating order analytics for retailer {retailer_id}...")
-        orders = await self.database_manager.read(OrderDbModel, filters={"retailer_id": retailer_id})
-        status_count = {}
-
-        for o in orders:
-            status_count[o.status.value] = status_count.get(o.status.value, 0) + 1
-
-        total_orders = len(orders)
+        rows = await self.database_manager.aggregate(
+            DailySalesRollupDbModel,
+            metrics={"count": ("sum", "order_count")},
+            filters=self._rollup_filters(retailer_id, medicine_id=ORDER_TOTALS),
+            group_by=["status"],
+            order_by="status",
+        )
+        status_count = {row["status"]: int(row["count"]) for row in rows if row["count"]}
+
+        total_orders = sum(status_count.values())
         completed = status_count.get("Delivered", 0)
         cancelled = status_count.get("Cancelled", 0)
 
@@ -75,66 +97,59 @@ class RetailerReportManager:
     # 💊 Product Performance (Retailer-based)
     async def get_product_report(self, retailer_id: int) -> List[Dict]:
         logger.info(f"Generating product performance for retailer {retailer_id}...")
-
-        # Get all orders for this retailer
-        orders = await self.database_manager.read(OrderDbModel, filters={"retailer_id": retailer_id})
-        order_ids = [o.order_id for o in orders]
-        if not order_ids:
-            return []
-
-        # Fetch all order items belonging to these orders
-        all_items = []
-        for oid in order_ids:
-            items = await self.database_manager.read(OrderItemDbModel, filters={"order_id": oid})
-            all_items.extend(items)
-
-        performance = {}
-        for item in all_items:
-            med_id = item.medicine_id
-            if med_id not in performance:
-                performance[med_id] = {"medicine_id": med_id, "total_quantity": 0, "total_revenue": 0.0}
-            performance[med_id]["total_quantity"] += item.quantity
-            performance[med_id]["total_revenue"] += float(item.price or 0) * item.quantity
-
-        return sorted(performance.values(), key=lambda x: x["total_revenue"], reverse=True)
+        rows = await self.database_manager.aggregate(
+            DailySalesRollupDbModel,
+            metrics={"total_quantity": ("sum", "quantity"), "total_revenue": ("sum", "revenue")},
+            filters=self._rollup_filters(retailer_id, medicine_id__gt=ORDER_TOTALS),
+            group_by=["medicine_id"],
+            order_by=["-total_revenue", "medicine_id"],
+        )
+        return [
+            {
+                "medicine_id": row["medicine_id"],
+                "total_quantity": int(row["total_quantity"] or 0),
+                "total_revenue": round(float(row["total_revenue"] or 0), 2),
+            }
+            for row in rows if row["total_quantity"] or row["total_revenue"]
+        ]
 
     # 📁 Export Reports (Retailer-based)
-    async def export_report(self, retailer_id: int, report_type: str = "sales", format: str = "csv") -> Dict:
+    async def export_report(self, retailer_id: int, report_type: str = "sales", format: str = "csv") -> ReportExport:
+        """
+        Sales and product reports are small aggregates; the orders CSV
+        streams every order of the retailer straight from a database cursor.
+        PDFs render the aggregated reports (the orders PDF is the status
+        breakdown) in the process pool, cached until the data changes.
+        """
         logger.info(f"Exporting {report_type} report for retailer {retailer_id} as {format}")
-
-        # Select report data
-        if report_type == "sales":
-            data = await self.get_sales_report(retailer_id)
-        elif report_type == "orders":
-            data = await self.get_orders_report(retailer_id)
-        elif report_type == "products":
-            data = await self.get_product_report(retailer_id)
-        else:
+        if report_type not in ("sales", "orders", "products"):
             raise NotFoundException("Invalid report type")
+        name = f"{report_type}_report_retailer_{retailer_id}"
 
-        # Export as CSV
         if format == "csv":
-            output = io.StringIO()
-            if isinstance(data, list) and len(data) > 0:
-                keys = data[0].keys()
-                writer = csv.DictWriter(output, fieldnames=keys)
-                writer.writeheader()
-                writer.writerows(data)
-            elif isinstance(data, dict):
-                writer = csv.writer(output)
-                for k, v in data.items():
-                    writer.writerow([k, v])
-            return {
-                "filename": f"{report_type}_report_retailer_{retailer_id}.csv",
-                "content": output.getvalue(),
-            }
+            if report_type == "sales":
+                fields, rows = ["period", "sales"], iterate(await self.get_sales_report(retailer_id))
+            elif report_type == "products":
+                fields = ["medicine_id", "total_quantity", "total_revenue"]
+                rows = iterate(await self.get_product_report(retailer_id))
+            else:
+                fields = ORDER_EXPORT_FIELDS
+                rows = self.database_manager.stream(
+                    OrderDbModel, filters={"retailer_id": retailer_id},
+                    order_by=["order_date", "order_id"], columns=fields,
+                )
+            return ReportExport(f"{name}.csv", "text/csv", csv_chunks(fields, rows))
 
-        # Placeholder PDF export
         elif format == "pdf":
-            return {
-                "filename": f"{report_type}_report_retailer_{retailer_id}.pdf",
-                "content": f"PDF report for retailer {retailer_id}",
-            }
+            if report_type == "sales":
+                data = await self.get_sales_report(retailer_id)
+            elif report_type == "orders":
+                data = await self.get_orders_report(retailer_id)
+            else:
+                data = await self.get_product_report(retailer_id)
+            document = report_document(report_type, f"Retailer #{retailer_id}", data)
+            pdf = await report_pdf_cache.get_or_render(("retailer", retailer_id, report_type), document)
+            return ReportExport(f"{name}.pdf", "application/pdf", iterate([pdf]))
 
         else:
             raise NotFoundException("Unsupported export format")
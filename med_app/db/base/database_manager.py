@@ -1,41 +1,166 @@
 # app/database/base/database_manager.py
 
-from ..base.database_factory import get_database
+from contextlib import asynccontextmanager
+from ..base.engine_registry import engine_registry
 from ..base.idatabase import IDatabase
-from typing import Any, Dict, List, Optional
+from ..base.pagination import Page, decode_cursor, encode_cursor, row_value
+from ..base.query_spec import Join, Metrics, OrderBy, parse_order_by
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Sequence
 
 class DatabaseManager:
+    """
+    Request-scoped unit of work.
+
+    ``connect`` checks one session out of the shared pool and every CRUD
+    wrapper runs inside it, so all calls made while serving a request share a
+    single transaction. ``commit`` / ``rollback`` end it exactly once.
+    """
+
     def __init__(self, db_type: str):
-        self.db: IDatabase = get_database(db_type)
+        self.db_type = db_type
+        self.db: Optional[IDatabase] = None
         self._session = None  # for SQL: session; for Mongo: db handle
+        self._after_commit: List[Callable[[], None]] = []
 
     async def connect(self) -> None:
-        await self.db.connect()
+        # Reuse the shared engine/pool; only the session is per-request.
+        self.db = await engine_registry.get(self.db_type)
         self._session = self.db.get_session()
 
     async def disconnect(self) -> None:
-        await self.db.disconnect()
+        if self._session is not None:
+            await self.db.close_session(self._session)
         self._session = None
 
     def get_session(self) -> Any:
-        if not self._session:
+        if self._session is None:
             raise RuntimeError("Database session not initialized. Did you forget to connect?")
         return self._session
 
+    async def commit(self) -> None:
+        await self.db.commit(self.get_session())
+        callbacks, self._after_commit = self._after_commit, []
+        for callback in callbacks:
+            callback()
+
+    async def rollback(self) -> None:
+        self._after_commit = []
+        await self.db.rollback(self.get_session())
+
+    def after_commit(self, callback: Callable[[], None]) -> None:
+        """
+        Run ``callback`` once the request's unit of work commits (dropped on
+        rollback). Used to keep in-process indexes/caches in step with the DB.
+        """
+        self._after_commit.append(callback)
+
+    @asynccontextmanager
+    async def transaction(self) -> AsyncIterator[Any]:
+        """
+        Group CRUD calls that must succeed or fail together. Everything done in
+        the request so far is rolled back if the block raises; on success the
+        work stays pending until the request-level commit.
+        """
+        session = self.get_session()
+        try:
+            yield session
+        except BaseException:
+            await self.rollback()
+            raise
+
     # CRUD wrappers
     async def create(self, table_or_collection: Any, data: Dict) -> Any:
-        return await self.db.create(table_or_collection, data)
+        return await self.db.create(table_or_collection, data, session=self._session)
+
+    async def create_many(self, table_or_collection: Any, rows: List[Dict], returning: bool = True) -> List[Any]:
+        return await self.db.create_many(table_or_collection, rows, returning=returning, session=self._session)
 
     async def read(
-        self, table_or_collection: Any, filters: Optional[Dict] = None) -> List[Any]:
-        return await self.db.read(table_or_collection, filters)
+        self, table_or_collection: Any, filters: Optional[Dict] = None,
+        order_by: OrderBy = None, limit: Optional[int] = None,
+        offset: Optional[int] = None, after: Optional[Sequence[Any]] = None) -> List[Any]:
+        return await self.db.read(
+            table_or_collection, filters, session=self._session,
+            order_by=order_by, limit=limit, offset=offset, after=after,
+        )
+
+    async def read_page(
+        self, table_or_collection: Any, filters: Optional[Dict] = None,
+        order_by: OrderBy = None, limit: Optional[int] = None,
+        cursor: Optional[str] = None, offset: int = 0) -> Page:
+        """
+        Keyset-paginated read. ``order_by`` must end with the primary key so
+        every position is unique; pass the previous page's ``next_cursor`` as
+        ``cursor`` (``offset`` is only used for the first page).
+        """
+        if limit is not None and limit <= 0:
+            return Page(items=[])
+        fields = [name for name, _ in parse_order_by(order_by)]
+        after = decode_cursor(cursor, fields) if cursor else None
+        rows = await self.read(
+            table_or_collection, filters, order_by=order_by,
+            limit=limit + 1 if limit is not None else None,
+            offset=None if after else offset, after=after,
+        )
+        if limit is None or len(rows) <= limit:
+            return Page(items=list(rows))
+
+        rows = list(rows[:limit])
+        next_cursor = encode_cursor(fields, [row_value(rows[-1], name) for name in fields])
+        return Page(items=rows, next_cursor=next_cursor)
+
+    def stream(
+        self, table_or_collection: Any, filters: Optional[Dict] = None,
+        order_by: OrderBy = None, columns: Optional[Sequence[str]] = None,
+        batch_size: int = 1000) -> AsyncIterator[Dict]:
+        """
+        Cursor-backed read for exports. It runs outside the request's unit of
+        work on a connection of its own, so a ``StreamingResponse`` can keep
+        consuming it after the request-scoped session has been released.
+        """
+        return self.db.stream(
+            table_or_collection, filters, order_by=order_by,
+            columns=columns, batch_size=batch_size,
+        )
+
+    async def search(
+        self, table_or_collection: Any, text: str, match_all: bool = True,
+        limit: Optional[int] = None, offset: Optional[int] = None,
+        filters: Optional[Dict] = None) -> List[Any]:
+        return await self.db.search(
+            table_or_collection, text, match_all=match_all,
+            limit=limit, offset=offset, filters=filters, session=self._session,
+        )
+
+    async def aggregate(
+        self, table_or_collection: Any, metrics: Metrics,
+        filters: Optional[Dict] = None, group_by: Optional[Sequence[str]] = None,
+        join: Join = None, order_by: OrderBy = None) -> List[Dict]:
+        return await self.db.aggregate(
+            table_or_collection, metrics, filters, group_by=group_by,
+            join=join, order_by=order_by, session=self._session,
+        )
 
     async def update(
         self, table_or_collection: Any, filters: Dict, updates: Dict) -> Any:
-        return await self.db.update(table_or_collection, filters, updates)
+        return await self.db.update(table_or_collection, filters, updates, session=self._session)
+
+    async def update_many(self, table_or_collection: Any, key: str, rows: List[Dict]) -> int:
+        return await self.db.update_many(table_or_collection, key, rows, session=self._session)
+
+    async def upsert_increment(self, table_or_collection: Any, key: Dict, deltas: Dict) -> None:
+        await self.db.upsert_increment(table_or_collection, key, deltas, session=self._session)
+
+    async def increment_many(
+        self, table_or_collection: Any, key: str, field: str, deltas: Dict,
+        filters: Optional[Dict] = None, floor: Optional[Any] = None,
+    ) -> int:
+        return await self.db.increment_many(
+            table_or_collection, key, field, deltas, filters=filters, floor=floor, session=self._session
+        )
 
     async def delete(self, table_or_collection: Any, filters: Dict) -> Any:
-        return await self.db.delete(table_or_collection, filters)
+        return await self.db.delete(table_or_collection, filters, session=self._session)
 
     async def execute_query(self, raw_sql: str) -> Any:
-        return await self.db.execute_query(raw_sql)
+        return await self.db.execute_query(raw_sql, session=self._session)
@@ -0,0 +1,44 @@
+# app/database/base/engine_registry.py
+
+import asyncio
+from typing import Dict
+
+from ..base.database_factory import get_database
+from ..base.idatabase import IDatabase
+
+
+class EngineRegistry:
+    """
+    Process-wide registry of connected databases.
+
+    Each backend's engine (and its connection pool) is created once, normally
+    from the FastAPI lifespan, and shared by every request. Request-scoped
+    ``DatabaseManager`` instances only check sessions out of it.
+    """
+
+    def __init__(self):
+        self._databases: Dict[str, IDatabase] = {}
+        self._lock = asyncio.Lock()
+
+    async def get(self, db_type: str) -> IDatabase:
+        key = db_type.lower()
+        db = self._databases.get(key)
+        if db is not None:
+            return db
+
+        async with self._lock:
+            db = self._databases.get(key)
+            if db is None:
+                db = get_database(key)
+                await db.connect()
+                self._databases[key] = db
+            return db
+
+    async def dispose_all(self) -> None:
+        async with self._lock:
+            for db in self._databases.values():
+                await db.disconnect()
+            self._databases.clear()
+
+
+engine_registry = EngineRegistry()
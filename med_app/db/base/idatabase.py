@@ -1,7 +1,9 @@
 # app/database/base/idatabase.py
 
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence, Union
+
+from .query_spec import Join, Metrics, OrderBy
 
 class IDatabase(ABC):
     @abstractmethod
@@ -22,27 +24,128 @@ class IDatabase(ABC):
         """
         pass
 
+    async def close_session(self, session: Any) -> None:
+        """Return a session obtained from ``get_session`` to the pool."""
+        pass
+
+    async def commit(self, session: Any) -> None:
+        """Commit the unit of work held by ``session`` (no-op when unsupported)."""
+        pass
+
+    async def rollback(self, session: Any) -> None:
+        """Discard the unit of work held by ``session`` (no-op when unsupported)."""
+        pass
+
+    # The CRUD methods below accept an optional ``session``. When given, the
+    # operation joins that session's unit of work instead of committing on its own.
+
     @abstractmethod
-    async def create(self, table_or_collection: Any, data: Dict) -> Any:
+    async def create(self, table_or_collection: Any, data: Dict, session: Any = None) -> Any:
+        pass
+
+    @abstractmethod
+    async def create_many(
+        self, table_or_collection: Any, rows: List[Dict], returning: bool = True, session: Any = None) -> List[Any]:
+        """
+        Insert ``rows`` in one batched round trip and return them (with their
+        generated keys) in the same order. Pass ``returning=False`` when the
+        keys are not needed; backends can then use a plain executemany.
+        """
         pass
 
     @abstractmethod
     async def read(
-        self, table_or_collection: Any, filters: Optional[Dict] = None) -> List[Dict]:
+        self, table_or_collection: Any, filters: Optional[Dict] = None,
+        session: Any = None, order_by: OrderBy = None,
+        limit: Optional[int] = None, offset: Optional[int] = None,
+        after: Optional[Sequence[Any]] = None) -> List[Dict]:
+        """
+        Fetch matching rows/documents. ``filters`` and ``order_by`` follow the
+        query spec in ``query_spec.py``; ``limit``/``offset`` are applied by the
+        backend so only the requested page is transferred. ``after`` holds the
+        ``order_by`` values of the last row already seen (keyset pagination).
+        """
+        pass
+
+    @abstractmethod
+    def stream(
+        self, table_or_collection: Any, filters: Optional[Dict] = None,
+        order_by: OrderBy = None, columns: Optional[Sequence[str]] = None,
+        batch_size: int = 1000, session: Any = None) -> AsyncIterator[Dict]:
+        """
+        Async generator over matching rows as plain dicts (only ``columns``
+        when given), fetched ``batch_size`` at a time from a server-side
+        cursor so arbitrarily large results use constant memory.
+        """
+        pass
+
+    @abstractmethod
+    async def search(
+        self, table_or_collection: Any, text: str, match_all: bool = True,
+        limit: Optional[int] = None, offset: Optional[int] = None,
+        filters: Optional[Dict] = None, session: Any = None) -> List[Any]:
+        """
+        Ranked full-text search over the model's ``__search_fields__``, best
+        match first. Each word of ``text`` is matched as a prefix; with
+        ``match_all`` every word must match, otherwise any of them.
+        ``filters`` (query spec) further restrict the matches.
+        """
+        pass
+
+    @abstractmethod
+    async def aggregate(
+        self, table_or_collection: Any, metrics: Metrics,
+        filters: Optional[Dict] = None, group_by: Optional[Sequence[str]] = None,
+        join: Join = None, order_by: OrderBy = None, session: Any = None) -> List[Dict]:
+        """
+        Run ``SUM``/``COUNT``/... grouped by ``group_by`` inside the database and
+        return one dict per group (see the aggregate spec in ``query_spec.py``).
+        """
         pass
 
     @abstractmethod
     async def update(
-        self, table_or_collection: Any, filters: Dict, updates: Dict) -> Any:
+        self, table_or_collection: Any, filters: Dict, updates: Dict, session: Any = None) -> Any:
+        pass
+
+    @abstractmethod
+    async def update_many(
+        self, table_or_collection: Any, key: str, rows: List[Dict], session: Any = None) -> int:
+        """
+        Apply a batch of per-row updates in one round trip. Each dict in
+        ``rows`` carries the row's ``key`` plus the fields to set.
+        """
+        pass
+
+    @abstractmethod
+    async def upsert_increment(
+        self, table_or_collection: Any, key: Dict, deltas: Dict, session: Any = None) -> None:
+        """
+        Atomically add ``deltas`` (``{"field": amount}``) to the row whose
+        unique ``key`` columns equal ``key``, inserting it (with the deltas
+        as values) when it does not exist yet. One statement, so concurrent
+        writers of the same key cannot both insert.
+        """
+        pass
+
+    @abstractmethod
+    async def increment_many(
+        self, table_or_collection: Any, key: str, field: str, deltas: Dict,
+        filters: Optional[Dict] = None, floor: Optional[Any] = None, session: Any = None) -> int:
+        """
+        Add ``deltas[k]`` to ``field`` of the row whose ``key`` is ``k``, for
+        every ``k`` in one statement. With ``floor``, rows whose result would
+        drop below it are left untouched. Returns how many rows changed.
+        """
         pass
 
     @abstractmethod
     async def delete(
-        self, table_or_collection: Any, filters: Dict) -> Any:
+        self, table_or_collection: Any, filters: Dict, session: Any = None) -> Any:
         pass
 
     @abstractmethod
-    async def execute_query(self, raw_sql: str) -> Any:
+    async def execute_query(self, raw_sql: str, session: Any = None) -> Any:
         """
         For SQL DBs, run raw SQL. For Mongo, you may raise NotImplementedError or support aggregation.
         """
@@ -0,0 +1,69 @@
+# app/database/base/pagination.py
+
+import base64
+import json
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from decimal import Decimal
+from enum import Enum
+from typing import Any, List, Optional, Sequence
+
+from ...exceptions.custom_exceptions import InvalidCursorException
+
+
+@dataclass
+class Page:
+    """One page of a keyset-paginated read."""
+    items: List[Any] = field(default_factory=list)
+    next_cursor: Optional[str] = None
+
+
+def _encode_value(value: Any) -> Any:
+    # Tag non-JSON types so they round-trip with their original Python type.
+    if isinstance(value, datetime):
+        return {"dt": value.isoformat()}
+    if isinstance(value, date):
+        return {"d": value.isoformat()}
+    if isinstance(value, Decimal):
+        return {"dec": str(value)}
+    if isinstance(value, Enum):
+        return value.value
+    return value
+
+
+def _decode_value(value: Any) -> Any:
+    if isinstance(value, dict):
+        if "dt" in value:
+            return datetime.fromisoformat(value["dt"])
+        if "d" in value:
+            return date.fromisoformat(value["d"])
+        if "dec" in value:
+            return Decimal(value["dec"])
+    return value
+
+
+def encode_cursor(order_fields: Sequence[str], values: Sequence[Any]) -> str:
+    """Opaque token for the position just after a row with ``values``."""
+    payload = {"k": list(order_fields), "v": [_encode_value(v) for v in values]}
+    raw = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, order_fields: Sequence[str]) -> List[Any]:
+    """Decode a cursor, checking it was issued for the same sort order."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        keys, values = payload["k"], payload["v"]
+    except (ValueError, TypeError, KeyError):
+        raise InvalidCursorException("Invalid pagination cursor") from None
+    if keys != list(order_fields) or len(values) != len(keys):
+        raise InvalidCursorException("Pagination cursor does not match the requested sort order")
+    return [_decode_value(v) for v in values]
+
+
+def row_value(row: Any, field_name: str) -> Any:
+    """Read a field from an ORM object or a Mongo document."""
+    if isinstance(row, dict):
+        return row.get(field_name)
+    return getattr(row, field_name)
@@ -0,0 +1,96 @@
+# app/database/base/query_spec.py
+
+"""
+Backend-neutral query spec used by ``IDatabase.read``.
+
+Filters are a dict of ``{"field": value}`` (equality) or
+``{"field__op": value}`` where ``op`` is one of ``FILTER_OPERATORS``::
+
+    {"retailer_id": 3, "price__gte": 10, "name__icontains": "para"}
+
+``ilike`` takes a LIKE pattern as is; ``icontains`` is a case-insensitive
+substring match on user text, so ``%`` and ``_`` in it match literally.
+
+``order_by`` is a field name or a list of them; prefix with ``-`` for
+descending order, e.g. ``["-order_date", "order_id"]``.
+
+``IDatabase.aggregate`` takes the same filters plus:
+
+* ``metrics`` -- ``{"alias": (function, field)}`` where ``function`` is one of
+  ``AGGREGATE_FUNCTIONS``; ``field`` is a column name, a tuple of columns to
+  multiply (``("price", "quantity")``) or ``None`` for ``count(*)``.
+* ``group_by`` -- field names, optionally bucketed by date with
+  ``"order_date__day"`` / ``"order_date__month"`` (see ``DATE_BUCKETS``).
+  Bucketed keys come back as ``"YYYY-MM-DD"`` / ``"YYYY-MM"`` strings.
+* ``join`` -- ``(ParentModel, "key")`` to join a parent table on a shared
+  column; parent columns are then addressed as ``"<tablename>.<field>"``.
+
+Each result row is a dict keyed by the group keys and metric aliases, and
+``order_by`` refers to those names.
+"""
+
+import re
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+FILTER_OPERATORS = ("eq", "ne", "gt", "gte", "lt", "lte", "in", "ilike", "icontains")
+
+AGGREGATE_FUNCTIONS = ("sum", "count", "min", "max", "avg")
+
+# strftime-style formats; Mongo's $dateToString understands the same tokens.
+DATE_BUCKETS = {"day": "%Y-%m-%d", "month": "%Y-%m"}
+
+OrderBy = Optional[Union[str, Iterable[str]]]
+
+Metrics = Dict[str, Tuple[str, Optional[Union[str, Sequence[str]]]]]
+
+Join = Optional[Tuple[Any, str]]
+
+_SEARCH_TERM = re.compile(r"\w+", re.UNICODE)
+
+
+def parse_filter_key(key: str) -> Tuple[str, str]:
+    """Split ``"price__gte"`` into ``("price", "gte")``; bare names mean ``eq``."""
+    field, sep, op = key.rpartition("__")
+    if not sep:
+        return key, "eq"
+    if op not in FILTER_OPERATORS:
+        raise ValueError(f"Unsupported filter operator '{op}' in '{key}'")
+    return field, op
+
+
+def parse_order_by(order_by: OrderBy) -> List[Tuple[str, bool]]:
+    """Return ``[(field, descending), ...]`` for an ``order_by`` argument."""
+    if not order_by:
+        return []
+    if isinstance(order_by, str):
+        order_by = [order_by]
+    return [(key[1:], True) if key.startswith("-") else (key, False) for key in order_by]
+
+
+def parse_group_key(key: str) -> Tuple[str, Optional[str]]:
+    """Split ``"order_date__month"`` into ``("order_date", "month")``; plain names have no bucket."""
+    field, sep, bucket = key.rpartition("__")
+    if not sep:
+        return key, None
+    if bucket not in DATE_BUCKETS:
+        raise ValueError(f"Unsupported date bucket '{bucket}' in '{key}'")
+    return field, bucket
+
+
+def metric_fields(field: Optional[Union[str, Sequence[str]]]) -> List[str]:
+    """Normalise a metric's field argument to a list of column names."""
+    if field is None:
+        return []
+    if isinstance(field, str):
+        return [field]
+    return list(field)
+
+
+def check_metric(alias: str, function: str) -> None:
+    if function not in AGGREGATE_FUNCTIONS:
+        raise ValueError(f"Unsupported aggregate function '{function}' for '{alias}'")
+
+
+def search_terms(text: Optional[str]) -> List[str]:
+    """Split free text into lower-cased word terms for ``IDatabase.search``."""
+    return _SEARCH_TERM.findall((text or "").lower())
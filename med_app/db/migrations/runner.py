@@ -0,0 +1,141 @@
+# app/database/migrations/runner.py
+
+"""
+Versioned schema migrations for the SQL backends.
+
+Each module in ``migrations/versions`` named ``v<NNNN>_<slug>.py`` defines
+``VERSION`` (int), ``DESCRIPTION`` (str) and ``async def upgrade(ctx)``.
+Applied versions are recorded in ``schema_migrations`` so every migration
+runs once per database.
+
+Migrations run on an AUTOCOMMIT connection so ``MigrationContext`` can use
+each dialect's online DDL (``CREATE INDEX CONCURRENTLY`` on PostgreSQL,
+``ALGORITHM=INPLACE, LOCK=NONE`` on MySQL); they must therefore be written
+to be safe to re-run if interrupted.
+"""
+
+import importlib
+import pkgutil
+from datetime import datetime
+from types import ModuleType
+from typing import List, Optional, Sequence
+
+from sqlalchemy import Column, DateTime, Integer, MetaData, String, Table, insert, inspect, select, text
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+
+from ...utils.logger import get_logger
+from . import versions
+
+logger = get_logger(__name__)
+
+_metadata = MetaData()
+
+schema_migrations = Table(
+    "schema_migrations",
+    _metadata,
+    Column("version", Integer, primary_key=True),
+    Column("description", String(200), nullable=False),
+    Column("applied_at", DateTime, nullable=False, default=datetime.utcnow),
+)
+
+
+class MigrationContext:
+    """Dialect-aware DDL helpers handed to each migration's ``upgrade``."""
+
+    def __init__(self, conn: AsyncConnection):
+        self.conn = conn
+        self.dialect = conn.dialect.name
+
+    async def execute(self, sql: str) -> None:
+        await self.conn.execute(text(sql))
+
+    async def create_table(self, table: Table) -> None:
+        """Create ``table`` (and its declared indexes) unless it already exists."""
+        await self.conn.run_sync(lambda sync: table.create(sync, checkfirst=True))
+        logger.info(f"Table {table.name} ready.")
+
+    async def index_exists(self, table: str, name: str) -> bool:
+        indexes = await self.conn.run_sync(lambda sync: _inspect_indexes(sync, table))
+        return name in indexes
+
+    async def create_index(
+        self, name: str, table: str, columns: Sequence[str],
+        unique: bool = False, using: Optional[str] = None,
+    ) -> None:
+        """
+        Create an index without blocking writes where the backend allows it.
+        ``using`` selects a PostgreSQL access method such as ``gin``.
+        """
+        cols = ", ".join(columns)
+        kind = "UNIQUE INDEX" if unique else "INDEX"
+
+        if self.dialect == "postgresql":
+            # A failed CONCURRENTLY build leaves an INVALID index behind; drop it so we retry.
+            invalid = await self.conn.execute(text(
+                "SELECT 1 FROM pg_class c JOIN pg_index i ON i.indexrelid = c.oid "
+                "WHERE c.relname = :name AND NOT i.indisvalid"
+            ), {"name": name})
+            if invalid.first():
+                await self.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
+            method = f" USING {using}" if using else ""
+            await self.execute(f"CREATE {kind} CONCURRENTLY IF NOT EXISTS {name} ON {table}{method} ({cols})")
+        elif self.dialect in ("mysql", "mariadb"):
+            if not await self.index_exists(table, name):
+                await self.execute(f"ALTER TABLE {table} ADD {kind} {name} ({cols}), ALGORITHM=INPLACE, LOCK=NONE")
+        else:
+            await self.execute(f"CREATE {kind} IF NOT EXISTS {name} ON {table} ({cols})")
+        logger.info(f"Index {name} on {table}({cols}) ready.")
+
+
+def _inspect_indexes(sync_conn, table: str) -> List[str]:
+    return [ix["name"] for ix in inspect(sync_conn).get_indexes(table)]
+
+
+def discover_migrations() -> List[ModuleType]:
+    modules = [
+        importlib.import_module(f"{versions.__name__}.{info.name}")
+        for info in pkgutil.iter_modules(versions.__path__)
+        if info.name.startswith("v")
+    ]
+    modules.sort(key=lambda module: module.VERSION)
+    seen = set()
+    for module in modules:
+        if module.VERSION in seen:
+            raise RuntimeError(f"Duplicate migration version {module.VERSION}")
+        seen.add(module.VERSION)
+    return modules
+
+
+class MigrationRunner:
+    def __init__(self, engine: AsyncEngine):
+        self.engine = engine
+
+    async def applied_versions(self, conn: AsyncConnection) -> List[int]:
+        await conn.run_sync(_metadata.create_all, checkfirst=True)
+        result = await conn.execute(select(schema_migrations.c.version).order_by(schema_migrations.c.version))
+        return [row[0] for row in result]
+
+    async def pending(self) -> List[ModuleType]:
+        async with self.engine.connect() as conn:
+            conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+            applied = set(await self.applied_versions(conn))
+        return [m for m in discover_migrations() if m.VERSION not in applied]
+
+    async def upgrade(self, target: Optional[int] = None) -> List[int]:
+        """Apply pending migrations in order, up to and including ``target``."""
+        done = []
+        async with self.engine.connect() as conn:
+            conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+            applied = set(await self.applied_versions(conn))
+            for module in discover_migrations():
+                if module.VERSION in applied:
+                    continue
+                if target is not None and module.VERSION > target:
+                    break
+                logger.info(f"Applying migration {module.VERSION}: {module.DESCRIPTION}")
+                await module.upgrade(MigrationContext(conn))
+                await conn.execute(insert(schema_migrations).values(
+                    version=module.VERSION, description=module.DESCRIPTION, applied_at=datetime.utcnow(),
+                ))
+                done.append(module.VERSION)
+        return done
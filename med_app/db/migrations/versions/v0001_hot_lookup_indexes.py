@@ -0,0 +1,29 @@
+# app/database/migrations/versions/v0001_hot_lookup_indexes.py
+
+"""Secondary indexes for the columns the managers filter and sort on."""
+
+VERSION = 1
+DESCRIPTION = "Composite indexes for hot lookup columns"
+
+# (index name, table, columns) -- kept in sync with the models' __table_args__
+INDEXES = [
+    ("ix_orders_retailer_id_order_date", "orders", ["retailer_id", "order_date"]),
+    ("ix_orders_customer_id", "orders", ["customer_id"]),
+    ("ix_order_items_order_id", "order_items", ["order_id"]),
+    ("ix_retailer_orders_retailer_id_order_date", "retailer_orders", ["retailer_id", "order_date"]),
+    ("ix_retailer_orders_distributor_id_order_date", "retailer_orders", ["distributor_id", "order_date"]),
+    ("ix_retailer_order_items_order_id", "retailer_order_items", ["order_id"]),
+    ("ix_retailer_medicines_retailer_id_name", "retailer_medicines", ["retailer_id", "name"]),
+    ("ix_distributor_stock_distributor_id_medicine_id_expiry_date", "distributor_stock",
+     ["distributor_id", "medicine_id", "expiry_date"]),
+    ("ix_retailers_zip_code", "retailers", ["zip_code"]),
+    ("ix_retailer_notifications_retailer_id_is_read_created_at", "retailer_notifications",
+     ["retailer_id", "is_read", "created_at"]),
+    ("ix_distributor_notifications_distributor_id_is_read_created_at", "distributor_notifications",
+     ["distributor_id", "is_read", "created_at"]),
+]
+
+
+async def upgrade(ctx) -> None:
+    for name, table, columns in INDEXES:
+        await ctx.create_index(name, table, columns)
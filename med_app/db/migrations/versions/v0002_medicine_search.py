@@ -0,0 +1,60 @@
+# app/database/migrations/versions/v0002_medicine_search.py
+
+"""Full-text search index over medicines (see db/sql/text_search.py)."""
+
+VERSION = 2
+DESCRIPTION = "Full-text search index for medicines"
+
+FIELDS = ["name", "generic_name", "category", "manufacturer"]
+
+
+async def _sqlite(ctx) -> None:
+    cols = ", ".join(FIELDS)
+    new = ", ".join(f"new.{f}" for f in FIELDS)
+    old = ", ".join(f"old.{f}" for f in FIELDS)
+    await ctx.execute(
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS medicines_fts USING fts5("
+        f"{cols}, content='medicines', content_rowid='medicine_id', prefix='2 3')"
+    )
+    # Triggers keep the external-content index in step with every write path.
+    await ctx.execute(
+        f"CREATE TRIGGER IF NOT EXISTS medicines_fts_ai AFTER INSERT ON medicines BEGIN "
+        f"INSERT INTO medicines_fts(rowid, {cols}) VALUES (new.medicine_id, {new}); END"
+    )
+    await ctx.execute(
+        f"CREATE TRIGGER IF NOT EXISTS medicines_fts_ad AFTER DELETE ON medicines BEGIN "
+        f"INSERT INTO medicines_fts(medicines_fts, rowid, {cols}) VALUES ('delete', old.medicine_id, {old}); END"
+    )
+    await ctx.execute(
+        f"CREATE TRIGGER IF NOT EXISTS medicines_fts_au AFTER UPDATE ON medicines BEGIN "
+        f"INSERT INTO medicines_fts(medicines_fts, rowid, {cols}) VALUES ('delete', old.medicine_id, {old}); "
+        f"INSERT INTO medicines_fts(rowid, {cols}) VALUES (new.medicine_id, {new}); END"
+    )
+    await ctx.execute("INSERT INTO medicines_fts(medicines_fts) VALUES ('rebuild')")
+
+
+async def _postgres(ctx) -> None:
+    # Weights A-D follow MedicineDbModel.__search_fields__ order.
+    vector = " || ".join(
+        f"setweight(to_tsvector('simple', coalesce({field}, '')), '{weight}')"
+        for field, weight in zip(FIELDS, "ABCD")
+    )
+    await ctx.execute(
+        f"ALTER TABLE medicines ADD COLUMN IF NOT EXISTS search_vector tsvector "
+        f"GENERATED ALWAYS AS ({vector}) STORED"
+    )
+    await ctx.create_index("ix_medicines_search_vector", "medicines", ["search_vector"], using="gin")
+
+
+async def _mysql(ctx) -> None:
+    if not await ctx.index_exists("medicines", "ft_medicines_search"):
+        await ctx.execute(f"ALTER TABLE medicines ADD FULLTEXT INDEX ft_medicines_search ({', '.join(FIELDS)})")
+
+
+async def upgrade(ctx) -> None:
+    if ctx.dialect == "postgresql":
+        await _postgres(ctx)
+    elif ctx.dialect in ("mysql", "mariadb"):
+        await _mysql(ctx)
+    else:
+        await _sqlite(ctx)
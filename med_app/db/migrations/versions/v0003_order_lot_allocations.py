@@ -0,0 +1,12 @@
+# app/database/migrations/versions/v0003_order_lot_allocations.py
+
+"""Per-lot allocations for retailer order items (multi-batch FIFO)."""
+
+from ....models.retailer.retailer_order_model import RetailerOrderAllocationDbModel
+
+VERSION = 3
+DESCRIPTION = "Retailer order item lot allocations"
+
+
+async def upgrade(ctx) -> None:
+    await ctx.create_table(RetailerOrderAllocationDbModel.__table__)
@@ -0,0 +1,28 @@
+# app/database/migrations/versions/v0004_daily_sales_rollup.py
+
+"""Daily sales rollup behind the dashboards and reports, backfilled from existing orders."""
+
+from sqlalchemy import text
+
+from ....models.report.daily_sales_rollup_model import DailySalesRollupDbModel
+from ....crud.report.sales_rollup_manager import SalesRollupManager
+from ....utils.db_manager import get_manager
+from ....utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+VERSION = 4
+DESCRIPTION = "Daily sales rollup table"
+
+
+async def upgrade(ctx) -> None:
+    table = DailySalesRollupDbModel.__table__
+    await ctx.create_table(table)
+    # Only backfill an empty table: a re-run after an interrupted backfill
+    # finds it empty again, as the rebuild runs in a single transaction.
+    if (await ctx.conn.execute(text(f"SELECT 1 FROM {table.name} LIMIT 1"))).first():
+        return
+    logger.info("Backfilling daily_sales_rollup from existing orders...")
+    async with get_manager(SalesRollupManager) as manager:
+        rows = await manager.rebuild()
+    logger.info(f"daily_sales_rollup backfilled ({rows} rows).")
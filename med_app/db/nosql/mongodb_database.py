@@ -1,9 +1,111 @@
 # app/database/mongodb_database.py
 
-from typing import Any, Dict, List, Optional
+import re
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence, Tuple
 from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import ASCENDING, DESCENDING, TEXT, UpdateOne
 
+from ...config import settings
 from ..base.idatabase import IDatabase
+from ..base.query_spec import (
+    DATE_BUCKETS, Join, Metrics, OrderBy, check_metric, metric_fields,
+    parse_filter_key, parse_group_key, parse_order_by, search_terms,
+)
+
+_MONGO_OPERATORS = {"ne": "$ne", "gt": "$gt", "gte": "$gte", "lt": "$lt", "lte": "$lte", "in": "$in"}
+
+
+def _like_to_regex(pattern: str) -> str:
+    """Translate a SQL LIKE pattern (``%`` / ``_`` wildcards) to an anchored regex."""
+    parts = [".*" if ch == "%" else "." if ch == "_" else re.escape(ch) for ch in pattern]
+    return "^" + "".join(parts) + "$"
+
+
+def to_mongo_filter(filters: Optional[Dict]) -> Dict:
+    """Convert query-spec filters (``field__op``) into a Mongo filter document."""
+    query: Dict[str, Any] = {}
+    for key, value in (filters or {}).items():
+        field, op = parse_filter_key(key)
+        if op == "eq":
+            condition = {"$eq": value}
+        elif op == "ilike":
+            condition = {"$regex": _like_to_regex(value), "$options": "i"}
+        elif op == "icontains":
+            condition = {"$regex": re.escape(value), "$options": "i"}
+        else:
+            condition = {_MONGO_OPERATORS[op]: list(value) if op == "in" else value}
+        query.setdefault(field, {}).update(condition)
+    return query
+
+
+def keyset_filter(order_by: OrderBy, after: Sequence[Any]) -> Dict:
+    """Mongo equivalent of the SQL keyset predicate (rows after ``after``)."""
+    order = parse_order_by(order_by)
+    clauses = []
+    for i, (field, descending) in enumerate(order):
+        clause = {order[j][0]: after[j] for j in range(i)}
+        clause[field] = {"$lt" if descending else "$gt": after[i]}
+        clauses.append(clause)
+    return {"$or": clauses}
+
+
+def aggregate_pipeline(
+    metrics: Metrics, filters: Optional[Dict] = None,
+    group_by: Optional[Sequence[str]] = None, join: Join = None,
+    order_by: OrderBy = None,
+) -> Tuple[List[Dict], Dict[str, str]]:
+    """
+    Mongo aggregation pipeline equivalent of the SQL aggregate query.
+
+    Output fields use positional names (``g0``, ``m0``...) because group keys
+    such as ``"orders.retailer_id"`` would otherwise become nested documents;
+    the returned mapping renames them back to the spec's names.
+    """
+    pipeline: List[Dict] = []
+    if join:
+        parent, key = join
+        parent_name = getattr(parent, "__tablename__", parent)
+        # Embedding the parent under its table name makes "orders.retailer_id" a valid path.
+        pipeline.append({"$lookup": {"from": parent_name, "localField": key,
+                                     "foreignField": key, "as": parent_name}})
+        pipeline.append({"$unwind": f"${parent_name}"})
+    if filters:
+        pipeline.append({"$match": to_mongo_filter(filters)})
+
+    group_id: Dict[str, Any] = {}
+    project: Dict[str, Any] = {"_id": 0}
+    columns: Dict[str, str] = {}
+    for i, key in enumerate(group_by or []):
+        field, bucket = parse_group_key(key)
+        if bucket:
+            group_id[f"g{i}"] = {"$dateToString": {"format": DATE_BUCKETS[bucket], "date": f"${field}"}}
+        else:
+            group_id[f"g{i}"] = f"${field}"
+        project[f"g{i}"] = f"$_id.g{i}"
+        columns[f"g{i}"] = key
+
+    group: Dict[str, Any] = {"_id": group_id or None}
+    for i, (alias, (function, field)) in enumerate(metrics.items()):
+        check_metric(alias, function)
+        paths = [f"${name}" for name in metric_fields(field)]
+        if function == "count":
+            value = {"$cond": [{"$ne": [paths[0], None]}, 1, 0]} if paths else 1
+            group[f"m{i}"] = {"$sum": value}
+        else:
+            if not paths:
+                raise ValueError(f"'{function}' for '{alias}' needs a field")
+            value = paths[0] if len(paths) == 1 else {"$multiply": paths}
+            group[f"m{i}"] = {f"${function}": value}
+        project[f"m{i}"] = 1
+        columns[f"m{i}"] = alias
+    pipeline.append({"$group": group})
+    pipeline.append({"$project": project})
+
+    internal = {name: field for field, name in columns.items()}
+    sort = {internal[name]: -1 if desc else 1 for name, desc in parse_order_by(order_by)}
+    if sort:
+        pipeline.append({"$sort": sort})
+    return pipeline, columns
 
 
 class MongoDBDatabase(IDatabase):
@@ -12,42 +114,156 @@ class MongoDBDatabase(IDatabase):
         self.db_name = db_name
         self.client = None
         self.db = None
+        self._text_indexed = set()
 
     async def connect(self) -> None:
-        self.client = AsyncIOMotorClient(self.uri)
+        self.client = AsyncIOMotorClient(
+            self.uri,
+            maxPoolSize=settings.db_pool_size + settings.db_max_overflow,
+            waitQueueTimeoutMS=settings.db_pool_timeout * 1000,
+        )
         self.db = self.client[self.db_name]
 
     async def disconnect(self) -> None:
         if self.client:
             self.client.close()
+            self.client = None
+            self.db = None
 
     def get_session(self) -> Any:
-        if not self.db:
+        if self.db is None:
             raise RuntimeError("MongoDB not connected")
         return self.db
 
-    async def create(self, collection_name: str, data: Dict) -> Any:
-        coll = self.db[collection_name]
+    def _collection(self, collection_name: Any):
+        # Managers pass ORM model classes; map them onto same-named collections.
+        return self.db[getattr(collection_name, "__tablename__", collection_name)]
+
+    async def create(self, collection_name: str, data: Dict, session: Any = None) -> Any:
+        coll = self._collection(collection_name)
         res = await coll.insert_one(data)
         return {"inserted_id": res.inserted_id}
 
+    async def create_many(
+        self, collection_name: str, rows: List[Dict], returning: bool = True, session: Any = None) -> List[Any]:
+        if not rows:
+            return []
+        coll = self._collection(collection_name)
+        res = await coll.insert_many(rows, ordered=True)
+        return [{"inserted_id": inserted_id} for inserted_id in res.inserted_ids]
+
     async def read(
-        self, collection_name: str, filters: Optional[Dict] = None) -> List[Dict]:
-        coll = self.db[collection_name]
-        cursor = coll.find(filters or {})
-        docs = await cursor.to_list(length=100)  # or more or customizable
+        self, collection_name: str, filters: Optional[Dict] = None,
+        session: Any = None, order_by: OrderBy = None,
+        limit: Optional[int] = None, offset: Optional[int] = None,
+        after: Optional[Sequence[Any]] = None) -> List[Dict]:
+        coll = self._collection(collection_name)
+        query = to_mongo_filter(filters)
+        if after:
+            query = {"$and": [query, keyset_filter(order_by, after)]}
+        cursor = coll.find(query)
+        sort = [(field, DESCENDING if desc else ASCENDING) for field, desc in parse_order_by(order_by)]
+        if sort:
+            cursor = cursor.sort(sort)
+        if offset:
+            cursor = cursor.skip(offset)
+        if limit is not None:
+            cursor = cursor.limit(limit)
+        docs = await cursor.to_list(length=limit)
         return docs
 
+    async def stream(
+        self, collection_name: str, filters: Optional[Dict] = None,
+        order_by: OrderBy = None, columns: Optional[Sequence[str]] = None,
+        batch_size: int = 1000, session: Any = None) -> AsyncIterator[Dict]:
+        coll = self._collection(collection_name)
+        projection = {"_id": 0, **{name: 1 for name in columns}} if columns else None
+        cursor = coll.find(to_mongo_filter(filters), projection).batch_size(batch_size)
+        sort = [(field, DESCENDING if desc else ASCENDING) for field, desc in parse_order_by(order_by)]
+        if sort:
+            cursor = cursor.sort(sort)
+        async for doc in cursor:
+            yield doc
+
+    async def search(
+        self, collection_name: str, text: str, match_all: bool = True,
+        limit: Optional[int] = None, offset: Optional[int] = None,
+        filters: Optional[Dict] = None, session: Any = None) -> List[Dict]:
+        # Mongo $text matches whole (stemmed) words only; there is no prefix search.
+        terms = search_terms(text)
+        if not terms:
+            return []
+        coll = self._collection(collection_name)
+        fields = getattr(collection_name, "__search_fields__")
+        if coll.name not in self._text_indexed:
+            await coll.create_index(
+                [(name, TEXT) for name in fields],
+                weights={name: int(weight) for name, weight in fields.items()},
+                name=f"{coll.name}_text",
+            )
+            self._text_indexed.add(coll.name)
+
+        # Quoted terms are ANDed by $text; bare terms are ORed.
+        search = " ".join(f'"{t}"' for t in terms) if match_all else " ".join(terms)
+        score = {"score": {"$meta": "textScore"}}
+        cursor = coll.find({**to_mongo_filter(filters), "$text": {"$search": search}}, score).sort([("score", {"$meta": "textScore"})])
+        if offset:
+            cursor = cursor.skip(offset)
+        if limit is not None:
+            cursor = cursor.limit(limit)
+        return await cursor.to_list(length=limit)
+
+    async def aggregate(
+        self, collection_name: str, metrics: Metrics,
+        filters: Optional[Dict] = None, group_by: Optional[Sequence[str]] = None,
+        join: Join = None, order_by: OrderBy = None, session: Any = None) -> List[Dict]:
+        coll = self._collection(collection_name)
+        pipeline, columns = aggregate_pipeline(metrics, filters, group_by, join, order_by)
+        docs = await coll.aggregate(pipeline).to_list(length=None)
+        return [{columns[field]: value for field, value in doc.items()} for doc in docs]
+
     async def update(
-        self, collection_name: str, filters: Dict, updates: Dict) -> Any:
-        coll = self.db[collection_name]
-        res = await coll.update_many(filters, {"$set": updates})
+        self, collection_name: str, filters: Dict, updates: Dict, session: Any = None) -> Any:
+        coll = self._collection(collection_name)
+        res = await coll.update_many(to_mongo_filter(filters), {"$set": updates})
         return {"matched_count": res.matched_count, "modified_count": res.modified_count}
 
-    async def delete(self, collection_name: str, filters: Dict) -> Any:
-        coll = self.db[collection_name]
-        res = await coll.delete_many(filters)
+    async def update_many(
+        self, collection_name: str, key: str, rows: List[Dict], session: Any = None) -> int:
+        if not rows:
+            return 0
+        coll = self._collection(collection_name)
+        ops = [
+            UpdateOne({key: row[key]}, {"$set": {f: v for f, v in row.items() if f != key}})
+            for row in rows
+        ]
+        res = await coll.bulk_write(ops, ordered=False)
+        return res.matched_count
+
+    async def upsert_increment(
+        self, collection_name: str, key: Dict, deltas: Dict, session: Any = None) -> None:
+        coll = self._collection(collection_name)
+        await coll.update_one(key, {"$inc": deltas}, upsert=True)
+
+    async def increment_many(
+        self, collection_name: str, key: str, field: str, deltas: Dict,
+        filters: Optional[Dict] = None, floor: Optional[Any] = None, session: Any = None) -> int:
+        if not deltas:
+            return 0
+        coll = self._collection(collection_name)
+        ops = []
+        for value, delta in deltas.items():
+            query = {**to_mongo_filter(filters), key: value}
+            if floor is not None:
+                query[field] = {"$gte": floor - delta}
+            ops.append(UpdateOne(query, {"$inc": {field: delta}}))
+        res = await coll.bulk_write(ops, ordered=False)
+        return res.matched_count
+
+    async def delete(self, collection_name: str, filters: Dict, session: Any = None) -> Any:
+        coll = self._collection(collection_name)
+        res = await coll.delete_many(to_mongo_filter(filters))
         return {"deleted_count": res.deleted_count}
 
-    async def execute_query(self, raw_sql: str) -> Any:
+    async def execute_query(self, raw_sql: str, session: Any = None) -> Any:
         raise NotImplementedError("Raw SQL not supported in MongoDB backend")
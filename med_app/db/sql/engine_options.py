@@ -0,0 +1,23 @@
+# app/database/sql/engine_options.py
+
+from typing import Any, Dict
+
+from ...config import settings
+
+
+def get_engine_options(db_url: str) -> Dict[str, Any]:
+    """Keyword arguments for ``create_async_engine`` built from the pool settings."""
+    options: Dict[str, Any] = {"future": True, "echo": False}
+
+    # In-memory SQLite runs on a StaticPool, which has no size/overflow knobs.
+    if db_url.startswith("sqlite") and ":memory:" in db_url:
+        return options
+
+    options.update(
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
+        pool_timeout=settings.db_pool_timeout,
+        pool_recycle=settings.db_pool_recycle,
+        pool_pre_ping=settings.db_pool_pre_ping,
+    )
+    return options
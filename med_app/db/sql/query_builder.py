@@ -0,0 +1,187 @@
+# app/database/sql/query_builder.py
+
+from functools import reduce
+from operator import mul
+from typing import Any, Dict, List, Optional, Sequence
+
+from sqlalchemy import and_, func, literal, literal_column, or_, select, tuple_
+from sqlalchemy.dialects import mysql, postgresql, sqlite
+
+from ..base.query_spec import (
+    DATE_BUCKETS, Join, Metrics, OrderBy, check_metric, metric_fields,
+    parse_filter_key, parse_group_key, parse_order_by,
+)
+
+# to_char() patterns matching DATE_BUCKETS for PostgreSQL.
+_PG_BUCKET_FORMATS = {"day": "YYYY-MM-DD", "month": "YYYY-MM"}
+
+
+def escape_like(text: str) -> str:
+    """Make ``%``, ``_`` and ``\\`` match literally in a LIKE pattern (escape char ``\\``)."""
+    return text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def _condition(column: Any, op: str, value: Any):
+    if op == "eq":
+        return column == value
+    if op == "ne":
+        return column != value
+    if op == "gt":
+        return column > value
+    if op == "gte":
+        return column >= value
+    if op == "lt":
+        return column < value
+    if op == "lte":
+        return column <= value
+    if op == "in":
+        return column.in_(list(value))
+    if op == "ilike":
+        return column.ilike(value)
+    if op == "icontains":
+        return column.ilike(f"%{escape_like(value)}%", escape="\\")
+    raise ValueError(f"Unsupported filter operator '{op}'")
+
+
+def filter_conditions(model: Any, filters: Optional[Dict]) -> List[Any]:
+    """One SQL condition per entry of a query-spec filter dict."""
+    conditions = []
+    for key, value in (filters or {}).items():
+        field, op = parse_filter_key(key)
+        conditions.append(_condition(getattr(model, field), op, value))
+    return conditions
+
+
+def apply_filters(stmt: Any, model: Any, filters: Optional[Dict]) -> Any:
+    """Add a WHERE clause for every entry of a query-spec filter dict."""
+    for condition in filter_conditions(model, filters):
+        stmt = stmt.where(condition)
+    return stmt
+
+
+def apply_ordering(stmt: Any, model: Any, order_by: OrderBy) -> Any:
+    for field, descending in parse_order_by(order_by):
+        column = getattr(model, field)
+        stmt = stmt.order_by(column.desc() if descending else column.asc())
+    return stmt
+
+
+def apply_page(stmt: Any, limit: Optional[int] = None, offset: Optional[int] = None) -> Any:
+    if offset:
+        stmt = stmt.offset(offset)
+    if limit is not None:
+        stmt = stmt.limit(limit)
+    return stmt
+
+
+def apply_keyset(stmt: Any, model: Any, order_by: OrderBy, after: Optional[Sequence[Any]]) -> Any:
+    """
+    Restrict to rows strictly after ``after`` in ``order_by`` order (keyset
+    pagination). ``order_by`` should end with the primary key.
+    """
+    if not after:
+        return stmt
+    order = parse_order_by(order_by)
+    columns = [getattr(model, name) for name, _ in order]
+
+    directions = {descending for _, descending in order}
+    if len(directions) == 1:
+        # Uniform direction: a single row-value comparison the index can seek on.
+        values = [literal(value, column.type) for column, value in zip(columns, after)]
+        left, right = tuple_(*columns), tuple_(*values)
+        return stmt.where(left < right if order[0][1] else left > right)
+
+    # Mixed directions: (a > x) OR (a = x AND b < y) OR ...
+    clauses = []
+    for i, ((_, descending), column, value) in enumerate(zip(order, columns, after)):
+        prefix = [columns[j] == after[j] for j in range(i)]
+        clauses.append(and_(*prefix, column < value if descending else column > value))
+    return stmt.where(or_(*clauses))
+
+
+def _resolve_column(models: List[Any], name: str) -> Any:
+    """Look up ``field`` on the base model or ``table.field`` on a joined one."""
+    table, _, field = name.rpartition(".")
+    if not table:
+        return getattr(models[0], field)
+    for model in models:
+        if model.__tablename__ == table:
+            return getattr(model, field)
+    raise ValueError(f"Unknown table '{table}' in '{name}'")
+
+
+def _const(value: str) -> Any:
+    # Inlined rather than bound so SELECT and GROUP BY render the same
+    # expression (PostgreSQL rejects grouping when the parameters differ).
+    return literal_column(f"'{value}'")
+
+
+def date_bucket(column: Any, bucket: str, dialect: str) -> Any:
+    """Truncate a datetime column to a day/month label, per SQL dialect."""
+    if dialect == "postgresql":
+        return func.to_char(func.date_trunc(_const(bucket), column), _const(_PG_BUCKET_FORMATS[bucket]))
+    if dialect in ("mysql", "mariadb"):
+        return func.date_format(column, _const(DATE_BUCKETS[bucket]))
+    return func.strftime(_const(DATE_BUCKETS[bucket]), column)
+
+
+def build_aggregate(
+    model: Any, dialect: str, metrics: Metrics, filters: Optional[Dict] = None,
+    group_by: Optional[Sequence[str]] = None, join: Join = None,
+    order_by: OrderBy = None,
+) -> Any:
+    """Compile an aggregate query spec into a ``SELECT ... GROUP BY`` statement."""
+    models = [model]
+    stmt_from = model
+    if join:
+        parent, key = join
+        models.append(parent)
+        stmt_from = model.__table__.join(parent.__table__, getattr(model, key) == getattr(parent, key))
+
+    labels: Dict[str, Any] = {}
+    groups = []
+    for key in group_by or []:
+        field, bucket = parse_group_key(key)
+        column = _resolve_column(models, field)
+        expr = date_bucket(column, bucket, dialect) if bucket else column
+        groups.append(expr)
+        labels[key] = expr.label(key)
+
+    for alias, (function, field) in metrics.items():
+        check_metric(alias, function)
+        columns = [_resolve_column(models, name) for name in metric_fields(field)]
+        if not columns:
+            if function != "count":
+                raise ValueError(f"'{function}' for '{alias}' needs a field")
+            expr = func.count()
+        else:
+            expr = getattr(func, function)(reduce(mul, columns))
+        labels[alias] = expr.label(alias)
+
+    stmt = select(*labels.values()).select_from(stmt_from)
+    for key, value in (filters or {}).items():
+        field, op = parse_filter_key(key)
+        stmt = stmt.where(_condition(_resolve_column(models, field), op, value))
+    if groups:
+        stmt = stmt.group_by(*groups)
+    for name, descending in parse_order_by(order_by):
+        stmt = stmt.order_by(labels[name].desc() if descending else labels[name].asc())
+    return stmt
+
+
+def build_upsert_increment(model: Any, dialect: str, key: Dict, deltas: Dict) -> Any:
+    """
+    ``INSERT key + deltas``, or add ``deltas`` to the existing row when the
+    unique ``key`` columns collide, per SQL dialect.
+    """
+    values = {**key, **deltas}
+    table = model.__table__
+    if dialect in ("mysql", "mariadb"):
+        stmt = mysql.insert(table).values(values)
+        return stmt.on_duplicate_key_update({f: table.c[f] + stmt.inserted[f] for f in deltas})
+    insert = postgresql.insert if dialect == "postgresql" else sqlite.insert
+    stmt = insert(table).values(values)
+    return stmt.on_conflict_do_update(
+        index_elements=list(key),
+        set_={f: table.c[f] + stmt.excluded[f] for f in deltas},
+    )
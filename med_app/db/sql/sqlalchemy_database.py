@@ -0,0 +1,219 @@
+# app/database/sql/sqlalchemy_database.py
+
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence
+
+from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy import case, text, select, insert as sql_insert, update as sql_update, delete as sql_delete
+
+from ..base.idatabase import IDatabase
+from ..base.query_spec import Join, Metrics, OrderBy, search_terms
+from .engine_options import get_engine_options
+from .query_builder import (
+    apply_filters, apply_keyset, apply_ordering, apply_page, build_aggregate, build_upsert_increment,
+)
+from .text_search import build_search
+
+
+class SQLAlchemyDatabase(IDatabase):
+    """
+    Async SQLAlchemy implementation shared by the SQL backends.
+
+    CRUD methods accept an optional ``session``. When the request's session is
+    passed in, statements run inside it and are only flushed, so the caller
+    commits once for the whole unit of work. Without one, a short-lived
+    session is opened and committed per call.
+    """
+
+    def __init__(self, db_url: str):
+        self.db_url = db_url
+        self.engine = None
+        self.SessionLocal = None
+
+    async def connect(self) -> None:
+        self.engine = create_async_engine(self.db_url, **get_engine_options(self.db_url))
+        self.SessionLocal = sessionmaker(
+            bind=self.engine, class_=AsyncSession, expire_on_commit=False
+        )
+
+    async def disconnect(self) -> None:
+        if self.engine:
+            await self.engine.dispose()
+            self.engine = None
+            self.SessionLocal = None
+
+    def get_session(self) -> AsyncSession:
+        if not self.SessionLocal:
+            raise RuntimeError("Database not connected")
+        return self.SessionLocal()
+
+    async def close_session(self, session: AsyncSession) -> None:
+        await session.close()
+
+    async def commit(self, session: AsyncSession) -> None:
+        await session.commit()
+
+    async def rollback(self, session: AsyncSession) -> None:
+        await session.rollback()
+
+    @asynccontextmanager
+    async def _session_scope(
+        self, session: Optional[AsyncSession] = None
+    ) -> AsyncIterator[AsyncSession]:
+        if session is not None:
+            yield session
+            return
+        session = self.get_session()
+        async with session:
+            yield session
+            await session.commit()
+
+    async def create(
+        self, table_or_collection: Any, data: Dict, session: Optional[AsyncSession] = None
+    ) -> Any:
+        async with self._session_scope(session) as s:
+            obj = table_or_collection(**data)
+            s.add(obj)
+            await s.flush()
+            return obj
+
+    async def create_many(
+        self, table_or_collection: Any, rows: List[Dict], returning: bool = True,
+        session: Optional[AsyncSession] = None,
+    ) -> List[Any]:
+        if not rows:
+            return []
+        async with self._session_scope(session) as s:
+            if not returning:
+                await s.execute(sql_insert(table_or_collection), rows)  # executemany
+                return []
+            objs = [table_or_collection(**data) for data in rows]
+            s.add_all(objs)
+            # One flush: the ORM batches the INSERTs as multi-row INSERT ... RETURNING
+            # where the backend can keep key order (PostgreSQL, MariaDB); SQLite
+            # falls back to one in-process INSERT per row.
+            await s.flush()
+            return objs
+
+    async def read(
+        self, table_or_collection: Any, filters: Optional[Dict] = None,
+        session: Optional[AsyncSession] = None,
+        order_by: OrderBy = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        after: Optional[Sequence[Any]] = None,
+    ) -> List[Any]:
+        async with self._session_scope(session) as s:
+            stmt = apply_filters(select(table_or_collection), table_or_collection, filters)
+            stmt = apply_keyset(stmt, table_or_collection, order_by, after)
+            stmt = apply_ordering(stmt, table_or_collection, order_by)
+            stmt = apply_page(stmt, limit, offset)
+            result = await s.execute(stmt)
+            return result.scalars().all()
+
+    async def stream(
+        self, table_or_collection: Any, filters: Optional[Dict] = None,
+        order_by: OrderBy = None, columns: Optional[Sequence[str]] = None,
+        batch_size: int = 1000, session: Optional[AsyncSession] = None,
+    ) -> AsyncIterator[Dict]:
+        # Core columns rather than ORM entities: nothing accumulates in the identity map.
+        table = table_or_collection.__table__
+        selected = [table.c[name] for name in columns] if columns else list(table.c)
+        stmt = apply_filters(select(*selected), table_or_collection, filters)
+        stmt = apply_ordering(stmt, table_or_collection, order_by)
+        async with self._session_scope(session) as s:
+            result = await s.stream(stmt.execution_options(yield_per=batch_size))
+            # One greenlet hop per batch, not per row.
+            async for batch in result.mappings().partitions():
+                for row in batch:
+                    yield dict(row)
+
+    async def search(
+        self, table_or_collection: Any, text: str, match_all: bool = True,
+        limit: Optional[int] = None, offset: Optional[int] = None,
+        filters: Optional[Dict] = None, session: Optional[AsyncSession] = None,
+    ) -> List[Any]:
+        terms = search_terms(text)
+        if not terms:
+            return []
+        stmt = build_search(
+            table_or_collection, self.engine.dialect.name, terms,
+            match_all=match_all, limit=limit, offset=offset, filters=filters,
+        )
+        async with self._session_scope(session) as s:
+            result = await s.execute(stmt)
+            return result.scalars().all()
+
+    async def aggregate(
+        self, table_or_collection: Any, metrics: Metrics,
+        filters: Optional[Dict] = None, group_by: Optional[Sequence[str]] = None,
+        join: Join = None, order_by: OrderBy = None,
+        session: Optional[AsyncSession] = None,
+    ) -> List[Dict]:
+        stmt = build_aggregate(
+            table_or_collection, self.engine.dialect.name, metrics,
+            filters=filters, group_by=group_by, join=join, order_by=order_by,
+        )
+        async with self._session_scope(session) as s:
+            result = await s.execute(stmt)
+            return [dict(row) for row in result.mappings().all()]
+
+    async def update(
+        self, table_or_collection: Any, filters: Dict, updates: Dict,
+        session: Optional[AsyncSession] = None,
+    ) -> int:
+        async with self._session_scope(session) as s:
+            stmt = sql_update(table_or_collection).values(**updates)
+            stmt = apply_filters(stmt, table_or_collection, filters)
+            result = await s.execute(stmt)
+            return result.rowcount
+
+    async def update_many(
+        self, table_or_collection: Any, key: str, rows: List[Dict],
+        session: Optional[AsyncSession] = None,
+    ) -> int:
+        if not rows:
+            return 0
+        async with self._session_scope(session) as s:
+            # ORM bulk UPDATE by primary key: one executemany; ``key`` must be the PK
+            await s.execute(sql_update(table_or_collection), rows)
+            return len(rows)
+
+    async def upsert_increment(
+        self, table_or_collection: Any, key: Dict, deltas: Dict,
+        session: Optional[AsyncSession] = None,
+    ) -> None:
+        async with self._session_scope(session) as s:
+            stmt = build_upsert_increment(table_or_collection, self.engine.dialect.name, key, deltas)
+            await s.execute(stmt)
+
+    async def increment_many(
+        self, table_or_collection: Any, key: str, field: str, deltas: Dict,
+        filters: Optional[Dict] = None, floor: Optional[Any] = None,
+        session: Optional[AsyncSession] = None,
+    ) -> int:
+        if not deltas:
+            return 0
+        async with self._session_scope(session) as s:
+            key_col = getattr(table_or_collection, key)
+            new_value = getattr(table_or_collection, field) + case(deltas, value=key_col)
+            stmt = sql_update(table_or_collection).values({field: new_value}).where(key_col.in_(list(deltas)))
+            if floor is not None:
+                stmt = stmt.where(new_value >= floor)
+            stmt = apply_filters(stmt, table_or_collection, filters)
+            result = await s.execute(stmt)
+            return result.rowcount
+
+    async def delete(
+        self, table_or_collection: Any, filters: Dict, session: Optional[AsyncSession] = None
+    ) -> int:
+        async with self._session_scope(session) as s:
+            stmt = apply_filters(sql_delete(table_or_collection), table_or_collection, filters)
+            result = await s.execute(stmt)
+            return result.rowcount
+
+    async def execute_query(self, raw_sql: str, session: Optional[AsyncSession] = None) -> Any:
+        async with self._session_scope(session) as s:
+            result = await s.execute(text(raw_sql))
+            return result.fetchall()
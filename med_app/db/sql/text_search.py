@@ -0,0 +1,57 @@
+# app/database/sql/text_search.py
+
+"""
+Ranked full-text search over a model's ``__search_fields__``.
+
+The index itself is created by migration v0002:
+
+* SQLite     -- external-content FTS5 table ``<table>_fts`` kept in sync by
+                triggers; ranked with ``bm25`` using the field weights.
+* PostgreSQL -- generated ``search_vector`` tsvector column with a GIN index;
+                ranked with ``ts_rank``.
+* MySQL      -- FULLTEXT index queried in boolean mode.
+
+Every term is matched as a prefix, so ``"para 50"`` finds "Paracetamol 500".
+"""
+
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import column, func, literal_column, select, table
+from sqlalchemy.dialects.mysql import match as mysql_match
+
+from .query_builder import apply_filters, apply_page
+
+def build_search(
+    model: Any, dialect: str, terms: List[str], match_all: bool = True,
+    limit: Optional[int] = None, offset: Optional[int] = None,
+    filters: Optional[Dict] = None,
+) -> Any:
+    fields = model.__search_fields__
+    pk = model.__mapper__.primary_key[0]
+
+    if dialect == "postgresql":
+        joiner = " & " if match_all else " | "
+        query = func.to_tsquery("simple", joiner.join(f"{t}:*" for t in terms))
+        vector = literal_column(f"{model.__tablename__}.search_vector")
+        rank = func.ts_rank(vector, query)
+        stmt = select(model).where(vector.op("@@")(query)).order_by(rank.desc(), pk)
+    elif dialect in ("mysql", "mariadb"):
+        prefix = "+" if match_all else ""
+        score = mysql_match(
+            *[getattr(model, name) for name in fields],
+            against=" ".join(f"{prefix}{t}*" for t in terms),
+        ).in_boolean_mode()
+        stmt = select(model).where(score).order_by(score.desc(), pk)
+    else:
+        fts_name = f"{model.__tablename__}_fts"
+        fts = table(fts_name, column("rowid"))
+        joiner = " AND " if match_all else " OR "
+        query = joiner.join(f'"{t}"*' for t in terms)
+        rank = func.bm25(literal_column(fts_name), *fields.values())
+        stmt = (
+            select(model)
+            .join(fts, fts.c.rowid == pk)
+            .where(literal_column(fts_name).op("MATCH")(query))
+            .order_by(rank, pk)
+        )
+    return apply_page(apply_filters(stmt, model, filters), limit, offset)
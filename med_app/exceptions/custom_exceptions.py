@@ -14,4 +14,7 @@ class NotFoundException(Exception):
     pass
 
 class UnauthorizedException(Exception):
-    pass
\ No newline at end of file
+    pass
+
+class InvalidCursorException(Exception):
+    pass
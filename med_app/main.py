@@ -1,7 +1,13 @@
 # med_backend/app/main.py
 
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from .config import settings
+from .db.base.engine_registry import engine_registry
+from .utils import process_pool
+from .utils.invoice_jobs import invoice_render_queue
 from .api.customer import (
     customer_api,
     medicine_api,
@@ -23,12 +29,27 @@ from .api.distributor import (
     distributor_invoice_api,
     distributor_notification_api,
 )
+from .api.imports import csv_import_api
+from .api.invoices import invoice_pdf_api
+
+# ✅ Shared engine / connection pool for the whole process
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    await engine_registry.get(settings.dp_type)
+    try:
+        yield
+    finally:
+        await invoice_render_queue.stop()
+        process_pool.shutdown()
+        await engine_registry.dispose_all()
+
 
 # ✅ Initialize app
 app = FastAPI(
     title="Medical Backend API",
     description="API for authentication, medicines, carts, and orders",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan,
 )
 
 # ✅ Enable CORS (important for frontend or Swagger auth)
@@ -53,6 +74,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor"],  # keyset pagination cursor on list endpoints
 )
 
 
@@ -72,6 +94,8 @@ app.include_router(distributor_stock_api.router, tags=["Distributor Stock"])
 app.include_router(distributor_report_api.router, tags=["Distributor Dashboard & Reports"])
 app.include_router(distributor_invoice_api.router, tags=["Distributor Invoices"])
 app.include_router(distributor_notification_api.router, tags=["Distributor Notifications"])
+app.include_router(csv_import_api.router, tags=["Bulk Import"])
+app.include_router(invoice_pdf_api.router, tags=["Invoice PDFs"])
 
 # ✅ Root endpoint
 @app.get("/", tags=["Root"])
@@ -4,6 +4,8 @@ from ...models.base_class import Base
 
 class MedicineDbModel(Base):
     __tablename__ = "medicines"
+    # Full-text search fields and their relative weights (see db/sql/text_search.py)
+    __search_fields__ = {"name": 10.0, "generic_name": 5.0, "category": 2.0, "manufacturer": 1.0}
 
     medicine_id = Column(Integer, primary_key=True, index=True)
     name = Column(String, nullable=False)  # Brand or product name
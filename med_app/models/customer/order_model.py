@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, DECIMAL, Enum
+from sqlalchemy import Column, Integer, String, DateTime, DECIMAL, Enum, Index
 from datetime import datetime
 import enum
 from ...models.base_class import Base
@@ -14,6 +14,10 @@ class OrderStatusEnum(str, enum.Enum):
 
 class OrderDbModel(Base):
     __tablename__ = "orders"
+    __table_args__ = (
+        Index("ix_orders_retailer_id_order_date", "retailer_id", "order_date"),
+        Index("ix_orders_customer_id", "customer_id"),
+    )
 
     order_id = Column(Integer, primary_key=True, index=True)
     customer_id = Column(Integer, nullable=True)
@@ -25,6 +29,9 @@ class OrderDbModel(Base):
 
 class OrderItemDbModel(Base):
     __tablename__ = "order_items"
+    __table_args__ = (
+        Index("ix_order_items_order_id", "order_id"),
+    )
 
     order_item_id = Column(Integer, primary_key=True, index=True)
     order_id = Column(Integer, nullable=False)
@@ -1,9 +1,12 @@
-from sqlalchemy import Column, Integer, String, Boolean, DateTime
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, Index
 from datetime import datetime
 from ...models.base_class import Base
 
 class DistributorNotificationDbModel(Base):
     __tablename__ = "distributor_notifications"
+    __table_args__ = (
+        Index("ix_distributor_notifications_distributor_id_is_read_created_at", "distributor_id", "is_read", "created_at"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     distributor_id = Column(Integer, nullable=True)  # optional if per-distributor
@@ -1,8 +1,11 @@
-from sqlalchemy import Column, Integer, String, DECIMAL, Date
+from sqlalchemy import Column, Integer, String, DECIMAL, Date, Index
 from ...models.base_class import Base
 
 class DistributorStockDbModel(Base):
     __tablename__ = "distributor_stock"
+    __table_args__ = (
+        Index("ix_distributor_stock_distributor_id_medicine_id_expiry_date", "distributor_id", "medicine_id", "expiry_date"),
+    )
 
     stock_id = Column(Integer, primary_key=True, index=True)
     distributor_id = Column(Integer, nullable=False)  
@@ -0,0 +1,28 @@
+from sqlalchemy import Column, Integer, String, Date, DECIMAL, UniqueConstraint
+from ...models.base_class import Base
+
+# Which orders a rollup row summarises
+RETAILER_SALES = "retailer"        # customer orders, owner_id = retailer_id
+DISTRIBUTOR_SALES = "distributor"  # retailer orders, owner_id = distributor_id
+
+# medicine_id of the per-order totals row (order_count / sales_amount);
+# rows with a real medicine_id carry that medicine's quantity / revenue.
+ORDER_TOTALS = 0
+
+
+class DailySalesRollupDbModel(Base):
+    __tablename__ = "daily_sales_rollup"
+    __table_args__ = (
+        UniqueConstraint("scope", "owner_id", "day", "status", "medicine_id", name="uq_daily_sales_rollup_key"),
+    )
+
+    rollup_id = Column(Integer, primary_key=True, index=True)
+    scope = Column(String(20), nullable=False)
+    owner_id = Column(Integer, nullable=False)
+    day = Column(Date, nullable=False)
+    status = Column(String(20), nullable=False)
+    medicine_id = Column(Integer, nullable=False, default=ORDER_TOTALS)
+    order_count = Column(Integer, nullable=False, default=0)
+    sales_amount = Column(DECIMAL(14, 2), nullable=False, default=0)
+    quantity = Column(Integer, nullable=False, default=0)
+    revenue = Column(DECIMAL(14, 2), nullable=False, default=0)
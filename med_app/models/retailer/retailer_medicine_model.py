@@ -1,10 +1,13 @@
-from sqlalchemy import Column, Integer, ForeignKey, String, DECIMAL, Date
+from sqlalchemy import Column, Integer, ForeignKey, String, DECIMAL, Date, Index
 from sqlalchemy.orm import relationship
 from ..base_class import Base
 
 
 class RetailerMedicineDbModel(Base):
     __tablename__ = "retailer_medicines"
+    __table_args__ = (
+        Index("ix_retailer_medicines_retailer_id_name", "retailer_id", "name"),
+    )
 
     retailer_medicine_id = Column(Integer, primary_key=True, index=True)
     retailer_id = Column(Integer, nullable=False)
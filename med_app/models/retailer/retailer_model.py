@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DECIMAL, DateTime
+from sqlalchemy import Column, Integer, String, DECIMAL, DateTime, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from ...models.base_class import Base
@@ -29,6 +29,9 @@ from ...models.base_class import Base
 
 class RetailerDbModel(Base):
     __tablename__ = "retailers"
+    __table_args__ = (
+        Index("ix_retailers_zip_code", "zip_code"),
+    )
 
     retailer_id = Column(Integer, primary_key=True, index=True)
     shop_name = Column(String, nullable=True)
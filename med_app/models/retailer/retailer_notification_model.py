@@ -1,10 +1,13 @@
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, ForeignKey, Index
 from datetime import datetime
 from ...models.base_class import Base
 
 
 class RetailerNotificationDbModel(Base):
     __tablename__ = "retailer_notifications"
+    __table_args__ = (
+        Index("ix_retailer_notifications_retailer_id_is_read_created_at", "retailer_id", "is_read", "created_at"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     retailer_id = Column(Integer, nullable=True)  # optional if per-user
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, DECIMAL, Enum
+from sqlalchemy import Column, Integer, String, Date, DateTime, DECIMAL, Enum, Index
 from datetime import datetime
 import enum
 from ...models.base_class import Base
@@ -14,6 +14,10 @@ class OrderStatusEnum(str, enum.Enum):
 
 class RetailerOrderDbModel(Base):
     __tablename__ = "retailer_orders"
+    __table_args__ = (
+        Index("ix_retailer_orders_retailer_id_order_date", "retailer_id", "order_date"),
+        Index("ix_retailer_orders_distributor_id_order_date", "distributor_id", "order_date"),
+    )
 
     order_id = Column(Integer, primary_key=True, index=True)
     customer_id = Column(Integer, nullable=True)
@@ -26,9 +30,27 @@ class RetailerOrderDbModel(Base):
 
 class RetailerOrderItemDbModel(Base):
     __tablename__ = "retailer_order_items"
+    __table_args__ = (
+        Index("ix_retailer_order_items_order_id", "order_id"),
+    )
 
     order_item_id = Column(Integer, primary_key=True, index=True)
     order_id = Column(Integer, nullable=False)
     medicine_id = Column(Integer, nullable=False)
     quantity = Column(Integer, nullable=False)
     price = Column(DECIMAL(10, 2), nullable=False)
+
+
+class RetailerOrderAllocationDbModel(Base):
+    """Distributor stock lot (and quantity) an order item was filled from."""
+    __tablename__ = "retailer_order_allocations"
+    __table_args__ = (
+        Index("ix_retailer_order_allocations_order_item_id", "order_item_id"),
+    )
+
+    allocation_id = Column(Integer, primary_key=True, index=True)
+    order_item_id = Column(Integer, nullable=False)
+    stock_id = Column(Integer, nullable=False)
+    batch_number = Column(String, nullable=True)
+    expiry_date = Column(Date, nullable=True)
+    quantity = Column(Integer, nullable=False)
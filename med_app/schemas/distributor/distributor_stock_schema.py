@@ -7,12 +7,12 @@ class DistributorStockBase(BaseModel):
     distributor_id: int
     medicine_id: int
     batch_number: Optional[str] = None
-    quantity: int = Field(..., gt=0)
+    quantity: int
     price: Decimal
     expiry_date: date
 
 class DistributorStockCreateModel(DistributorStockBase):
-    pass
+    quantity: int = Field(..., gt=0)
 
 class DistributorStockReadModel(DistributorStockBase):
     stock_id: int
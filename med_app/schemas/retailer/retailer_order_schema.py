@@ -1,16 +1,20 @@
-from pydantic import BaseModel
-from datetime import datetime
+from pydantic import BaseModel, Field
+from datetime import date, datetime
 from typing import List, Optional
 from decimal import Decimal
 from ...models.retailer.retailer_order_model import OrderStatusEnum
 
 
-class RetailerOrderItemCreateModel(BaseModel):
+class RetailerOrderItemBase(BaseModel):
     medicine_id: int
     quantity: int
     price: Decimal
 
 
+class RetailerOrderItemCreateModel(RetailerOrderItemBase):
+    quantity: int = Field(..., gt=0)
+
+
 class RetailerOrderCreateModel(BaseModel):
     retailer_id: int
     distributor_id: int
@@ -18,9 +22,20 @@ class RetailerOrderCreateModel(BaseModel):
     items: List[RetailerOrderItemCreateModel]
 
 
-class RetailerOrderItemReadModel(RetailerOrderItemCreateModel):
+class RetailerOrderAllocationReadModel(BaseModel):
+    stock_id: int
+    batch_number: Optional[str] = None
+    expiry_date: Optional[date] = None
+    quantity: int
+
+    class Config:
+        orm_mode = True
+
+
+class RetailerOrderItemReadModel(RetailerOrderItemBase):
     order_item_id: int
     order_id: int
+    allocations: List[RetailerOrderAllocationReadModel] = []
 
     class Config:
         orm_mode = True
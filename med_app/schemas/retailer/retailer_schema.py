@@ -55,8 +55,9 @@
 
 
 
-from datetime import datetime
-from typing import Optional, Union
+from datetime import date, datetime
+from decimal import Decimal
+from typing import List, Optional, Union
 from pydantic import BaseModel, EmailStr, Field
 
 class RetailerBase(BaseModel):
@@ -87,6 +88,10 @@ class RetailerDataCreateModel(RetailerBase):
     state: str
     zip_code: str
 
+class RetailerImportModel(RetailerBase):
+    """CSV onboarding row; password columns are ignored (set via the API)."""
+    shop_name: str
+
 class RetailerDataReadModel(RetailerBase):
     retailer_id: int
     shop_name: str
@@ -95,6 +100,32 @@ class RetailerDataReadModel(RetailerBase):
     class Config:
         orm_mode = True
 
+class RetailerNearbyReadModel(RetailerDataReadModel):
+    distance_km: float
+
+class BasketLineRequest(BaseModel):
+    name: str = Field(..., min_length=1)
+    quantity: int = Field(..., gt=0)
+
+class NearbyBasketRequest(BaseModel):
+    lat: float = Field(..., ge=-90, le=90)
+    lon: float = Field(..., ge=-180, le=180)
+    radius_km: float = Field(5.0, gt=0, le=100)
+    limit: int = Field(10, ge=1, le=50)
+    items: List[BasketLineRequest] = Field(..., min_length=1, max_length=50)
+
+class BasketLineMatchModel(BaseModel):
+    name: str
+    retailer_medicine_id: int
+    requested_quantity: int
+    available_quantity: int
+    price: Decimal
+    expiry_date: date
+
+class RetailerBasketMatchModel(RetailerNearbyReadModel):
+    items: List[BasketLineMatchModel]
+    basket_total: Decimal
+
 class RetailerDataUpdateModel(BaseModel):
     shop_name: Optional[str] = None
     owner_name: Optional[str] = None
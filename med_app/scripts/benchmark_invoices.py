@@ -0,0 +1,87 @@
+"""
+Invoice PDFs per second: original cell-by-cell renderer vs the compiled layout.
+
+    python -m med_app.scripts.benchmark_invoices
+    python -m med_app.scripts.benchmark_invoices --invoices 2000 --items 40 --pool
+
+Renders synthetic invoices (a handful of retailers, so the per-retailer
+block cache behaves as in a month-end run). ``--pool`` also measures the
+compiled renderer through the shared process pool in batches, as the
+invoice queue runs it.
+"""
+
+import argparse
+import asyncio
+import time
+from datetime import datetime
+from types import SimpleNamespace
+
+from ..utils.invoice_generator import render_invoice_batch, render_invoice_pdf, render_invoice_pdf_cells
+from ..utils import process_pool
+
+
+def synthetic_invoices(count: int, items: int, retailers: int = 5):
+    shops = [
+        SimpleNamespace(
+            shop_name=f"Pharmacy {r}", address_line1=f"{r} MG Road", city="Pune",
+            state="MH", zip_code="411001", gst_number=f"27ABCDE{r:04d}F1Z5",
+        )
+        for r in range(retailers)
+    ]
+    return [
+        (
+            SimpleNamespace(
+                order_date=datetime(2025, 1, 1 + i % 28),
+                items=[SimpleNamespace(medicine_id=100 + j, quantity=1 + j % 5, price=12.5 + j) for j in range(items)],
+            ),
+            shops[i % retailers],
+            i,
+            f"bench-{i}",
+        )
+        for i in range(count)
+    ]
+
+
+def rate(render, invoices) -> float:
+    started = time.perf_counter()
+    for order_data, retailer_data, order_id, _ in invoices:
+        render(order_data, retailer_data, order_id)
+    return len(invoices) / (time.perf_counter() - started)
+
+
+async def pool_rate(invoices, batch_size: int) -> float:
+    await process_pool.run_in_process(len, [])  # start the workers outside the timing
+    started = time.perf_counter()
+    await asyncio.gather(*(
+        process_pool.run_in_process(render_invoice_batch, invoices[i:i + batch_size])
+        for i in range(0, len(invoices), batch_size)
+    ))
+    return len(invoices) / (time.perf_counter() - started)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--invoices", type=int, default=500)
+    parser.add_argument("--items", type=int, default=8, help="line items per invoice")
+    parser.add_argument("--pool", action="store_true", help="also measure the process pool")
+    parser.add_argument("--batch-size", type=int, default=25)
+    args = parser.parse_args()
+
+    invoices = synthetic_invoices(args.invoices, args.items)
+    render_invoice_pdf(*invoices[0][:3])  # compile the static blocks once
+
+    before = rate(render_invoice_pdf_cells, invoices)
+    after = rate(render_invoice_pdf, invoices)
+    print(f"📄 {args.invoices} invoices x {args.items} items")
+    print(f"   cell-by-cell     {before:8.0f} invoices/s")
+    print(f"   compiled layout  {after:8.0f} invoices/s  ({after / before:.1f}x)")
+    if args.pool:
+        try:
+            pooled = asyncio.run(pool_rate(invoices, args.batch_size))
+        finally:
+            process_pool.shutdown()
+        print(f"   compiled, pool   {pooled:8.0f} invoices/s  ({process_pool.worker_count()} workers)")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,7 +3,7 @@ import enum
 from datetime import datetime
 from sqlalchemy import (
     DECIMAL, Boolean, Column, Date, DateTime, Enum,
-    ForeignKey, Integer, String
+    ForeignKey, Index, Integer, String, UniqueConstraint
 )
 from sqlalchemy.ext.asyncio import create_async_engine
 from sqlalchemy.orm import declarative_base, relationship
@@ -85,6 +85,9 @@ class CustomerDbModel(Base):
 
 class RetailerDbModel(Base):
     __tablename__ = "retailers"
+    __table_args__ = (
+        Index("ix_retailers_zip_code", "zip_code"),
+    )
 
     retailer_id = Column(Integer, primary_key=True, index=True)
     shop_name = Column(String, nullable=True)
@@ -141,6 +144,10 @@ class MedicineDbModel(Base):
 
 class OrderDbModel(Base):
     __tablename__ = "orders"
+    __table_args__ = (
+        Index("ix_orders_retailer_id_order_date", "retailer_id", "order_date"),
+        Index("ix_orders_customer_id", "customer_id"),
+    )
 
     order_id = Column(Integer, primary_key=True, index=True)
     customer_id = Column(Integer, nullable=True)
@@ -152,6 +159,9 @@ class OrderDbModel(Base):
 
 class OrderItemDbModel(Base):
     __tablename__ = "order_items"
+    __table_args__ = (
+        Index("ix_order_items_order_id", "order_id"),
+    )
 
     order_item_id = Column(Integer, primary_key=True, index=True)
     order_id = Column(Integer, nullable=False)
@@ -178,6 +188,9 @@ class RetailerStockDbModel(Base):
 
 class DistributorStockDbModel(Base):
     __tablename__ = "distributor_stock"
+    __table_args__ = (
+        Index("ix_distributor_stock_distributor_id_medicine_id_expiry_date", "distributor_id", "medicine_id", "expiry_date"),
+    )
 
     stock_id = Column(Integer, primary_key=True, index=True)
     distributor_id = Column(Integer, ForeignKey("distributors.distributor_id", ondelete="CASCADE"), nullable=False)
@@ -193,6 +206,9 @@ class DistributorStockDbModel(Base):
 
 class RetailerMedicineDbModel(Base):
     __tablename__ = "retailer_medicines"
+    __table_args__ = (
+        Index("ix_retailer_medicines_retailer_id_name", "retailer_id", "name"),
+    )
 
     retailer_medicine_id = Column(Integer, primary_key=True, index=True)
     retailer_id = Column(Integer, nullable=False)
@@ -260,6 +276,10 @@ class OrderStatusEnum(str, enum.Enum):
 
 class RetailerOrderDbModel(Base):
     __tablename__ = "retailer_orders"
+    __table_args__ = (
+        Index("ix_retailer_orders_retailer_id_order_date", "retailer_id", "order_date"),
+        Index("ix_retailer_orders_distributor_id_order_date", "distributor_id", "order_date"),
+    )
 
     order_id = Column(Integer, primary_key=True, index=True)
     customer_id = Column(Integer, nullable=True)
@@ -272,6 +292,9 @@ class RetailerOrderDbModel(Base):
 
 class RetailerOrderItemDbModel(Base):
     __tablename__ = "retailer_order_items"
+    __table_args__ = (
+        Index("ix_retailer_order_items_order_id", "order_id"),
+    )
 
     order_item_id = Column(Integer, primary_key=True, index=True)
     order_id = Column(Integer, nullable=False)
@@ -280,6 +303,20 @@ class RetailerOrderItemDbModel(Base):
     price = Column(DECIMAL(10, 2), nullable=False)
 
 
+class RetailerOrderAllocationDbModel(Base):
+    __tablename__ = "retailer_order_allocations"
+    __table_args__ = (
+        Index("ix_retailer_order_allocations_order_item_id", "order_item_id"),
+    )
+
+    allocation_id = Column(Integer, primary_key=True, index=True)
+    order_item_id = Column(Integer, nullable=False)
+    stock_id = Column(Integer, nullable=False)
+    batch_number = Column(String, nullable=True)
+    expiry_date = Column(Date, nullable=True)
+    quantity = Column(Integer, nullable=False)
+
+
 # --------------------------------------------------------------------------
 # Retailer Invoice 
 # --------------------------------------------------------------------------
@@ -344,6 +381,9 @@ class DistributorInvoiceItemDbModel(Base):
 
 class RetailerNotificationDbModel(Base):
     __tablename__ = "retailer_notifications"
+    __table_args__ = (
+        Index("ix_retailer_notifications_retailer_id_is_read_created_at", "retailer_id", "is_read", "created_at"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     retailer_id = Column(Integer, nullable=True)  # optional if per-user
@@ -360,6 +400,9 @@ class RetailerNotificationDbModel(Base):
 
 class DistributorNotificationDbModel(Base):
     __tablename__ = "distributor_notifications"
+    __table_args__ = (
+        Index("ix_distributor_notifications_distributor_id_is_read_created_at", "distributor_id", "is_read", "created_at"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     distributor_id = Column(Integer, nullable=True)  # optional if per-distributor
@@ -369,6 +412,28 @@ class DistributorNotificationDbModel(Base):
     is_read = Column(Boolean, default=False)
     created_at = Column(DateTime, default=datetime.utcnow)
 
+# --------------------------------------------------------------------------
+# Daily Sales Rollup (maintained by SalesRollupManager)
+# --------------------------------------------------------------------------
+
+
+class DailySalesRollupDbModel(Base):
+    __tablename__ = "daily_sales_rollup"
+    __table_args__ = (
+        UniqueConstraint("scope", "owner_id", "day", "status", "medicine_id", name="uq_daily_sales_rollup_key"),
+    )
+
+    rollup_id = Column(Integer, primary_key=True, index=True)
+    scope = Column(String(20), nullable=False)  # 'retailer' or 'distributor'
+    owner_id = Column(Integer, nullable=False)
+    day = Column(Date, nullable=False)
+    status = Column(String(20), nullable=False)
+    medicine_id = Column(Integer, nullable=False, default=0)  # 0 = order totals row
+    order_count = Column(Integer, nullable=False, default=0)
+    sales_amount = Column(DECIMAL(14, 2), nullable=False, default=0)
+    quantity = Column(Integer, nullable=False, default=0)
+    revenue = Column(DECIMAL(14, 2), nullable=False, default=0)
+
 # --------------------------------------------------------------------------
 # DB Initialization
 # --------------------------------------------------------------------------
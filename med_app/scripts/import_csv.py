@@ -0,0 +1,65 @@
+"""
+Stream a CSV file into the database in committed chunks.
+
+    python -m med_app.scripts.import_csv medicines catalog.csv
+    python -m med_app.scripts.import_csv distributor_stock stock.csv --chunk-size 5000
+    python -m med_app.scripts.import_csv retailers pharmacies.csv --resume
+
+Kinds: retailers, medicines, distributor_stock, retailer_medicines. Columns
+are the fields of the matching create schema. Rows are upserted on each
+kind's natural key (see IMPORT_TARGETS), so re-running a file is safe;
+rows missing every key (e.g. stock without a batch_number) are rejected
+and listed in the report.
+Progress is checkpointed to <file>.progress after every chunk; --resume
+continues from there after an interruption.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+
+from ..db.base.engine_registry import engine_registry
+from ..crud.imports.csv_import_manager import CsvImportManager, IMPORT_TARGETS, DEFAULT_CHUNK_SIZE, ImportReport
+from ..utils.db_manager import get_manager
+
+
+async def run(kind: str, path: str, chunk_size: int, resume: bool) -> None:
+    checkpoint = f"{path}.progress"
+    skip_rows = 0
+    if resume and os.path.exists(checkpoint):
+        with open(checkpoint) as fh:
+            skip_rows = json.load(fh)["last_row"]
+        print(f"↪️  Resuming after row {skip_rows}")
+
+    def save_progress(report: ImportReport) -> None:
+        with open(checkpoint, "w") as fh:
+            json.dump({"kind": kind, "last_row": report.last_row}, fh)
+
+    try:
+        with open(path, encoding="utf-8-sig", newline="") as lines:
+            async with get_manager(CsvImportManager) as manager:
+                report = await manager.import_csv(
+                    kind, lines, chunk_size=chunk_size, skip_rows=skip_rows, on_chunk=save_progress
+                )
+    finally:
+        await engine_registry.dispose_all()
+
+    if os.path.exists(checkpoint):
+        os.remove(checkpoint)
+    print(
+        f"✅ {kind}: {report.processed} rows read, {report.inserted} inserted, "
+        f"{report.updated} updated, {report.failed} rejected."
+    )
+    for error in report.errors:
+        print(f"  row {error['row']}: {'; '.join(error['errors'])}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Bulk CSV import")
+    parser.add_argument("kind", choices=sorted(IMPORT_TARGETS))
+    parser.add_argument("path")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE)
+    parser.add_argument("--resume", action="store_true")
+    args = parser.parse_args()
+    asyncio.run(run(args.kind, args.path, args.chunk_size, args.resume))
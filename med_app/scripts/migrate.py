@@ -0,0 +1,41 @@
+"""
+Apply pending schema migrations to the configured SQL database.
+
+    python -m med_app.scripts.migrate            # apply everything pending
+    python -m med_app.scripts.migrate --list     # show pending migrations
+    python -m med_app.scripts.migrate 1          # apply up to version 1
+
+Index migrations use online DDL, so this can run against a live database.
+"""
+
+import asyncio
+import sys
+
+from ..config import settings
+from ..db.base.engine_registry import engine_registry
+from ..db.migrations.runner import MigrationRunner
+
+
+async def main(args) -> None:
+    db = await engine_registry.get(settings.dp_type)
+    try:
+        if getattr(db, "engine", None) is None:
+            sys.exit("Migrations only apply to SQL backends.")
+        runner = MigrationRunner(db.engine)
+
+        if "--list" in args:
+            pending = await runner.pending()
+            for module in pending:
+                print(f"{module.VERSION:04d}  {module.DESCRIPTION}")
+            print(f"{len(pending)} pending migration(s).")
+            return
+
+        target = int(args[0]) if args else None
+        applied = await runner.upgrade(target)
+        print(f"✅ Applied migrations: {applied or 'none (already up to date)'}")
+    finally:
+        await engine_registry.dispose_all()
+
+
+if __name__ == "__main__":
+    asyncio.run(main(sys.argv[1:]))
@@ -0,0 +1,43 @@
+"""
+Backfill / rebuild the daily_sales_rollup table from the order tables.
+
+    python -m med_app.scripts.rebuild_sales_rollup              # both scopes
+    python -m med_app.scripts.rebuild_sales_rollup retailer     # customer orders only
+    python -m med_app.scripts.rebuild_sales_rollup distributor  # retailer orders only
+
+``python -m med_app.scripts.migrate`` creates and backfills the table
+(migration 4); run this whenever the rollup is suspected to have drifted
+(e.g. after editing orders directly in the database).
+"""
+
+import asyncio
+import sys
+
+from ..config import settings
+from ..db.base.engine_registry import engine_registry
+from ..models.base_class import Base
+from ..models.report.daily_sales_rollup_model import DailySalesRollupDbModel
+from ..crud.report.sales_rollup_manager import SalesRollupManager, ROLLUP_SOURCES
+from ..utils.db_manager import get_manager
+
+
+async def rebuild(scope: str = None) -> None:
+    db = await engine_registry.get(settings.dp_type)
+    try:
+        if getattr(db, "engine", None) is not None:
+            # Create the rollup table if this database predates it
+            async with db.engine.begin() as conn:
+                await conn.run_sync(Base.metadata.create_all, tables=[DailySalesRollupDbModel.__table__])
+
+        async with get_manager(SalesRollupManager) as manager:
+            rows = await manager.rebuild(scope)
+        print(f"✅ daily_sales_rollup rebuilt: {rows} rows.")
+    finally:
+        await engine_registry.dispose_all()
+
+
+if __name__ == "__main__":
+    scope = sys.argv[1] if len(sys.argv) > 1 else None
+    if scope and scope not in ROLLUP_SOURCES:
+        sys.exit(f"Unknown scope '{scope}'. Use one of: {', '.join(ROLLUP_SOURCES)}")
+    asyncio.run(rebuild(scope))
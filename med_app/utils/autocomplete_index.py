@@ -0,0 +1,146 @@
+"""
+In-memory, typo-tolerant autocomplete over retailer product names.
+
+Each retailer gets its own trigram index, loaded from the database on first
+use and then kept current by ``RetailerMedicineManager`` (via
+``DatabaseManager.after_commit``). Entries older than
+``settings.autocomplete_ttl_seconds`` are reloaded so workers that did not
+see a write converge.
+
+Scoring: the share of the query's trigrams found in the product name (so
+"paracetmol" still finds "Paracetamol"), plus bonuses when the name or one
+of its words starts with the query.
+"""
+
+import heapq
+import re
+import time
+import unicodedata
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Set
+
+from ..config import settings
+
+MIN_SCORE = 0.4
+_NON_WORD = re.compile(r"[^\w]+", re.UNICODE)
+
+
+def normalize(text: Optional[str]) -> str:
+    text = unicodedata.normalize("NFKD", text or "").encode("ascii", "ignore").decode()
+    return _NON_WORD.sub(" ", text.lower()).strip()
+
+
+def trigrams(text: str) -> Set[str]:
+    # Two leading spaces make short prefixes ("p", "pa") produce trigrams too.
+    padded = f"  {text} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+@dataclass
+class _Entry:
+    product_id: int
+    name: str
+    generic_name: Optional[str]
+    terms: List[str]           # normalized name / generic name
+    grams: Set[str]
+
+
+@dataclass
+class RetailerIndex:
+    entries: Dict[int, _Entry] = field(default_factory=dict)
+    postings: Dict[str, Set[int]] = field(default_factory=lambda: defaultdict(set))
+    loaded_at: float = field(default_factory=time.monotonic)
+
+    def add(self, product_id: int, name: str, generic_name: Optional[str] = None) -> None:
+        self.remove(product_id)
+        terms = [t for t in (normalize(name), normalize(generic_name)) if t]
+        grams = set().union(*(trigrams(t) for t in terms)) if terms else set()
+        self.entries[product_id] = _Entry(product_id, name, generic_name, terms, grams)
+        for gram in grams:
+            self.postings[gram].add(product_id)
+
+    def remove(self, product_id: int) -> None:
+        entry = self.entries.pop(product_id, None)
+        if entry is None:
+            return
+        for gram in entry.grams:
+            ids = self.postings.get(gram)
+            if ids is not None:
+                ids.discard(product_id)
+                if not ids:
+                    del self.postings[gram]
+
+    def suggest(self, query: str, limit: int = 10) -> List[Dict]:
+        q = normalize(query)
+        if not q:
+            return []
+        q_grams = trigrams(q)
+
+        hits: Dict[int, int] = defaultdict(int)
+        for gram in q_grams:
+            for product_id in self.postings.get(gram, ()):
+                hits[product_id] += 1
+
+        scored = []
+        for product_id, shared in hits.items():
+            score = shared / len(q_grams)
+            if score < MIN_SCORE:
+                continue
+            entry = self.entries[product_id]
+            if any(t.startswith(q) for t in entry.terms):
+                score += 1.0
+            elif any(word.startswith(q) for t in entry.terms for word in t.split()):
+                score += 0.5
+            scored.append((score, -len(entry.name), product_id))
+
+        best = heapq.nlargest(limit, scored)
+        return [
+            {
+                "retailer_medicine_id": product_id,
+                "name": self.entries[product_id].name,
+                "generic_name": self.entries[product_id].generic_name,
+                "score": round(score, 3),
+            }
+            for score, _, product_id in best
+        ]
+
+
+class ProductAutocomplete:
+    """Process-wide registry of per-retailer indexes."""
+
+    def __init__(self, ttl_seconds: float):
+        self.ttl_seconds = ttl_seconds
+        self._indexes: Dict[int, RetailerIndex] = {}
+
+    def get(self, retailer_id: int) -> Optional[RetailerIndex]:
+        index = self._indexes.get(retailer_id)
+        if index is not None and time.monotonic() - index.loaded_at > self.ttl_seconds:
+            del self._indexes[retailer_id]
+            return None
+        return index
+
+    def load(self, retailer_id: int, products: Iterable) -> RetailerIndex:
+        index = RetailerIndex()
+        for p in products:
+            index.add(p.retailer_medicine_id, p.name, p.generic_name)
+        self._indexes[retailer_id] = index
+        return index
+
+    # Incremental updates only touch retailers that are already loaded;
+    # others are built from the database on their next lookup.
+    def upsert(self, retailer_id: int, product_id: int, name: str, generic_name: Optional[str]) -> None:
+        index = self._indexes.get(retailer_id)
+        if index is not None:
+            index.add(product_id, name, generic_name)
+
+    def remove(self, retailer_id: int, product_id: int) -> None:
+        index = self._indexes.get(retailer_id)
+        if index is not None:
+            index.remove(product_id)
+
+    def clear(self) -> None:
+        self._indexes.clear()
+
+
+product_autocomplete = ProductAutocomplete(settings.autocomplete_ttl_seconds)
@@ -2,12 +2,16 @@ from contextlib import asynccontextmanager
 from ..db.base.database_manager import DatabaseManager
 from ..config import settings
 
-# Generic manager factory
+# Generic manager factory: one session / one transaction per scope
 @asynccontextmanager
 async def get_manager(manager_class):
     db_manager = DatabaseManager(settings.dp_type)
     await db_manager.connect()
     try:
         yield manager_class(db_manager)
+        await db_manager.commit()
+    except BaseException:
+        await db_manager.rollback()
+        raise
     finally:
         await db_manager.disconnect()
@@ -0,0 +1,140 @@
+"""
+In-memory spatial index over retailer locations.
+
+Retailers are bucketed into a fixed lat/lon grid (``CELL_DEGREES`` per side,
+~5.5 km at the equator). A radius query only visits the cells overlapping the
+search circle's bounding box and computes exact haversine distances for the
+retailers in them, so lookups stay proportional to local density rather than
+to the total number of retailers.
+
+The index is loaded from the database on first use and kept current by
+``RetailerManager`` (via ``DatabaseManager.after_commit``). It is rebuilt
+after ``settings.geo_index_ttl_seconds`` so workers that did not see a write
+converge.
+"""
+
+import heapq
+import math
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from ..config import settings
+
+EARTH_RADIUS_KM = 6371.0088
+KM_PER_DEGREE_LAT = 111.32
+CELL_DEGREES = 0.05
+
+Cell = Tuple[int, int]
+
+
+def haversine_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    phi1, phi2 = math.radians(lat1), math.radians(lat2)
+    dphi = phi2 - phi1
+    dlmb = math.radians(lon2 - lon1)
+    a = math.sin(dphi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(dlmb / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * math.asin(min(1.0, math.sqrt(a)))
+
+
+def _cell(lat: float, lon: float) -> Cell:
+    return math.floor(lat / CELL_DEGREES), math.floor(lon / CELL_DEGREES)
+
+
+@dataclass
+class GeoIndex:
+    points: Dict[int, Tuple[float, float]] = field(default_factory=dict)
+    cells: Dict[Cell, Set[int]] = field(default_factory=lambda: defaultdict(set))
+    loaded_at: float = field(default_factory=time.monotonic)
+
+    def add(self, retailer_id: int, lat: Optional[float], lon: Optional[float]) -> None:
+        self.remove(retailer_id)
+        if lat is None or lon is None:
+            return
+        lat, lon = float(lat), float(lon)
+        self.points[retailer_id] = (lat, lon)
+        self.cells[_cell(lat, lon)].add(retailer_id)
+
+    def remove(self, retailer_id: int) -> None:
+        point = self.points.pop(retailer_id, None)
+        if point is None:
+            return
+        cell = _cell(*point)
+        ids = self.cells.get(cell)
+        if ids is not None:
+            ids.discard(retailer_id)
+            if not ids:
+                del self.cells[cell]
+
+    def _candidates(self, lat: float, lon: float, radius_km: float) -> Iterable[int]:
+        dlat = radius_km / KM_PER_DEGREE_LAT
+        # Longitude degrees shrink towards the poles; clamp so the box stays finite.
+        dlon = radius_km / (KM_PER_DEGREE_LAT * max(math.cos(math.radians(lat)), 0.01))
+        (row_min, col_min), (row_max, col_max) = _cell(lat - dlat, lon - dlon), _cell(lat + dlat, lon + dlon)
+
+        # A huge radius covers more cells than there are occupied ones.
+        if (row_max - row_min + 1) * (col_max - col_min + 1) > len(self.cells):
+            return self.points.keys()
+        return [
+            retailer_id
+            for row in range(row_min, row_max + 1)
+            for col in range(col_min, col_max + 1)
+            for retailer_id in self.cells.get((row, col), ())
+        ]
+
+    def nearby(
+        self, lat: float, lon: float, radius_km: float,
+        limit: Optional[int] = None, among: Optional[Iterable[int]] = None,
+    ) -> List[Tuple[int, float]]:
+        """
+        ``(retailer_id, distance_km)`` within ``radius_km``, nearest first.
+        ``among`` restricts the search to a known candidate set (e.g. the
+        retailers stocking a basket), skipping the grid walk.
+        """
+        if among is None:
+            candidates = self._candidates(lat, lon, radius_km)
+        else:
+            candidates = [retailer_id for retailer_id in among if retailer_id in self.points]
+        hits = []
+        for retailer_id in candidates:
+            p_lat, p_lon = self.points[retailer_id]
+            distance = haversine_km(lat, lon, p_lat, p_lon)
+            if distance <= radius_km:
+                hits.append((distance, retailer_id))
+        best = heapq.nsmallest(limit, hits) if limit is not None else sorted(hits)
+        return [(retailer_id, distance) for distance, retailer_id in best]
+
+
+class RetailerLocations:
+    """Process-wide holder of the retailer ``GeoIndex``."""
+
+    def __init__(self, ttl_seconds: float):
+        self.ttl_seconds = ttl_seconds
+        self._index: Optional[GeoIndex] = None
+
+    def get(self) -> Optional[GeoIndex]:
+        if self._index is not None and time.monotonic() - self._index.loaded_at > self.ttl_seconds:
+            self._index = None
+        return self._index
+
+    def load(self, retailers: Iterable) -> GeoIndex:
+        index = GeoIndex()
+        for r in retailers:
+            index.add(r.retailer_id, r.gps_latitude, r.gps_longitude)
+        self._index = index
+        return index
+
+    # Incremental updates are skipped until the index has been loaded.
+    def upsert(self, retailer_id: int, lat: Optional[float], lon: Optional[float]) -> None:
+        if self._index is not None:
+            self._index.add(retailer_id, lat, lon)
+
+    def remove(self, retailer_id: int) -> None:
+        if self._index is not None:
+            self._index.remove(retailer_id)
+
+    def clear(self) -> None:
+        self._index = None
+
+
+retailer_locations = RetailerLocations(settings.geo_index_ttl_seconds)
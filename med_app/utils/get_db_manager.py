@@ -39,8 +39,7 @@
 #         yield manager
 
 
-from ..db.base.database_manager import DatabaseManager
-from ..config import settings
+from .db_manager import get_manager
 from ..crud.customer.customer_manager import CustomerManager
 from ..crud.retailer.retailer_manager import RetailerManager
 from ..crud.distributor.distributor_manager import DistributorManager
@@ -56,129 +55,80 @@ from ..crud.retailer.retailer_notification_manager import RetailerNotificationMa
 from ..crud.distributor.distributor_report_manager import DistributorReportManager
 from ..crud.distributor.distributor_invoice_manager import DistributorInvoiceManager
 from ..crud.distributor.distributor_notification_manager import DistributorNotificationManager
+from ..crud.imports.csv_import_manager import CsvImportManager
+from ..crud.invoices.invoice_pdf_manager import InvoicePdfManager
 
 async def get_customer_manager() -> CustomerManager:  # type: ignore
-    db_manager = DatabaseManager(settings.dp_type)
-    await db_manager.connect()
-    try:
-        yield CustomerManager(db_manager)
-    finally:
-        await db_manager.disconnect()
+    async with get_manager(CustomerManager) as manager:
+        yield manager
 
 async def get_retailer_manager() -> RetailerManager:  # type: ignore
-    db_manager = DatabaseManager(settings.dp_type)
-    await db_manager.connect()
-    try:
-        yield RetailerManager(db_manager)
-    finally:
-        await db_manager.disconnect()
+    async with get_manager(RetailerManager) as manager:
+        yield manager
 
 
 async def get_distributor_manager() -> DistributorManager:  # type: ignore
-    db_manager = DatabaseManager(settings.dp_type)
-    await db_manager.connect()
-    try:
-        yield DistributorManager(db_manager)
-    finally:
-        await db_manager.disconnect()
+    async with get_manager(DistributorManager) as manager:
+        yield manager
 
 
 async def get_medicine_manager() -> MedicineManager:  # type: ignore
-    db_manager = DatabaseManager(settings.dp_type)
-    await db_manager.connect()
-    try:
-        yield MedicineManager(db_manager)
-    finally:
-        await db_manager.disconnect()
+    async with get_manager(MedicineManager) as manager:
+        yield manager
 
 
 async def get_order_manager() -> OrderManager:  # type: ignore
-    db_manager = DatabaseManager(settings.dp_type)
-    await db_manager.connect()
-    try:
-        yield OrderManager(db_manager)
-    finally:
-        await db_manager.disconnect()
+    async with get_manager(OrderManager) as manager:
+        yield manager
 
 
 async def get_retailer_medicine_manager() -> RetailerMedicineManager:  # type: ignore
-    db_manager = DatabaseManager(settings.dp_type)
-    await db_manager.connect()
-    try:
-        yield RetailerMedicineManager(db_manager)
-    finally:
-        await db_manager.disconnect()
+    async with get_manager(RetailerMedicineManager) as manager:
+        yield manager
 
 
 async def get_distributor_stock_manager() -> DistributorStockManager:  # type: ignore
-    db_manager = DatabaseManager(settings.dp_type)
-    await db_manager.connect()
-    try:
-        yield DistributorStockManager(db_manager)
-    finally:
-        await db_manager.disconnect()
+    async with get_manager(DistributorStockManager) as manager:
+        yield manager
 
 
 async def get_distributor_order_manager() -> DistributorOrderManager:  # type: ignore
-    db_manager = DatabaseManager(settings.dp_type)
-    await db_manager.connect()
-    try:
-        yield DistributorOrderManager(db_manager)
-    finally:
-        await db_manager.disconnect()
+    async with get_manager(DistributorOrderManager) as manager:
+        yield manager
 
 async def get_retailer_order_manager() -> RetailerOrderManager:  # type: ignore
-    db_manager = DatabaseManager(settings.dp_type)
-    await db_manager.connect()
-    try:
-        yield RetailerOrderManager(db_manager)
-    finally:
-        await db_manager.disconnect()
+    async with get_manager(RetailerOrderManager) as manager:
+        yield manager
 
 async def get_retailer_report_manager() -> RetailerReportManager:  # type: ignore
-    db_manager = DatabaseManager(settings.dp_type)
-    await db_manager.connect()
-    try:
-        yield RetailerReportManager(db_manager)
-    finally:
-        await db_manager.disconnect()
+    async with get_manager(RetailerReportManager) as manager:
+        yield manager
         
 async def get_distributor_report_manager() -> DistributorReportManager:  # type: ignore
-    db_manager = DatabaseManager(settings.dp_type)
-    await db_manager.connect()
-    try:
-        yield DistributorReportManager(db_manager)
-    finally:
-        await db_manager.disconnect()
+    async with get_manager(DistributorReportManager) as manager:
+        yield manager
 
 async def get_retailer_invoice_manager() -> RetailerInvoiceManager:  # type: ignore
-    db_manager = DatabaseManager(settings.dp_type)
-    await db_manager.connect()
-    try:
-        yield RetailerInvoiceManager(db_manager)
-    finally:
-        await db_manager.disconnect()
+    async with get_manager(RetailerInvoiceManager) as manager:
+        yield manager
 
 async def get_distributor_invoice_manager() -> DistributorInvoiceManager:  # type: ignore
-    db_manager = DatabaseManager(settings.dp_type)
-    await db_manager.connect()
-    try:
-        yield DistributorInvoiceManager(db_manager)
-    finally:
-        await db_manager.disconnect()
+    async with get_manager(DistributorInvoiceManager) as manager:
+        yield manager
 
 async def get_retailer_notification_manager() -> RetailerNotificationManager:  # type: ignore
-    db_manager = DatabaseManager(settings.dp_type)
-    await db_manager.connect()
-    try:
-        yield RetailerNotificationManager(db_manager)
-    finally:
-        await db_manager.disconnect()
+    async with get_manager(RetailerNotificationManager) as manager:
+        yield manager
 
 async def get_distributor_notification_manager() -> DistributorNotificationManager:  # type: ignore
-    db_manager = DatabaseManager(settings.dp_type)
-    await db_manager.connect()
-    try:
-        yield DistributorNotificationManager(db_manager)
-    finally:
-        await db_manager.disconnect()
\ No newline at end of file
+    async with get_manager(DistributorNotificationManager) as manager:
+        yield manager
+
+async def get_csv_import_manager() -> CsvImportManager:  # type: ignore
+    async with get_manager(CsvImportManager) as manager:
+        yield manager
+
+
+async def get_invoice_pdf_manager() -> InvoicePdfManager:  # type: ignore
+    async with get_manager(InvoicePdfManager) as manager:
+        yield manager
@@ -1,14 +1,57 @@
+import hashlib
+import json
 import os
 from fpdf import FPDF
 from datetime import datetime
 
+from .invoice_layout import render_invoice
+
 INVOICE_DIR = "invoices"
 
+# Bump whenever the drawing code changes so stored PDFs are re-rendered.
+INVOICE_LAYOUT_VERSION = 2
+
+INVOICE_RETAILER_FIELDS = ("shop_name", "address_line1", "city", "state", "zip_code", "gst_number")
+
+
+def invoice_content_key(order_data, retailer_data, order_id: int) -> str:
+    """SHA-256 of everything drawn on the invoice: same data, same PDF, same key."""
+    content = {
+        "layout": INVOICE_LAYOUT_VERSION,
+        "order_id": order_id,
+        "order_date": getattr(order_data, "order_date", None),
+        "items": [(item.medicine_id, item.quantity, item.price) for item in order_data.items],
+        "retailer": [getattr(retailer_data, f) for f in INVOICE_RETAILER_FIELDS],
+    }
+    return hashlib.sha256(json.dumps(content, default=str, sort_keys=True).encode()).hexdigest()
+
+
 def generate_invoice_pdf(order_data, retailer_data, order_id: int) -> str:
     """Generate a clean, neatly aligned invoice PDF."""
     os.makedirs(INVOICE_DIR, exist_ok=True)
     file_path = os.path.join(INVOICE_DIR, f"invoice_{order_id}.pdf")
+    with open(file_path, "wb") as f:
+        f.write(render_invoice_pdf(order_data, retailer_data, order_id))
+    return file_path
 
+
+def render_invoice_pdf(order_data, retailer_data, order_id: int) -> bytes:
+    """Render with the compiled layout (see ``invoice_layout``)."""
+    return render_invoice(
+        order_id,
+        getattr(order_data, "order_date", None) or datetime.now(),
+        retailer_data.shop_name,
+        f"{retailer_data.address_line1}, {retailer_data.city}, {retailer_data.state} - {retailer_data.zip_code}",
+        retailer_data.gst_number,
+        order_data.items,
+    )
+
+
+def render_invoice_pdf_cells(order_data, retailer_data, order_id: int) -> bytes:
+    """
+    The original cell-by-cell FPDF renderer. Kept as the baseline for
+    ``scripts/benchmark_invoices.py``; single page only.
+    """
     pdf = FPDF()
     pdf.add_page()
     pdf.set_auto_page_break(auto=True, margin=15)
@@ -32,7 +75,8 @@ def generate_invoice_pdf(order_data, retailer_data, order_id: int) -> str:
 
     # --- Order Info ---
     pdf.cell(0, 8, txt=f"Order ID: {order_id}", ln=True)
-    pdf.cell(0, 8, txt=f"Date: {datetime.now().strftime('%Y-%m-%d')}", ln=True)
+    order_date = getattr(order_data, "order_date", None) or datetime.now()
+    pdf.cell(0, 8, txt=f"Date: {order_date.strftime('%Y-%m-%d')}", ln=True)
     pdf.ln(8)
 
     # --- Table Header ---
@@ -77,5 +121,19 @@ def generate_invoice_pdf(order_data, retailer_data, order_id: int) -> str:
     pdf.set_font("Arial", style="I", size=10)
     pdf.cell(0, 10, txt="Thank you for your order!", ln=True, align="C")
 
-    pdf.output(file_path)
-    return file_path
+    return pdf.output(dest="S").encode("latin-1")
+
+
+def render_invoice_batch(invoices) -> list:
+    """
+    Render several ``(order_data, retailer_data, order_id, key)`` invoices in
+    one worker call. Returns ``(key, pdf_bytes, error)`` per invoice so one
+    bad invoice does not fail the rest of the batch.
+    """
+    results = []
+    for order_data, retailer_data, order_id, key in invoices:
+        try:
+            results.append((key, render_invoice_pdf(order_data, retailer_data, order_id), None))
+        except Exception as e:
+            results.append((key, None, f"{type(e).__name__}: {e}"))
+    return results
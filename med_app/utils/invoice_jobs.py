@@ -0,0 +1,131 @@
+"""
+Background queue for invoice PDF rendering.
+
+Handlers ``submit`` invoices and return immediately; consumer tasks (one per
+worker process) take units of work off an ``asyncio.Queue`` and render them
+with ``render_invoice_batch`` in the shared process pool. A unit is a single
+invoice for on-demand requests, or ``settings.invoice_batch_size`` invoices
+for month-end runs so the per-call pickling/IPC cost is amortised.
+
+Jobs are keyed by the invoice's content key and finished PDFs are written
+to ``get_invoice_storage()`` under that key. Only unfinished (and failed,
+until reported) jobs are tracked: once stored, the object itself is the
+record that the PDF is ready.
+"""
+
+import asyncio
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from .invoice_generator import render_invoice_batch
+from .invoice_storage import get_invoice_storage
+from .logger import get_logger
+from .process_pool import run_in_process, worker_count
+
+logger = get_logger(__name__)
+
+QUEUED = "queued"
+RENDERING = "rendering"
+READY = "ready"
+FAILED = "failed"
+
+
+@dataclass
+class InvoiceJob:
+    order_id: int
+    key: str
+    status: str = QUEUED
+    error: Optional[str] = None
+    submitted_at: datetime = field(default_factory=datetime.utcnow)
+    finished_at: Optional[datetime] = None
+
+
+# (order_data, retailer_data, order_id, content key); must be picklable
+InvoicePayload = Tuple[object, object, int, str]
+
+
+class InvoiceRenderQueue:
+    def __init__(self):
+        self.jobs: Dict[str, InvoiceJob] = {}
+        self._queue: Optional[asyncio.Queue] = None
+        self._consumers: List[asyncio.Task] = []
+
+    def _ensure_started(self) -> asyncio.Queue:
+        if self._queue is None:
+            self._queue = asyncio.Queue()
+            self._consumers = [asyncio.create_task(self._consume()) for _ in range(worker_count())]
+        return self._queue
+
+    def get(self, key: str) -> Optional[InvoiceJob]:
+        return self.jobs.get(key)
+
+    def submit(self, payloads: Sequence[InvoicePayload], batch_size: int = 1) -> List[InvoiceJob]:
+        """Queue the invoices not already queued/rendering, ``batch_size`` per worker call."""
+        queue = self._ensure_started()
+        jobs, fresh = [], []
+        for payload in payloads:
+            order_id, key = payload[2], payload[3]
+            job = self.jobs.get(key)
+            if job is None or job.status == FAILED:
+                job = self.jobs[key] = InvoiceJob(order_id, key)
+                fresh.append(payload)
+            jobs.append(job)
+        for start in range(0, len(fresh), batch_size):
+            queue.put_nowait(fresh[start:start + batch_size])
+        return jobs
+
+    def pop_failed(self, key: str) -> Optional[InvoiceJob]:
+        """Report a failure once; the next request submits the invoice again."""
+        job = self.jobs.get(key)
+        if job is not None and job.status == FAILED:
+            return self.jobs.pop(key)
+        return None
+
+    async def _consume(self) -> None:
+        while True:
+            unit = await self._queue.get()
+            keys = [payload[3] for payload in unit]
+            for key in keys:
+                self.jobs[key].status = RENDERING
+            try:
+                results = await run_in_process(render_invoice_batch, unit)
+                await asyncio.to_thread(self._store, results)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Invoice render failed for orders {[p[2] for p in unit]}: {e}")
+                results = [(key, None, f"{type(e).__name__}: {e}") for key in keys]
+            finally:
+                self._queue.task_done()
+
+            now = datetime.utcnow()
+            for key, _, error in results:
+                job = self.jobs[key]
+                job.finished_at = now
+                if error is None:
+                    job.status = READY
+                    del self.jobs[key]
+                else:
+                    job.status, job.error = FAILED, error
+
+    @staticmethod
+    def _store(results) -> None:
+        storage = get_invoice_storage()
+        for key, pdf, error in results:
+            if error is None:
+                storage.put(key, pdf)
+
+    async def join(self) -> None:
+        if self._queue is not None:
+            await self._queue.join()
+
+    async def stop(self) -> None:
+        for task in self._consumers:
+            task.cancel()
+        await asyncio.gather(*self._consumers, return_exceptions=True)
+        self._queue, self._consumers = None, []
+        self.jobs = {key: job for key, job in self.jobs.items() if job.status == FAILED}
+
+
+invoice_render_queue = InvoiceRenderQueue()
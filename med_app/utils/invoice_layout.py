@@ -0,0 +1,212 @@
+"""
+Compiled invoice layout.
+
+Drawing an invoice cell by cell through FPDF spends most of its time in
+``FPDF.cell`` bookkeeping rather than in producing PDF. Here the parts that
+do not change between invoices are drawn once with FPDF and kept as raw
+page operators (``_Block``):
+
+* title, table header, totals labels and footer - compiled once per process;
+* the retailer block - compiled once per retailer (LRU).
+
+A block is replayed at any height by wrapping its operators in a
+translation (``q 1 0 0 1 0 dy cm ... Q``). Item rows are the only per-row
+work: their border rectangles and text positions come from templates
+precomputed from the column layout, so a row costs a few string formats.
+Long item lists continue on new pages, each starting with the table header.
+
+Compiled blocks name fonts ``/F1``.. by first use, so every document
+registers ``_FONTS`` in the same order before anything is drawn.
+"""
+
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Iterable, List, Sequence, Tuple
+
+from fpdf import FPDF
+from fpdf.fonts import fpdf_charwidths
+
+FAMILY = "Arial"
+_FONTS = (("B", 16), ("", 12), ("I", 10))      # registration order -> /F1 /F2 /F3
+_CHAR_WIDTHS = {"": fpdf_charwidths["helvetica"], "B": fpdf_charwidths["helveticaB"]}
+
+# Page geometry in mm (FPDF defaults: A4, 10 mm margins, 1 mm cell padding)
+PAGE_H = 297.0
+MARGIN = 10.0
+CELL_PAD = 1.0
+PAGE_BOTTOM = PAGE_H - 15.0
+
+# Item table: (width, align) for Product / Qty / Price / Total
+COLUMNS: Tuple[Tuple[float, str], ...] = ((80, "L"), (30, "C"), (40, "R"), (40, "R"))
+ROW_H = 10.0
+INFO_H = 8.0
+TOTALS_X, TOTALS_W = MARGIN + 150, 40
+
+
+def _latin1(value) -> str:
+    # Core fonts are latin-1 only.
+    return str(value).encode("latin-1", "replace").decode("latin-1")
+
+
+def _escape(text: str) -> str:
+    return text.replace("\\", "\\\\").replace(")", "\\)").replace("(", "\\(").replace("\r", "\\r")
+
+
+def _width(text: str, style: str, size_pt: float, k: float) -> float:
+    widths = _CHAR_WIDTHS[style]
+    return sum(widths.get(ch, 0) for ch in text) * size_pt / 1000.0 / k
+
+
+def _new_document() -> FPDF:
+    pdf = FPDF()
+    pdf.set_auto_page_break(False)
+    pdf.add_page()
+    for style, size in _FONTS:
+        pdf.set_font(FAMILY, style, size)
+    return pdf
+
+
+@dataclass(frozen=True)
+class _Block:
+    ops: str
+    y0: float
+    height: float
+
+    def place(self, pdf: FPDF, y: float) -> float:
+        """Replay the block with its top edge at ``y``; returns the y below it."""
+        pdf._out(f"q 1 0 0 1 0 {(self.y0 - y) * pdf.k:.2f} cm\n{self.ops}Q")
+        return y + self.height
+
+
+def _compile(draw, *args) -> _Block:
+    pdf = _new_document()
+    pdf.font_family = ""    # make the block's first set_font emit its Tf
+    pdf.set_xy(MARGIN, MARGIN)
+    start = len(pdf.pages[pdf.page])
+    draw(pdf, *args)
+    return _Block(pdf.pages[pdf.page][start:], MARGIN, pdf.get_y() - MARGIN)
+
+
+# --- Static parts, drawn with plain FPDF calls --------------------------------
+
+def _draw_title(pdf: FPDF) -> None:
+    pdf.set_font(FAMILY, "B", 16)
+    pdf.cell(0, 10, txt="INVOICE", ln=True, align="C")
+    pdf.ln(8)
+
+
+def _draw_retailer(pdf: FPDF, shop_name, address, gst_number) -> None:
+    pdf.set_font(FAMILY, size=12)
+    pdf.cell(0, 8, txt=f"Retailer: {shop_name}", ln=True)
+    pdf.multi_cell(0, 8, txt=f"Address: {address}")
+    pdf.cell(0, 8, txt=f"GST: {gst_number}", ln=True)
+    pdf.ln(5)
+
+
+def _draw_table_header(pdf: FPDF) -> None:
+    pdf.set_font(FAMILY, style="B", size=12)
+    pdf.set_fill_color(230, 230, 230)
+    for (w, _), title, align in zip(COLUMNS, ("Product", "Qty", "Price", "Total"), ("L", "C", "R", "R")):
+        pdf.cell(w, ROW_H, txt=title, border=1, align=align, fill=True)
+    pdf.ln()
+
+
+def _draw_totals_labels(pdf: FPDF) -> None:
+    pdf.ln(5)
+    pdf.set_font(FAMILY, style="B", size=12)
+    for label in ("Subtotal:", "GST (18%):", "Total:"):
+        pdf.cell(150, INFO_H, txt=label, border=0, align="R")
+        pdf.ln()
+
+
+def _draw_footer(pdf: FPDF) -> None:
+    pdf.ln(10)
+    pdf.set_font(FAMILY, style="I", size=10)
+    pdf.cell(0, 10, txt="Thank you for your order!", ln=True, align="C")
+
+
+@lru_cache(maxsize=1)
+def _static_blocks() -> Tuple[_Block, _Block, _Block, _Block]:
+    return _compile(_draw_title), _compile(_draw_table_header), _compile(_draw_totals_labels), _compile(_draw_footer)
+
+
+@lru_cache(maxsize=1024)
+def _retailer_block(shop_name, address, gst_number) -> _Block:
+    return _compile(_draw_retailer, _latin1(shop_name), _latin1(address), _latin1(gst_number))
+
+
+# --- Variable parts, emitted straight as operators -----------------------------
+
+class _Writer:
+    """Text/row operators for one document, using the precomputed column layout."""
+
+    def __init__(self, pdf: FPDF):
+        self.pdf, self.k = pdf, pdf.k
+        k = self.k
+        x = MARGIN
+        self.rects: List[str] = []
+        self.columns: List[Tuple[float, float, str]] = []
+        for w, align in COLUMNS:
+            self.rects.append(f"{x * k:.2f} {{y}} {w * k:.2f} {-ROW_H * k:.2f} re S")
+            self.columns.append((x, w, align))
+            x += w
+
+    def _baseline(self, y: float, h: float, size_pt: float) -> str:
+        return f"{(PAGE_H - (y + 0.5 * h + 0.3 * size_pt / self.k)) * self.k:.2f}"
+
+    def text(self, x: float, w: float, y: float, h: float, value, align: str, style: str = "", size_pt: float = 12) -> str:
+        text = _latin1(value)
+        if align == "L":
+            dx = CELL_PAD
+        else:
+            width = _width(text, style, size_pt, self.k)
+            dx = (w - width) / 2.0 if align == "C" else w - CELL_PAD - width
+        return f"BT {(x + dx) * self.k:.2f} {self._baseline(y, h, size_pt)} Td ({_escape(text)}) Tj ET"
+
+    def row(self, y: float, values: Sequence) -> None:
+        top = f"{(PAGE_H - y) * self.k:.2f}"
+        ops = []
+        for rect, (x, w, align), value in zip(self.rects, self.columns, values):
+            ops.append(rect.format(y=top))
+            ops.append(self.text(x, w, y, ROW_H, value, align))
+        self.pdf._out(" ".join(ops))
+
+
+def render_invoice(order_id: int, order_date, shop_name, address: str, gst_number, items: Iterable) -> bytes:
+    title, table_header, totals_labels, footer = _static_blocks()
+    pdf = _new_document()
+    pdf.set_font(FAMILY, size=12)
+    out = _Writer(pdf)
+
+    y = title.place(pdf, MARGIN)
+    y = _retailer_block(shop_name, address, gst_number).place(pdf, y)
+    width = 190.0
+    pdf._out(out.text(MARGIN, width, y, INFO_H, f"Order ID: {order_id}", "L"))
+    pdf._out(out.text(MARGIN, width, y + INFO_H, INFO_H, f"Date: {order_date.strftime('%Y-%m-%d')}", "L"))
+    y = table_header.place(pdf, y + 2 * INFO_H + 8)
+
+    subtotal = 0.0
+    for item in items:
+        if y + ROW_H > PAGE_BOTTOM:
+            pdf.add_page()
+            y = table_header.place(pdf, MARGIN)
+        price = float(item.price)
+        total = item.quantity * price
+        subtotal += total
+        out.row(y, (item.medicine_id, item.quantity, f"{price:.2f}", f"{total:.2f}"))
+        y += ROW_H
+
+    if y + totals_labels.height + footer.height > PAGE_BOTTOM:
+        pdf.add_page()
+        y = MARGIN
+    tax = subtotal * 0.18
+    amounts_y = y + 5
+    totals_labels.place(pdf, y)
+    pdf.set_font(FAMILY, style="B", size=12)
+    pdf._out(" ".join(
+        out.text(TOTALS_X, TOTALS_W, amounts_y + i * INFO_H, INFO_H, f"Rs. {amount:.2f}", "R", style="B")
+        for i, amount in enumerate((subtotal, tax, subtotal + tax))
+    ))
+    footer.place(pdf, y + totals_labels.height)
+
+    return pdf.output(dest="S").encode("latin-1")
@@ -0,0 +1,81 @@
+"""
+Storage for rendered invoice PDFs, addressed by content key.
+
+Keys are ``invoice_content_key`` hashes, so a stored object never changes:
+new invoice data means a new key, and an existing key can be served (and
+cached by clients) forever. Backends only need put/exists/open; ones that
+keep files on local disk also expose ``local_path`` so the API can hand the
+file to ``FileResponse`` (Range requests, sendfile via ``pathsend``).
+"""
+
+import os
+import tempfile
+from abc import ABC, abstractmethod
+from typing import BinaryIO, Optional
+
+from ..config import settings
+
+
+class InvoiceStorage(ABC):
+    @abstractmethod
+    def exists(self, key: str) -> bool:
+        pass
+
+    @abstractmethod
+    def put(self, key: str, data: bytes) -> None:
+        pass
+
+    @abstractmethod
+    def open(self, key: str) -> BinaryIO:
+        pass
+
+    def local_path(self, key: str) -> Optional[str]:
+        """Filesystem path of the object, when the backend has one."""
+        return None
+
+
+class LocalInvoiceStorage(InvoiceStorage):
+    """``<root>/ab/cd/abcd....pdf``: two levels of 256 folders keep directories small."""
+
+    def __init__(self, root: str):
+        self.root = root
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.root, key[:2], key[2:4], f"{key}.pdf")
+
+    def exists(self, key: str) -> bool:
+        return os.path.exists(self._path(key))
+
+    def put(self, key: str, data: bytes) -> None:
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # Write-then-rename so readers never see a partial file.
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp, path)
+        except BaseException:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+            raise
+
+    def open(self, key: str) -> BinaryIO:
+        return open(self._path(key), "rb")
+
+    def local_path(self, key: str) -> Optional[str]:
+        return self._path(key)
+
+
+_STORAGE_BACKENDS = {"local": lambda: LocalInvoiceStorage(settings.invoice_storage_dir)}
+_storage: Optional[InvoiceStorage] = None
+
+
+def get_invoice_storage() -> InvoiceStorage:
+    global _storage
+    if _storage is None:
+        backend = _STORAGE_BACKENDS.get(settings.invoice_storage_backend)
+        if backend is None:
+            raise ValueError(f"Unknown invoice storage backend '{settings.invoice_storage_backend}'")
+        _storage = backend()
+    return _storage
@@ -0,0 +1,150 @@
+"""
+Read-through cache for the medicine catalog.
+
+Medicines are read on nearly every order view but rarely change, so
+``MedicineManager`` looks them up here before going to the database.
+Entries are plain column dicts (no session state, easy to serialize), and
+the manager builds a fresh detached ``MedicineDbModel`` from them on every
+hit, so callers can never mutate what is cached.
+
+The store sits behind ``MedicineCacheBackend``; ``LocalMedicineCacheBackend``
+is an in-process LRU with a TTL and stands in for a shared backend (picked
+with ``settings.medicine_cache_backend``). Writes through
+``MedicineManager`` invalidate entries via ``DatabaseManager.after_commit``;
+anything else (other workers, direct SQL) converges within
+``settings.medicine_cache_ttl_seconds``.
+
+A read that raced an invalidation is not stored: ``fill`` takes the
+generation seen before the database read and drops the rows if any
+invalidation happened in between.
+"""
+
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from typing import Dict, Iterable, List, Tuple
+
+from ..config import settings
+
+
+class MedicineCacheBackend(ABC):
+    @abstractmethod
+    def get_many(self, medicine_ids: Iterable[int]) -> Dict[int, Dict]:
+        pass
+
+    @abstractmethod
+    def set_many(self, medicines: Dict[int, Dict]) -> None:
+        pass
+
+    @abstractmethod
+    def delete_many(self, medicine_ids: Iterable[int]) -> None:
+        pass
+
+    @abstractmethod
+    def clear(self) -> None:
+        pass
+
+
+class LocalMedicineCacheBackend(MedicineCacheBackend):
+    """LRU of at most ``max_size`` entries, each valid for ``ttl_seconds``."""
+
+    def __init__(self, max_size: int, ttl_seconds: float):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self.evictions = 0
+        self._entries: "OrderedDict[int, Tuple[float, Dict]]" = OrderedDict()
+
+    def get_many(self, medicine_ids: Iterable[int]) -> Dict[int, Dict]:
+        now = time.monotonic()
+        found = {}
+        for medicine_id in medicine_ids:
+            entry = self._entries.get(medicine_id)
+            if entry is None:
+                continue
+            if entry[0] <= now:
+                del self._entries[medicine_id]
+                continue
+            self._entries.move_to_end(medicine_id)
+            found[medicine_id] = entry[1]
+        return found
+
+    def set_many(self, medicines: Dict[int, Dict]) -> None:
+        expires_at = time.monotonic() + self.ttl_seconds
+        for medicine_id, values in medicines.items():
+            self._entries[medicine_id] = (expires_at, values)
+            self._entries.move_to_end(medicine_id)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def delete_many(self, medicine_ids: Iterable[int]) -> None:
+        for medicine_id in medicine_ids:
+            self._entries.pop(medicine_id, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+@dataclass
+class MedicineCacheStats:
+    hits: int = 0
+    misses: int = 0
+    invalidations: int = 0
+
+
+class MedicineCache:
+    def __init__(self, backend: MedicineCacheBackend):
+        self.backend = backend
+        self.stats = MedicineCacheStats()
+        self.generation = 0
+
+    def lookup(self, medicine_ids: List[int]) -> Tuple[Dict[int, Dict], List[int]]:
+        """Cached entries and the ids that have to be read from the database."""
+        found = self.backend.get_many(medicine_ids)
+        missing = [medicine_id for medicine_id in medicine_ids if medicine_id not in found]
+        self.stats.hits += len(found)
+        self.stats.misses += len(missing)
+        return found, missing
+
+    def fill(self, medicines: Dict[int, Dict], generation: int) -> None:
+        if medicines and generation == self.generation:
+            self.backend.set_many(medicines)
+
+    def invalidate(self, medicine_ids: Iterable[int]) -> None:
+        self.generation += 1
+        self.stats.invalidations += 1
+        self.backend.delete_many(medicine_ids)
+
+    def clear(self) -> None:
+        self.generation += 1
+        self.stats.invalidations += 1
+        self.backend.clear()
+
+    def snapshot(self) -> Dict:
+        stats = asdict(self.stats)
+        lookups = stats["hits"] + stats["misses"]
+        stats["hit_ratio"] = round(stats["hits"] / lookups, 4) if lookups else None
+        stats["backend"] = settings.medicine_cache_backend
+        if isinstance(self.backend, LocalMedicineCacheBackend):
+            stats["size"] = len(self.backend)
+            stats["evictions"] = self.backend.evictions
+        return stats
+
+
+_CACHE_BACKENDS = {
+    "local": lambda: LocalMedicineCacheBackend(settings.medicine_cache_size, settings.medicine_cache_ttl_seconds),
+}
+
+
+def _create_backend() -> MedicineCacheBackend:
+    backend = _CACHE_BACKENDS.get(settings.medicine_cache_backend)
+    if backend is None:
+        raise ValueError(f"Unknown medicine cache backend '{settings.medicine_cache_backend}'")
+    return backend()
+
+
+medicine_cache = MedicineCache(_create_backend())
@@ -0,0 +1,56 @@
+"""
+Shared process pool for CPU-bound rendering (PDFs, charts).
+
+FPDF and matplotlib are pure-Python/CPU work that would stall the event loop
+if run inline, and threads would still serialise on the GIL. Jobs submitted
+through ``run_in_process`` run in worker processes instead; the pool is
+created on first use and shut down from the app lifespan.
+"""
+
+import asyncio
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import partial
+from typing import Any, Callable, Optional
+
+from ..config import settings
+
+_executor: Optional[ProcessPoolExecutor] = None
+
+
+def worker_count() -> int:
+    return settings.render_workers or os.cpu_count() or 1
+
+
+def get_executor() -> ProcessPoolExecutor:
+    global _executor
+    if _executor is None:
+        # "spawn": forking a process that holds event-loop and DB driver threads is unsafe.
+        _executor = ProcessPoolExecutor(
+            max_workers=worker_count(),
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    return _executor
+
+
+async def run_in_process(fn: Callable, *args: Any, **kwargs: Any) -> Any:
+    """Run ``fn(*args, **kwargs)`` in the pool; arguments and result must be picklable."""
+    global _executor
+    loop = asyncio.get_running_loop()
+    executor = get_executor()
+    try:
+        return await loop.run_in_executor(executor, partial(fn, *args, **kwargs))
+    except BrokenProcessPool:
+        # A worker died (e.g. OOM-killed); start a fresh pool for the next job.
+        if _executor is executor:
+            _executor = None
+        raise
+
+
+def shutdown() -> None:
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=True, cancel_futures=True)
+        _executor = None
@@ -0,0 +1,74 @@
+"""
+Streaming report exports.
+
+Report managers return a ``ReportExport`` whose ``chunks`` are produced
+lazily: CSV text is written as rows arrive from ``DatabaseManager.stream``
+and flushed every ``FLUSH_ROWS`` rows. ``streaming_response`` wraps the
+chunks in a ``StreamingResponse``, gzip-compressing them on the fly when
+asked, so an export never holds more than one batch in memory however many
+years of orders it covers.
+"""
+
+import csv
+import io
+import zlib
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any, AsyncIterable, AsyncIterator, Dict, Iterable, Sequence
+
+from fastapi.responses import StreamingResponse
+
+FLUSH_ROWS = 500
+
+
+@dataclass
+class ReportExport:
+    filename: str
+    media_type: str
+    chunks: AsyncIterable[bytes]
+
+
+async def iterate(items: Iterable[Any]) -> AsyncIterator[Any]:
+    """Adapt an in-memory result (e.g. an aggregate) to the streaming writers."""
+    for item in items:
+        yield item
+
+
+def _cell(value: Any) -> Any:
+    return value.value if isinstance(value, Enum) else value
+
+
+async def csv_chunks(fieldnames: Sequence[str], rows: AsyncIterable[Dict]) -> AsyncIterator[bytes]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(fieldnames)
+    pending = 1
+    async for row in rows:
+        writer.writerow([_cell(row.get(name)) for name in fieldnames])
+        pending += 1
+        if pending >= FLUSH_ROWS:
+            yield buffer.getvalue().encode("utf-8")
+            buffer.seek(0)
+            buffer.truncate()
+            pending = 0
+    if pending:
+        yield buffer.getvalue().encode("utf-8")
+
+
+async def gzip_chunks(chunks: AsyncIterable[bytes]) -> AsyncIterator[bytes]:
+    compressor = zlib.compressobj(wbits=16 + zlib.MAX_WBITS)  # gzip container
+    async for chunk in chunks:
+        data = compressor.compress(chunk)
+        if data:
+            yield data
+    yield compressor.flush()
+
+
+def streaming_response(export: ReportExport, gzip: bool = False) -> StreamingResponse:
+    filename, chunks, media_type = export.filename, export.chunks, export.media_type
+    if gzip:
+        filename, chunks, media_type = f"{filename}.gz", gzip_chunks(chunks), "application/gzip"
+    return StreamingResponse(
+        chunks, media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
@@ -0,0 +1,203 @@
+"""
+PDF rendering for dashboard reports.
+
+Report managers turn their (small, aggregated) report data into a
+``ReportDocument``: a title, summary lines, a table and an optional chart.
+``render_report_pdf`` draws it with FPDF and matplotlib inside the shared
+process pool. ``report_pdf_cache`` keeps the last rendering of each
+(owner, report) keyed by a fingerprint of the document, so a report is only
+re-rendered when its underlying data changes.
+"""
+
+import asyncio
+import hashlib
+import os
+import tempfile
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from ..config import settings
+from .process_pool import run_in_process
+
+CHART_BAR = "bar"
+CHART_LINE = "line"
+MAX_CHART_POINTS = 30
+
+
+@dataclass
+class ReportChart:
+    kind: str                  # CHART_BAR / CHART_LINE
+    labels: List[str]
+    values: List[float]
+    ylabel: str
+
+
+@dataclass
+class ReportDocument:
+    title: str
+    columns: List[str]
+    rows: List[List[Any]]
+    summary: List[Tuple[str, Any]] = field(default_factory=list)
+    chart: Optional[ReportChart] = None
+
+    def fingerprint(self) -> str:
+        return hashlib.sha256(repr(self).encode()).hexdigest()
+
+
+def report_document(report_type: str, owner: str, data: Any) -> ReportDocument:
+    """Build the document for a ``get_*_report`` result of either report manager."""
+    if report_type == "sales":
+        return ReportDocument(
+            title=f"Sales report - {owner}",
+            columns=["Period", "Sales"],
+            rows=[[row["period"], f"{row['sales']:.2f}"] for row in data],
+            summary=[("Total sales", f"{sum(row['sales'] for row in data):.2f}")],
+            chart=ReportChart(
+                CHART_LINE, [row["period"] for row in data][-MAX_CHART_POINTS:],
+                [row["sales"] for row in data][-MAX_CHART_POINTS:], "Sales",
+            ) if data else None,
+        )
+    if report_type == "orders":
+        breakdown = data["status_breakdown"]
+        return ReportDocument(
+            title=f"Orders report - {owner}",
+            columns=["Status", "Orders"],
+            rows=[[status, count] for status, count in breakdown.items()],
+            summary=[
+                ("Total orders", data["total_orders"]),
+                ("Completion rate", f"{data['completion_rate']}%"),
+                ("Cancellation rate", f"{data['cancellation_rate']}%"),
+            ],
+            chart=ReportChart(CHART_BAR, list(breakdown), list(breakdown.values()), "Orders") if breakdown else None,
+        )
+    # products: already sorted by revenue, best first
+    top = data[:MAX_CHART_POINTS]
+    return ReportDocument(
+        title=f"Product performance - {owner}",
+        columns=["Medicine ID", "Quantity", "Revenue"],
+        rows=[[row["medicine_id"], row["total_quantity"], f"{row['total_revenue']:.2f}"] for row in data],
+        summary=[("Products sold", len(data))],
+        chart=ReportChart(
+            CHART_BAR, [str(row["medicine_id"]) for row in top], [row["total_revenue"] for row in top], "Revenue",
+        ) if top else None,
+    )
+
+
+def _latin1(value: Any) -> str:
+    # FPDF 1.x core fonts only cover latin-1.
+    return str(value).encode("latin-1", "replace").decode("latin-1")
+
+
+def _chart_png(chart: ReportChart, path: str) -> None:
+    import matplotlib
+    matplotlib.use("Agg")
+    from matplotlib import pyplot as plt
+
+    fig, ax = plt.subplots(figsize=(8, 3.2), dpi=110)
+    if chart.kind == CHART_LINE:
+        ax.plot(chart.labels, chart.values, marker="o")
+    else:
+        ax.bar(chart.labels, chart.values)
+    ax.set_ylabel(chart.ylabel)
+    ax.tick_params(axis="x", labelrotation=45, labelsize=7)
+    fig.tight_layout()
+    fig.savefig(path, format="png")
+    plt.close(fig)
+
+
+def render_report_pdf(document: ReportDocument) -> bytes:
+    """Draw ``document`` as a PDF. Runs in a worker process."""
+    from fpdf import FPDF
+
+    pdf = FPDF()
+    pdf.set_auto_page_break(auto=True, margin=15)
+    pdf.add_page()
+
+    pdf.set_font("Arial", style="B", size=16)
+    pdf.cell(0, 10, txt=_latin1(document.title), ln=True, align="C")
+    pdf.set_font("Arial", size=9)
+    pdf.cell(0, 6, txt=f"Generated {datetime.utcnow():%Y-%m-%d %H:%M} UTC", ln=True, align="C")
+    pdf.ln(4)
+
+    pdf.set_font("Arial", size=11)
+    for label, value in document.summary:
+        pdf.cell(60, 7, txt=_latin1(label))
+        pdf.cell(0, 7, txt=_latin1(value), ln=True)
+    pdf.ln(3)
+
+    if document.chart is not None:
+        fd, path = tempfile.mkstemp(suffix=".png")
+        os.close(fd)
+        try:
+            _chart_png(document.chart, path)
+            pdf.image(path, x=10, w=190)
+        finally:
+            os.remove(path)
+        pdf.ln(3)
+
+    width = 190 / max(len(document.columns), 1)
+
+    def header() -> None:
+        pdf.set_font("Arial", style="B", size=10)
+        pdf.set_fill_color(230, 230, 230)
+        for column in document.columns:
+            pdf.cell(width, 8, txt=_latin1(column), border=1, fill=True, align="C")
+        pdf.ln()
+        pdf.set_font("Arial", size=10)
+
+    header()
+    for row in document.rows:
+        if pdf.get_y() > pdf.h - pdf.b_margin - 8:
+            pdf.add_page()
+            header()
+        for value in row:
+            pdf.cell(width, 7, txt=_latin1(value), border=1, align="C")
+        pdf.ln()
+
+    return pdf.output(dest="S").encode("latin-1")
+
+
+class ReportPdfCache:
+    """
+    LRU of rendered reports. An entry is reused only while the document it
+    was rendered from has the same fingerprint; concurrent requests for the
+    same rendering share one pool job.
+    """
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Tuple, Tuple[str, bytes]]" = OrderedDict()
+        self._pending: Dict[Tuple, asyncio.Future] = {}
+
+    async def get_or_render(self, key: Tuple, document: ReportDocument) -> bytes:
+        version = document.fingerprint()
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] == version:
+            self._entries.move_to_end(key)
+            return entry[1]
+
+        job = self._pending.get((key, version))
+        if job is None:
+            job = asyncio.ensure_future(self._render(key, version, document))
+            self._pending[(key, version)] = job
+        # Shielded so one client disconnecting does not cancel the others' render.
+        return await asyncio.shield(job)
+
+    async def _render(self, key: Tuple, version: str, document: ReportDocument) -> bytes:
+        try:
+            pdf = await run_in_process(render_report_pdf, document)
+        finally:
+            del self._pending[(key, version)]
+        self._entries[key] = (version, pdf)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return pdf
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+report_pdf_cache = ReportPdfCache(settings.report_pdf_cache_size)
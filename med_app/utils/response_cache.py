@@ -0,0 +1,106 @@
+"""
+Conditional-GET cache for the dashboard and report endpoints.
+
+The dashboards poll every few seconds while the numbers behind them only
+move when an order is written. Responses are cached per
+``(route, query params, owner data version, UTC day)``:
+
+* ``data_versions`` holds a counter per rollup scope and owner
+  (``("retailer", 7)``). ``SalesRollupManager`` bumps it via
+  ``DatabaseManager.after_commit`` for every owner whose orders a request
+  changed, so the next poll misses and recomputes;
+* the UTC day is part of the key because "today vs yesterday" figures
+  change at midnight without any write;
+* the ETag is a hash of the JSON body, so it stays valid across restarts
+  and workers; a client sending it back gets ``304 Not Modified``, also
+  when the body had to be recomputed but came out the same.
+
+Versions are per process: writes made through another worker are only
+seen here once the entry expires (``settings.response_cache_ttl_seconds``).
+"""
+
+import hashlib
+import time
+from collections import OrderedDict, defaultdict
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+from fastapi import Request, Response
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+from ..config import settings
+
+Owner = Tuple[str, int]  # (rollup scope, owner_id)
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    candidates = {tag.strip().removeprefix("W/") for tag in header.split(",")}
+    return "*" in candidates or etag in candidates
+
+
+class DataVersions:
+    def __init__(self):
+        self._versions: Dict[Owner, int] = defaultdict(int)
+
+    def get(self, owner: Owner) -> int:
+        return self._versions.get(owner, 0)
+
+    def bump(self, owner: Owner) -> None:
+        self._versions[owner] += 1
+
+
+class ResponseCache:
+    """LRU of rendered JSON bodies with their ETags."""
+
+    def __init__(self, max_entries: int, ttl_seconds: float):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[Tuple, Tuple[float, str, bytes]]" = OrderedDict()
+
+    def get(self, key: Tuple) -> Optional[Tuple[str, bytes]]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry[0] <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return entry[1], entry[2]
+
+    def put(self, key: Tuple, etag: str, body: bytes) -> None:
+        self._entries[key] = (time.monotonic() + self.ttl_seconds, etag, body)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    async def respond(self, request: Request, owner: Owner, compute: Callable[[], Awaitable[Any]]) -> Response:
+        """Serve ``compute()``'s JSON from cache, or 304 when the client already has it."""
+        key = (
+            request.url.path,
+            tuple(sorted(request.query_params.multi_items())),
+            owner,
+            data_versions.get(owner),
+            datetime.utcnow().date(),
+        )
+        cached = self.get(key)
+        if cached is None:
+            body = JSONResponse(content=jsonable_encoder(await compute())).body
+            cached = (f'"{hashlib.sha256(body).hexdigest()[:32]}"', body)
+            self.put(key, *cached)
+
+        etag, body = cached
+        headers = {"etag": etag, "cache-control": "private, no-cache"}
+        if etag_matches(request, etag):
+            return Response(status_code=304, headers=headers)
+        return Response(content=body, media_type="application/json", headers=headers)
+
+
+data_versions = DataVersions()
+dashboard_cache = ResponseCache(settings.response_cache_size, settings.response_cache_ttl_seconds)
@@ -0,0 +1,121 @@
+"""
+In-memory availability sets over retailer inventory.
+
+``retailer_medicines`` rows are retailer-specific, so the same medicine is
+matched across shops by its normalized product name. For every name the
+index keeps the retailers that stock it and their lots, which lets a basket
+query intersect "who can supply each line" without touching the database.
+
+The index is a prefilter: callers re-read the chosen lots before answering,
+because customer orders change quantities far more often than the index is
+refreshed. ``RetailerMedicineManager`` pushes product edits in via
+``DatabaseManager.after_commit``; everything else converges when the index
+is rebuilt after ``settings.stock_index_ttl_seconds``.
+"""
+
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import date
+from decimal import Decimal
+from typing import Dict, Iterable, Optional, Set
+
+from ..config import settings
+from .autocomplete_index import normalize
+
+
+@dataclass
+class Lot:
+    retailer_medicine_id: int
+    retailer_id: int
+    key: str
+    quantity: int
+    price: Decimal
+    expiry_date: date
+
+    @classmethod
+    def of(cls, product) -> "Lot":
+        return cls(
+            product.retailer_medicine_id, product.retailer_id, normalize(product.name),
+            product.quantity, product.price, product.expiry_date,
+        )
+
+    def can_supply(self, quantity: int, today: date) -> bool:
+        return self.quantity >= quantity and self.expiry_date >= today
+
+
+@dataclass
+class AvailabilityIndex:
+    lots: Dict[int, Lot] = field(default_factory=dict)
+    by_key: Dict[str, Dict[int, Set[int]]] = field(default_factory=lambda: defaultdict(lambda: defaultdict(set)))
+    loaded_at: float = field(default_factory=time.monotonic)
+
+    def add(self, lot: Lot) -> None:
+        self.remove(lot.retailer_medicine_id)
+        if not lot.key:
+            return
+        self.lots[lot.retailer_medicine_id] = lot
+        self.by_key[lot.key][lot.retailer_id].add(lot.retailer_medicine_id)
+
+    def remove(self, product_id: int) -> None:
+        lot = self.lots.pop(product_id, None)
+        if lot is None:
+            return
+        retailers = self.by_key.get(lot.key)
+        if retailers is None:
+            return
+        ids = retailers.get(lot.retailer_id)
+        if ids is not None:
+            ids.discard(product_id)
+            if not ids:
+                del retailers[lot.retailer_id]
+        if not retailers:
+            del self.by_key[lot.key]
+
+    def suppliers(self, name: str, quantity: int, today: Optional[date] = None) -> Dict[int, Lot]:
+        """
+        Retailers holding an unexpired lot of ``name`` with at least
+        ``quantity`` units, mapped to their cheapest such lot.
+        """
+        today = today or date.today()
+        result: Dict[int, Lot] = {}
+        for retailer_id, product_ids in self.by_key.get(normalize(name), {}).items():
+            lots = [self.lots[pid] for pid in product_ids if self.lots[pid].can_supply(quantity, today)]
+            if lots:
+                result[retailer_id] = min(lots, key=lambda lot: (lot.price, lot.expiry_date))
+        return result
+
+
+class StockAvailability:
+    """Process-wide holder of the retailer ``AvailabilityIndex``."""
+
+    def __init__(self, ttl_seconds: float):
+        self.ttl_seconds = ttl_seconds
+        self._index: Optional[AvailabilityIndex] = None
+
+    def get(self) -> Optional[AvailabilityIndex]:
+        if self._index is not None and time.monotonic() - self._index.loaded_at > self.ttl_seconds:
+            self._index = None
+        return self._index
+
+    def load(self, products: Iterable) -> AvailabilityIndex:
+        index = AvailabilityIndex()
+        for p in products:
+            index.add(Lot.of(p))
+        self._index = index
+        return index
+
+    # Incremental updates are skipped until the index has been loaded.
+    def upsert(self, lot: Lot) -> None:
+        if self._index is not None:
+            self._index.add(lot)
+
+    def remove(self, product_id: int) -> None:
+        if self._index is not None:
+            self._index.remove(product_id)
+
+    def clear(self) -> None:
+        self._index = None
+
+
+stock_availability = StockAvailability(settings.stock_index_ttl_seconds)